@@ -3,57 +3,167 @@
 Simple Flask dashboard for visualizing detection results
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, render_template, jsonify, request, send_from_directory, make_response, Response
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+from functools import wraps
 import pandas as pd
 import sqlite3
 import os
+import threading
+import time
+import uuid
+import gzip
+import brotli
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 import yaml 
+import orjson
 from src.logging.alert_logger import AlertLogger
 from src.data_quality.analyzer import DataQualityAnalyzer
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson
+    
+    numpy values coming out of pandas serialize natively and NaN becomes null.
+    Anything else orjson can't handle goes through Flask's default hook.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys'):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compress API and page responses on the wire. Export downloads are served
+# with their own mimetypes and are left as-is (xlsx/gz are already compressed
+# and Range requests need the raw bytes).
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_BR_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
 
 def get_db_connection():
     conn = sqlite3.connect('data/livestock.db')
     conn.row_factory = sqlite3.Row
     return conn
 
+# Failure bodies are just {'success': False, 'error': ...}; anything larger
+# is data and isn't parsed a second time just to look for the flag
+FAILURE_BODY_MAX_BYTES = 4096
+
+def reports_failure(response):
+    """Check whether a small JSON response body reports success: false"""
+    if not response.is_json or (response.content_length or 0) > FAILURE_BODY_MAX_BYTES:
+        return False
+    data = response.get_json(silent=True)
+    return isinstance(data, dict) and data.get('success') is False
+
+def cacheable(max_age, private=True):
+    """Tag responses with a content ETag and answer matching If-None-Match with 304"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200 or reports_failure(response):
+                # Errors must not be cached or revalidated as if they were data
+                return response
+            response.add_etag()
+            response.cache_control.max_age = max_age
+            if private:
+                response.cache_control.private = True
+            else:
+                response.cache_control.public = True
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+# The page is static, so gzip and brotli copies are written next to the
+# template once at startup and served as-is instead of rendering it per request
+INDEX_TEMPLATE_PATH = 'templates/index.html'
+INDEX_STATIC_DIR = 'static'
+INDEX_PRECOMPRESSED = (
+    ('br', 'index.html.br', lambda data: brotli.compress(data, quality=11)),
+    ('gzip', 'index.html.gz', lambda data: gzip.compress(data, compresslevel=9))
+)
+INDEX_MAX_AGE = 300
+
+def precompress_index(html):
+    """Write the pre-compressed copies of the dashboard page"""
+    os.makedirs(INDEX_STATIC_DIR, exist_ok=True)
+    data = html.encode('utf-8')
+    
+    for _, filename, compress in INDEX_PRECOMPRESSED:
+        with open(os.path.join(INDEX_STATIC_DIR, filename), 'wb') as f:
+            f.write(compress(data))
+
+def _is_fresh_copy(path):
+    """True if `path` exists and is at least as new as the template"""
+    try:
+        return os.path.getmtime(path) >= os.path.getmtime(INDEX_TEMPLATE_PATH)
+    except OSError:
+        return False
+
 @app.route('/')
 def index():
+    for encoding, filename, _ in INDEX_PRECOMPRESSED:
+        path = os.path.join(INDEX_STATIC_DIR, filename)
+        if request.accept_encodings[encoding] and _is_fresh_copy(path):
+            response = send_from_directory(
+                os.path.abspath(INDEX_STATIC_DIR),
+                filename,
+                mimetype='text/html',
+                conditional=True,
+                max_age=INDEX_MAX_AGE
+            )
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            return response
+    
     return render_template('index.html')
 
-@app.route('/api/health_metrics')
-def get_health_metrics():
-    conn = get_db_connection()
-    
-    # Get latest metrics
+# Page size limits for the list endpoints
+HEALTH_METRICS_PAGE_SIZE = 20
+HEALTH_METRICS_MAX_PAGE_SIZE = 1000
+TIMELINE_DAYS = 10
+TIMELINE_MAX_DAYS = 30  # the timeline only covers the last 30 days
+
+def fetch_health_metrics(conn, limit=HEALTH_METRICS_PAGE_SIZE, offset=0):
+    """Get latest health metrics, one page at a time"""
     query = """
     SELECT tag_id, date, temperature, heart_rate, activity_level, 
            is_anomaly, anomaly_score
     FROM health_metrics 
     WHERE date >= date('now', '-30 days')
     ORDER BY date DESC
-    LIMIT 1000
+    LIMIT ? OFFSET ?
     """
     
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    df = pd.read_sql_query(query, conn, params=(limit, offset))
     
     # Convert to list of records
     records = df.to_dict('records')
     
-    return jsonify({
+    return {
         'success': True,
         'count': len(records),
         'data': records
-    })
+    }
 
-@app.route('/api/alerts')
-def get_alerts():
-    conn = get_db_connection()
-    
+def fetch_alerts(conn):
+    """Get unresolved outbreak alerts"""
     query = """
     SELECT * FROM outbreak_alerts 
     WHERE is_resolved = 0
@@ -62,22 +172,18 @@ def get_alerts():
     """
     
     alerts = conn.execute(query).fetchall()
-    conn.close()
     
     # Convert to dict
     alerts_list = [dict(alert) for alert in alerts]
     
-    return jsonify({
+    return {
         'success': True,
         'count': len(alerts_list),
         'alerts': alerts_list
-    })
+    }
 
-@app.route('/api/summary')
-def get_summary():
-    conn = get_db_connection()
-    
-    # Get summary statistics
+def fetch_summary(conn):
+    """Get summary statistics"""
     summary_query = """
     SELECT 
         COUNT(DISTINCT tag_id) as total_animals,
@@ -101,61 +207,365 @@ def get_summary():
     
     alerts_summary = conn.execute(alerts_query).fetchone()
     
-    conn.close()
-    
-    return jsonify({
+    return {
         'success': True,
         'summary': dict(summary),
         'alerts': dict(alerts_summary)
-    })
+    }
+
+def fetch_anomaly_timeline(conn, limit=TIMELINE_DAYS):
+    """Get daily anomaly counts for the most recent days, oldest first"""
+    query = """
+    SELECT * FROM (
+        SELECT 
+            date(date) as day,
+            COUNT(*) as total_records,
+            SUM(CASE WHEN is_anomaly = 1 THEN 1 ELSE 0 END) as anomalies,
+            AVG(anomaly_score) as avg_score
+        FROM health_metrics
+        WHERE date >= date('now', '-30 days')
+        GROUP BY date(date)
+        ORDER BY day DESC
+        LIMIT ?
+    )
+    ORDER BY day
+    """
+    
+    df = pd.read_sql_query(query, conn, params=(limit,))
+    
+    timeline = df.to_dict('records')
+    
+    return {
+        'success': True,
+        'timeline': timeline
+    }
+
+# Sections served together by /api/dashboard
+DASHBOARD_SECTIONS = {
+    'summary': fetch_summary,
+    'alerts': fetch_alerts,
+    'timeline': fetch_anomaly_timeline,
+    'metrics': fetch_health_metrics
+}
+
+@app.route('/api/health_metrics')
+def get_health_metrics():
+    limit = request.args.get('limit', HEALTH_METRICS_PAGE_SIZE, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    limit = max(0, min(limit, HEALTH_METRICS_MAX_PAGE_SIZE))
+    offset = max(0, offset)
+    
+    conn = get_db_connection()
+    data = fetch_health_metrics(conn, limit=limit, offset=offset)
+    conn.close()
+    
+    return jsonify(data)
+
+@app.route('/api/alerts')
+@cacheable(max_age=15)
+def get_alerts():
+    conn = get_db_connection()
+    data = fetch_alerts(conn)
+    conn.close()
+    
+    return jsonify(data)
+
+@app.route('/api/summary')
+@cacheable(max_age=15)
+def get_summary():
+    conn = get_db_connection()
+    data = fetch_summary(conn)
+    conn.close()
+    
+    return jsonify(data)
 
 @app.route('/api/anomaly_timeline')
+@cacheable(max_age=15)
 def get_anomaly_timeline():
+    limit = request.args.get('limit', TIMELINE_DAYS, type=int)
+    limit = max(0, min(limit, TIMELINE_MAX_DAYS))
+    
     conn = get_db_connection()
+    data = fetch_anomaly_timeline(conn, limit=limit)
+    conn.close()
     
-    query = """
-    SELECT 
-        date(date) as day,
-        COUNT(*) as total_records,
-        SUM(CASE WHEN is_anomaly = 1 THEN 1 ELSE 0 END) as anomalies,
-        AVG(anomaly_score) as avg_score
-    FROM health_metrics
-    WHERE date >= date('now', '-30 days')
-    GROUP BY date(date)
-    ORDER BY day
-    """
+    return jsonify(data)
+
+@app.route('/api/dashboard')
+@cacheable(max_age=15)
+def get_dashboard():
+    """Get several dashboard sections in a single response"""
+    include = request.args.get('include', '')
+    sections = [name.strip() for name in include.split(',') if name.strip()]
+    
+    if not sections:
+        sections = list(DASHBOARD_SECTIONS)
+    
+    unknown = [name for name in sections if name not in DASHBOARD_SECTIONS]
+    if unknown:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown sections: {", ".join(unknown)}. '
+                     f'Use any of: {", ".join(DASHBOARD_SECTIONS)}'
+        })
+    
+    conn = get_db_connection()
+    response = {'success': True}
+    
+    for name in sections:
+        response[name] = DASHBOARD_SECTIONS[name](conn)
     
-    df = pd.read_sql_query(query, conn)
     conn.close()
     
-    timeline = df.to_dict('records')
+    return jsonify(response)
+
+def fetch_or_error(fetch, *args):
+    """Run a section fetcher, reporting a failure the way its own route would"""
+    try:
+        return fetch(*args)
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+@app.route('/api/dashboard/bootstrap')
+def get_dashboard_bootstrap():
+    """Get everything the page renders on first load in a single response
+    
+    The quality score is not included: it runs a full quality analysis and
+    would hold up the whole first paint, so the page still requests it on
+    its own. Alert stats are left for the page to load when the stats panel
+    scrolls into view.
+    """
+    conn = get_db_connection()
+    data = {'success': True}
+    
+    for name, fetch in DASHBOARD_SECTIONS.items():
+        data[name] = fetch_or_error(fetch, conn)
+    
+    conn.close()
     
     return jsonify({
         'success': True,
-        'timeline': timeline
+        'data': data,
+        'exports': fetch_or_error(fetch_exports, 7),
+        'logs': {
+            'alerts': fetch_or_error(fetch_alert_logs, 7)
+        }
     })
 
+# Cheap per-table fingerprints and the dashboard sections built from each
+# table. /api/stream re-sends a section only when one of its sources changes.
+# date('now') is included because the 30-day windows move at midnight.
+STREAM_FINGERPRINTS = {
+    'health_metrics': "SELECT COUNT(*), MAX(rowid), date('now') FROM health_metrics",
+    'outbreak_alerts': "SELECT COUNT(*), MAX(rowid), SUM(is_resolved), date('now') FROM outbreak_alerts"
+}
+STREAM_TABLE_SECTIONS = {
+    'health_metrics': ('summary', 'timeline', 'metrics'),
+    'outbreak_alerts': ('summary', 'alerts'),
+    'alert_logs': ('alert_logs',)
+}
+STREAM_CHECK_INTERVAL = 10  # seconds between fingerprint checks
+STREAM_KEEPALIVE = 30  # seconds between comment pings on an idle stream
+
+def alert_log_fingerprint():
+    """Count, newest modification time and total size of the alert detail files
+    
+    Only the details_*.json files the log panel reads are included, so export
+    files written to the same directory don't count as new alerts.
+    """
+    count = newest = total_size = 0
+    
+    with os.scandir(AlertLogger().log_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('details_') and entry.is_file():
+                stat = entry.stat()
+                count += 1
+                newest = max(newest, stat.st_mtime_ns)
+                total_size += stat.st_size
+    
+    return (count, newest, total_size, datetime.now().date().isoformat())
+
+class DashboardChangeNotifier:
+    """Track changes to the dashboard data and wake /api/stream clients
+    
+    The pipeline writes the database and the alert logs from its own process,
+    so a single background thread checks a fingerprint of each source and
+    bumps that source's version when it changes. Code in this process can
+    call notify() directly.
+    """
+    
+    def __init__(self, interval=STREAM_CHECK_INTERVAL):
+        self.interval = interval
+        self.condition = threading.Condition()
+        self.versions = dict.fromkeys(STREAM_TABLE_SECTIONS, 0)
+        self._fingerprints = {}
+        self._thread = None
+    
+    def start(self):
+        """Start the watcher thread on first use"""
+        with self.condition:
+            if self._thread is not None:
+                return
+            self._fingerprints = self._read_fingerprints()
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+    
+    def notify(self, *sources):
+        """Mark sources (default: all) as changed and wake waiting streams"""
+        with self.condition:
+            for source in sources or list(self.versions):
+                self.versions[source] += 1
+            self.condition.notify_all()
+    
+    def snapshot(self):
+        with self.condition:
+            return dict(self.versions)
+    
+    def wait_for_change(self, seen, timeout):
+        """Block until versions differ from `seen` or timeout, return current versions"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.versions != seen, timeout)
+            return dict(self.versions)
+    
+    def _read_fingerprints(self):
+        """Fingerprint every source that can be read right now"""
+        fingerprints = {}
+        
+        try:
+            conn = get_db_connection()
+            try:
+                for table, query in STREAM_FINGERPRINTS.items():
+                    fingerprints[table] = tuple(conn.execute(query).fetchone())
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        
+        try:
+            fingerprints['alert_logs'] = alert_log_fingerprint()
+        except OSError:
+            pass
+        
+        return fingerprints
+    
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            fingerprints = self._read_fingerprints()
+            
+            changed = [source for source, fingerprint in fingerprints.items()
+                       if fingerprint != self._fingerprints.get(source)]
+            self._fingerprints.update(fingerprints)
+            if changed:
+                self.notify(*changed)
+
+dashboard_notifier = DashboardChangeNotifier()
+
+def fetch_stream_section(name, conn):
+    """Build the payload for one /api/stream event"""
+    if name == 'alert_logs':
+        return fetch_or_error(fetch_alert_stats, 7)
+    
+    return DASHBOARD_SECTIONS[name](conn)
+
+@app.route('/api/stream')
+def stream_dashboard():
+    """Push dashboard sections as Server-Sent Events when their data changes"""
+    dashboard_notifier.start()
+    
+    def event_stream(seen):
+        while True:
+            current = dashboard_notifier.wait_for_change(seen, STREAM_KEEPALIVE)
+            if current == seen:
+                yield ': keep-alive\n\n'
+                continue
+            
+            sections = []
+            for source, source_sections in STREAM_TABLE_SECTIONS.items():
+                if current[source] != seen[source]:
+                    sections.extend(name for name in source_sections if name not in sections)
+            seen = current
+            
+            conn = get_db_connection()
+            try:
+                payloads = [(name, fetch_stream_section(name, conn)) for name in sections]
+            finally:
+                conn.close()
+            
+            for name, payload in payloads:
+                yield f"event: {name}\ndata: {app.json.dumps(payload)}\n\n"
+    
+    return Response(event_stream(dashboard_notifier.snapshot()),
+                    mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 # Data Quality Routes
-@app.route('/api/quality/analyze')
-def analyze_data_quality():
-    """Analyze data quality"""
+
+# Quality analyses run on a small worker pool. POST /api/quality/analyze
+# returns a task id straight away and the page polls /api/quality/status.
+QUALITY_TASK_WORKERS = 2
+QUALITY_TASK_TTL = 3600  # seconds a finished task is kept for polling
+quality_executor = ThreadPoolExecutor(max_workers=QUALITY_TASK_WORKERS,
+                                      thread_name_prefix='quality-analysis')
+quality_tasks = {}
+quality_tasks_lock = threading.Lock()
+
+def run_quality_analysis(days):
+    """Analyze the last `days` days of health metrics"""
+    conn = get_db_connection()
     try:
-        days = request.args.get('days', 30, type=int)
-        
-        conn = get_db_connection()
-        
-        # Get data for analysis
-        query = f"""
+        query = """
         SELECT * FROM health_metrics 
-        WHERE date >= date('now', '-{days} days')
+        WHERE date >= date('now', ?)
         """
-        
-        df = pd.read_sql_query(query, conn)
+        df = pd.read_sql_query(query, conn, params=(f'-{days} days',))
+    finally:
         conn.close()
+    
+    analyzer = DataQualityAnalyzer()
+    return analyzer.analyze_dataframe(df)
+
+def submit_quality_analysis(days):
+    """Queue an analysis and return its task id"""
+    now = time.time()
+    task_id = uuid.uuid4().hex
+    
+    with quality_tasks_lock:
+        expired = [tid for tid, task in quality_tasks.items()
+                   if task['future'].done() and now - task['submitted'] > QUALITY_TASK_TTL]
+        for tid in expired:
+            del quality_tasks[tid]
+        
+        quality_tasks[task_id] = {
+            'future': quality_executor.submit(run_quality_analysis, days),
+            'submitted': now,
+            'days': days
+        }
+    
+    return task_id
+
+@app.route('/api/quality/analyze', methods=['GET', 'POST'])
+def analyze_data_quality():
+    """Analyze data quality
+    
+    GET runs the analysis in the request. POST queues it and returns a
+    task id to poll at /api/quality/status/<task_id>.
+    """
+    try:
+        days = request.args.get('days', 30, type=int)
         
-        # Analyze data quality
-        analyzer = DataQualityAnalyzer()
-        analysis = analyzer.analyze_dataframe(df)
+        if request.method == 'POST':
+            task_id = submit_quality_analysis(days)
+            return jsonify({
+                'success': True,
+                'task_id': task_id,
+                'status_url': f'/api/quality/status/{task_id}'
+            })
+        
+        analysis = run_quality_analysis(days)
         
         return jsonify({
             'success': True,
@@ -168,6 +578,48 @@ def analyze_data_quality():
             'error': str(e)
         })
 
+@app.route('/api/quality/status/<task_id>')
+def get_quality_status(task_id):
+    """Get the state of a queued quality analysis, with the result once done"""
+    with quality_tasks_lock:
+        task = quality_tasks.get(task_id)
+    
+    if task is None:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown task: {task_id}'
+        })
+    
+    future = task['future']
+    response = {
+        'task_id': task_id,
+        'done': future.done(),
+        'elapsed': round(time.time() - task['submitted'], 1)
+    }
+    
+    if not future.done():
+        return jsonify({
+            'success': True,
+            'status': 'running' if future.running() else 'queued',
+            **response
+        })
+    
+    try:
+        return jsonify({
+            'success': True,
+            'status': 'complete',
+            'analysis': future.result(),
+            **response
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'status': 'failed',
+            'error': str(e),
+            **response
+        })
+
 @app.route('/api/quality/report')
 def get_quality_report():
     """Get data quality report"""
@@ -272,6 +724,7 @@ def get_quality_issues():
         })
 
 @app.route('/api/quality/score')
+@cacheable(max_age=60, private=False)
 def get_quality_score():
     """Get overall data quality score"""
     try:
@@ -317,6 +770,45 @@ def get_quality_score():
         })
 
 # Export Routes
+
+EXPORT_DIR = './outputs/exports'
+
+# The recent exports listing is cached briefly per `days` and dropped
+# whenever this app writes or deletes exports
+EXPORTS_LIST_TTL = 5  # seconds
+_exports_cache = {}
+_exports_cache_generation = 0
+_exports_cache_lock = threading.Lock()
+
+def get_recent_exports(days):
+    """List exports from the last `days` days, reusing a fresh cached listing"""
+    now = time.time()
+    with _exports_cache_lock:
+        cached = _exports_cache.get(days)
+        if cached and now - cached[0] < EXPORTS_LIST_TTL:
+            return cached[1]
+        generation = _exports_cache_generation
+    
+    from src.export.exporter import DataExporter
+    exporter = DataExporter()
+    
+    exports = exporter.list_exports(days=days)
+    
+    with _exports_cache_lock:
+        # Skip storing a listing that an export made stale while we scanned
+        if generation == _exports_cache_generation:
+            _exports_cache[days] = (now, exports)
+    
+    return exports
+
+def invalidate_exports_cache():
+    """Drop cached export listings after export files change"""
+    global _exports_cache_generation
+    
+    with _exports_cache_lock:
+        _exports_cache.clear()
+        _exports_cache_generation += 1
+
 @app.route('/api/export/anomalies')
 def export_anomalies():
     """Export anomaly data"""
@@ -344,6 +836,7 @@ def export_anomalies():
         exporter = DataExporter()
         
         exported_files = exporter.export_anomalies(df)
+        invalidate_exports_cache()
         
         return jsonify({
             'success': True,
@@ -383,6 +876,7 @@ def export_alerts():
         exporter = DataExporter()
         
         exported_files = exporter.export_alerts(df)
+        invalidate_exports_cache()
         
         return jsonify({
             'success': True,
@@ -425,6 +919,7 @@ def export_health_metrics():
         exporter = DataExporter()
         
         exported_files = exporter.export_health_metrics(df, f'last_{days}_days')
+        invalidate_exports_cache()
         
         return jsonify({
             'success': True,
@@ -480,6 +975,7 @@ def export_summary_report():
             alerts, 
             output_format=format_type
         )
+        invalidate_exports_cache()
         
         return jsonify({
             'success': True,
@@ -493,22 +989,23 @@ def export_summary_report():
             'error': str(e)
         })
 
+def fetch_exports(days=7):
+    """Get export files from the last `days` days"""
+    exports = get_recent_exports(days)
+    
+    return {
+        'success': True,
+        'count': len(exports),
+        'exports': exports
+    }
+
 @app.route('/api/exports/list')
 def list_exports():
     """List available export files"""
     try:
         days = request.args.get('days', 7, type=int)
         
-        from src.export.exporter import DataExporter
-        exporter = DataExporter()
-        
-        exports = exporter.list_exports(days=days)
-        
-        return jsonify({
-            'success': True,
-            'count': len(exports),
-            'exports': exports
-        })
+        return jsonify(fetch_exports(days))
         
     except Exception as e:
         return jsonify({
@@ -526,6 +1023,7 @@ def cleanup_exports():
         exporter = DataExporter()
         
         deleted_count = exporter.cleanup_old_exports(days_to_keep)
+        invalidate_exports_cache()
         
         return jsonify({
             'success': True,
@@ -541,54 +1039,69 @@ def cleanup_exports():
 @app.route('/api/exports/download/<filename>')
 def download_export(filename):
     """Download an exported file"""
-    try:
-        # Security check: prevent directory traversal
-        if '..' in filename or filename.startswith('/'):
-            return "Invalid filename", 400
-        
-        export_dir = './outputs/exports'
-        filepath = os.path.join(export_dir, filename)
-        
-        if not os.path.exists(filepath):
-            return "File not found", 404
-        
-        # Determine content type
-        ext = os.path.splitext(filename)[1].lower()
-        content_types = {
-            '.csv': 'text/csv',
-            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            '.json': 'application/json',
-            '.txt': 'text/plain',
-            '.md': 'text/markdown'
-        }
-        
-        content_type = content_types.get(ext, 'application/octet-stream')
+    # send_from_directory rejects traversal, returns 404 for missing files and
+    # supports conditional GET and Range requests for resumable downloads
+    return send_from_directory(
+        os.path.abspath(EXPORT_DIR),
+        filename,
+        as_attachment=True,
+        conditional=True
+    )
+
+# Alert Log Routes
+def fetch_alert_logs(days=7):
+    """Get alert log entries from the last `days` days"""
+    logger = AlertLogger()
+    alerts = logger.get_recent_alerts(days)
+    
+    return {
+        'success': True,
+        'count': len(alerts),
+        'alerts': alerts
+    }
+
+def fetch_alert_stats(days=7):
+    """Get alert log statistics for the last `days` days"""
+    logger = AlertLogger()
+    stats = logger.get_alert_stats(days)
+    
+    return {
+        'success': True,
+        'stats': stats
+    }
+
+# Alert log exports are written next to the data exports so the download
+# route can serve them, and reused until the alert logs change
+_log_exports = {}
+_log_exports_lock = threading.Lock()
+
+def get_alert_log_export(days, format_type):
+    """Path of an up-to-date alert log export, writing one only if needed"""
+    fingerprint = alert_log_fingerprint()
+    
+    # Held while exporting so simultaneous clicks share one export
+    with _log_exports_lock:
+        cached = _log_exports.get((days, format_type))
+        if cached and cached[0] == fingerprint and os.path.exists(cached[1]):
+            return cached[1]
         
-        return send_file(
-            filepath,
-            as_attachment=True,
-            download_name=filename,
-            mimetype=content_type
-        )
+        logger = AlertLogger()
+        filepath = logger.export_alerts(days, format_type, output_dir=EXPORT_DIR)
         
-    except Exception as e:
-        return str(e), 500
+        if filepath and os.path.exists(filepath):
+            _log_exports[(days, format_type)] = (fingerprint, filepath)
+            invalidate_exports_cache()
+            return filepath
+    
+    return None
 
-# Alert Log Routes
 @app.route('/api/logs/alerts')
 def get_alert_logs():
     """Get recent alert logs"""
     try:
         days = request.args.get('days', 7, type=int)
         
-        logger = AlertLogger()
-        alerts = logger.get_recent_alerts(days)
-        
-        return jsonify({
-            'success': True,
-            'count': len(alerts),
-            'alerts': alerts
-        })
+        return jsonify(fetch_alert_logs(days))
         
     except Exception as e:
         return jsonify({
@@ -596,6 +1109,96 @@ def get_alert_logs():
             'error': str(e)
         })
 
+# Searches arriving within SEARCH_BATCH_MAX_WAIT of each other are answered
+# together: each distinct query runs once, and all queries over the same
+# number of days share a single read of the alert logs.
+SEARCH_BATCH_MAX_WAIT = 0.05  # seconds
+SEARCH_BATCH_MAX_SIZE = 32
+SEARCH_BATCH_TIMEOUT = 30  # seconds a request waits for its batch
+
+class SearchBatcher:
+    """Coalesce concurrent alert log searches into one log read per `days`"""
+    
+    def __init__(self, max_wait=SEARCH_BATCH_MAX_WAIT, max_size=SEARCH_BATCH_MAX_SIZE,
+                 timeout=SEARCH_BATCH_TIMEOUT):
+        self.max_wait = max_wait
+        self.max_size = max_size
+        self.timeout = timeout
+        self.condition = threading.Condition()
+        self.pending = {}  # (keyword, severity, farm_id, days) -> [Future, ...]
+        self.pending_count = 0
+        self._thread = None
+    
+    def search(self, keyword, severity, farm_id, days):
+        """Queue a search and block until its batch has been run"""
+        future = Future()
+        # AlertLogger matching is case-insensitive, so differently-cased
+        # searches are the same query
+        key = (keyword.lower(), severity.lower(), farm_id.lower(), days)
+        
+        with self.condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name='log-search-batcher')
+                self._thread.start()
+            self.pending.setdefault(key, []).append(future)
+            self.pending_count += 1
+            self.condition.notify()
+        
+        return future.result(timeout=self.timeout)
+    
+    def _run(self):
+        try:
+            while True:
+                with self.condition:
+                    self.condition.wait_for(lambda: self.pending)
+                    # Hold the batch open until it is full or max_wait has passed
+                    self.condition.wait_for(lambda: self.pending_count >= self.max_size,
+                                            self.max_wait)
+                    batch, self.pending, self.pending_count = self.pending, {}, 0
+                
+                try:
+                    self._flush(batch)
+                except Exception as e:
+                    # Fail whatever the flush didn't answer rather than leave callers waiting
+                    for futures in batch.values():
+                        for future in futures:
+                            if not future.done():
+                                future.set_exception(e)
+        finally:
+            # Let the next search start a fresh thread if this one ever exits
+            with self.condition:
+                self._thread = None
+    
+    def _flush(self, batch):
+        logger = AlertLogger()
+        keys_by_days = {}
+        for key in batch:
+            keys_by_days.setdefault(key[3], []).append(key)
+        
+        for days, keys in keys_by_days.items():
+            try:
+                alerts = logger.get_recent_alerts(days)
+            except Exception as e:
+                for key in keys:
+                    for future in batch[key]:
+                        future.set_exception(e)
+                continue
+            
+            for key in keys:
+                keyword, severity, farm_id, _ = key
+                try:
+                    results = AlertLogger.filter_alerts(alerts, keyword, severity, farm_id)
+                except Exception as e:
+                    for future in batch[key]:
+                        future.set_exception(e)
+                    continue
+                
+                for future in batch[key]:
+                    future.set_result(results)
+
+search_batcher = SearchBatcher()
+
 @app.route('/api/logs/search')
 def search_alert_logs():
     """Search alert logs"""
@@ -605,8 +1208,7 @@ def search_alert_logs():
         farm_id = request.args.get('farm_id', '')
         days = request.args.get('days', 30, type=int)
         
-        logger = AlertLogger()
-        results = logger.search_alerts(keyword, severity, farm_id, days)
+        results = search_batcher.search(keyword, severity, farm_id, days)
         
         return jsonify({
             'success': True,
@@ -621,18 +1223,13 @@ def search_alert_logs():
         })
 
 @app.route('/api/logs/stats')
+@cacheable(max_age=0, private=False)  # revalidate every time: new alerts are pushed live
 def get_alert_stats():
     """Get alert statistics"""
     try:
         days = request.args.get('days', 7, type=int)
         
-        logger = AlertLogger()
-        stats = logger.get_alert_stats(days)
-        
-        return jsonify({
-            'success': True,
-            'stats': stats
-        })
+        return jsonify(fetch_alert_stats(days))
         
     except Exception as e:
         return jsonify({
@@ -653,10 +1250,9 @@ def export_alert_logs():
                 'error': 'Invalid format. Use "csv" or "json"'
             })
         
-        logger = AlertLogger()
-        filepath = logger.export_alerts(days, format_type)
+        filepath = get_alert_log_export(days, format_type)
         
-        if filepath and os.path.exists(filepath):
+        if filepath:
             filename = os.path.basename(filepath)
             return jsonify({
                 'success': True,
@@ -702,6 +1298,7 @@ def cleanup_logs():
         
         logger = AlertLogger()
         deleted = logger.cleanup_old_logs(days_to_keep)
+        dashboard_notifier.notify('alert_logs')
         
         return jsonify({
             'success': True,
@@ -714,6 +1311,10 @@ def cleanup_logs():
             'error': str(e)
         })
 
+# gunicorn threads for `python dashboard.py`; every open dashboard tab
+# holds one through /api/stream (override with DASHBOARD_THREADS)
+DASHBOARD_THREADS = 128
+
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
     os.makedirs('templates', exist_ok=True)
@@ -730,9 +1331,26 @@ if __name__ == '__main__':
             .card { border: 1px solid #ddd; padding: 15px; border-radius: 5px; }
             .critical { color: #dc3545; font-weight: bold; }
             .warning { color: #ffc107; font-weight: bold; }
-            table { width: 100%; border-collapse: collapse; }
-            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-            th { background-color: #f2f2f2; }
+            
+            /* Metrics list: every row is its own fixed-track grid, so rows lay
+               out independently instead of sizing columns across the list */
+            .metric-row {
+                display: grid;
+                grid-template-columns: repeat(6, minmax(0, 1fr));
+                border: 1px solid #ddd;
+                border-top: none;
+            }
+            .metric-row > span {
+                padding: 8px;
+                overflow: hidden;
+                text-overflow: ellipsis;
+                white-space: nowrap;
+            }
+            .metric-header {
+                background-color: #f2f2f2;
+                font-weight: bold;
+                border-top: 1px solid #ddd;
+            }
             
             /* Export buttons */
             .export-btn {
@@ -863,6 +1481,21 @@ if __name__ == '__main__':
                 border-radius: 3px;
             }
             
+            /* Virtualized log list: fixed two-line rows so one row height fits all */
+            .log-window {
+                display: flex;
+                flex-direction: column;
+                position: absolute;
+                left: 0;
+                right: 0;
+            }
+            
+            .log-window .log-entry {
+                white-space: nowrap;
+                overflow: hidden;
+                text-overflow: ellipsis;
+            }
+            
             .log-critical { border-left-color: #dc3545; }
             .log-high { border-left-color: #fd7e14; }
             .log-medium { border-left-color: #ffc107; }
@@ -879,6 +1512,14 @@ if __name__ == '__main__':
                 min-width: 100px;
                 text-align: center;
             }
+            
+            /* Status banner states, switched with a single class change */
+            .status { margin-top: 10px; padding: 10px; }
+            .status-hidden { display: none; }
+            .status-pending { background-color: #e7f3fe; }
+            .status-ok { background-color: #d4edda; }
+            .status-warn { background-color: #fff3cd; }
+            .status-err { background-color: #f8d7da; }
         </style>
     </head>
     <body>
@@ -904,20 +1545,18 @@ if __name__ == '__main__':
         
         <div class="card" style="grid-column: span 3; margin-top: 20px;">
             <h3>Recent Health Metrics</h3>
-            <table id="metricsTable">
-                <thead>
-                    <tr>
-                        <th>Animal ID</th>
-                        <th>Date</th>
-                        <th>Temperature</th>
-                        <th>Heart Rate</th>
-                        <th>Activity</th>
-                        <th>Anomaly Score</th>
-                    </tr>
-                </thead>
-                <tbody id="metricsBody">
-                </tbody>
-            </table>
+            <div id="metricsTable">
+                <div class="metric-row metric-header">
+                    <span>Animal ID</span>
+                    <span>Date</span>
+                    <span>Temperature</span>
+                    <span>Heart Rate</span>
+                    <span>Activity</span>
+                    <span>Anomaly Score</span>
+                </div>
+                <div id="metricsBody">
+                </div>
+            </div>
         </div>
         
         <!-- Data Export Section -->
@@ -1021,89 +1660,314 @@ if __name__ == '__main__':
                 <!-- Stats will appear here -->
             </div>
             
-            <div id="alertLogs" style="max-height: 300px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; border-radius: 5px;">
+            <div id="alertLogs" style="position: relative; max-height: 300px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; border-radius: 5px;">
                 <p>Click "Refresh Logs" to load alert history</p>
             </div>
             
-            <div id="logStatus" style="margin-top: 10px; padding: 10px; display: none;"></div>
+            <div id="logStatus" class="status status-hidden"></div>
         </div>
         
         <script>
-            // Main dashboard functions
-            async function loadData() {
-                try {
-                    // Load summary
-                    const summaryRes = await fetch('/api/summary');
-                    const summaryData = await summaryRes.json();
-                    
-                    if (summaryData.success) {
-                        const s = summaryData.summary;
-                        document.getElementById('summary').innerHTML = `
-                            <p>Animals Monitored: ${s.total_animals}</p>
-                            <p>Farms: ${s.farms_monitored}</p>
-                            <p>Anomalies Detected: ${s.anomaly_count}</p>
-                            <p>Active Alerts: ${summaryData.alerts.active_alerts}</p>
-                            <p class="${summaryData.alerts.critical_alerts > 0 ? 'critical' : ''}">
-                                Critical Alerts: ${summaryData.alerts.critical_alerts}
-                            </p>
-                        `;
-                    }
-                    
-                    // Load alerts
-                    const alertsRes = await fetch('/api/alerts');
-                    const alertsData = await alertsRes.json();
-                    
-                    if (alertsData.success) {
-                        const alertsHtml = alertsData.alerts.map(alert => `
-                            <div class="${alert.severity}">
-                                ${alert.severity.toUpperCase()}: ${alert.description}
-                                <br><small>${new Date(alert.created_at).toLocaleString()}</small>
-                            </div>
-                        `).join('');
-                        document.getElementById('alerts').innerHTML = alertsHtml || '<p>No active alerts</p>';
+            // DOM helpers
+            function createNode(tag, className, text) {
+                const node = document.createElement(tag);
+                if (className) node.className = className;
+                if (text !== undefined) node.textContent = text;
+                return node;
+            }
+            
+            // Shared formatters: building these once is much cheaper than the
+            // per-call locale lookup in toLocaleString()/toFixed()
+            const DATE_FORMAT = new Intl.DateTimeFormat(undefined, {dateStyle: 'short'});
+            const DATETIME_FORMAT = new Intl.DateTimeFormat(undefined, {dateStyle: 'short', timeStyle: 'medium'});
+            const NUMBER_FORMATS = [0, 1, 2].map(digits => new Intl.NumberFormat(undefined, {
+                minimumFractionDigits: digits,
+                maximumFractionDigits: digits,
+                useGrouping: false
+            }));
+            
+            function formatDate(value, format = DATE_FORMAT) {
+                const date = new Date(value);
+                return isNaN(date) ? 'Invalid Date' : format.format(date);
+            }
+            
+            function formatDateTime(value) {
+                return formatDate(value, DATETIME_FORMAT);
+            }
+            
+            function formatNumber(value, digits) {
+                return NUMBER_FORMATS[digits].format(value);
+            }
+            
+            // Build long lists one chunk per animation frame so the first rows
+            // paint straight away. A new render into the same container cancels
+            // any chunks still pending from the previous one.
+            const RENDER_CHUNK_SIZE = 100;
+            const pendingRenders = new WeakMap();
+            
+            function renderChunked(container, items, buildRow, chunkSize = RENDER_CHUNK_SIZE) {
+                cancelAnimationFrame(pendingRenders.get(container));
+                container.replaceChildren();
+                
+                let i = 0;
+                function step() {
+                    const frag = document.createDocumentFragment();
+                    const end = Math.min(i + chunkSize, items.length);
+                    for (; i < end; i++) {
+                        frag.appendChild(buildRow(items[i]));
                     }
+                    container.appendChild(frag);
                     
-                    // Load timeline
-                    const timelineRes = await fetch('/api/anomaly_timeline');
-                    const timelineData = await timelineRes.json();
-                    
-                    if (timelineData.success) {
-                        const timelineHtml = timelineData.timeline.slice(-10).map(day => `
-                            <div>
-                                ${new Date(day.day).toLocaleDateString()}: 
-                                ${day.anomalies} anomalies (avg score: ${parseFloat(day.avg_score).toFixed(2)})
-                            </div>
-                        `).join('');
-                        document.getElementById('timeline').innerHTML = timelineHtml;
+                    if (i < items.length) {
+                        pendingRenders.set(container, requestAnimationFrame(step));
+                    } else {
+                        pendingRenders.delete(container);
                     }
+                }
+                step();
+            }
+            
+            function buildMetricRow(metric) {
+                const row = createNode('div', metric.is_anomaly ? 'metric-row warning' : 'metric-row');
+                const cells = [
+                    metric.tag_id,
+                    formatDate(metric.date),
+                    `${formatNumber(metric.temperature, 1)}°C`,
+                    `${formatNumber(metric.heart_rate, 0)} BPM`,
+                    formatNumber(metric.activity_level, 2),
+                    formatNumber(metric.anomaly_score, 2)
+                ];
+                for (const text of cells) {
+                    row.appendChild(createNode('span', '', text));
+                }
+                return row;
+            }
+            
+            function buildExportItem(exp) {
+                const fileSize = exp.size_human || Math.round(exp.size / 1024) + ' KB';
+                const modified = formatDateTime(exp.modified);
+                
+                const info = document.createElement('div');
+                info.append(
+                    createNode('strong', '', exp.filename),
+                    document.createElement('br'),
+                    createNode('small', '', `Size: ${fileSize} | Modified: ${modified}`)
+                );
+                
+                const link = createNode('a', 'file-link', 'Download');
+                link.href = `/api/exports/download/${encodeURIComponent(exp.filename)}`;
+                
+                const item = createNode('div', 'export-item');
+                item.append(info, link);
+                return item;
+            }
+            
+            // Precompute the display strings for a log row once, not on every scroll
+            function toLogRow(alert) {
+                const severity = alert.severity || 'info';
+                const timestamp = alert.timestamp ? formatDateTime(alert.timestamp) : 'Unknown time';
+                const farm = alert.farm_id || 'Unknown farm';
+                const message = alert.message || 'No message';
+                
+                return {
+                    className: `log-entry log-${severity}`,
+                    title: `[${severity.toUpperCase()}] ${timestamp}`,
+                    body: `Farm: ${farm} | Message: ${message}`
+                };
+            }
+            
+            // Log rows are cloned from a prototype parsed once, not assembled
+            // node by node on every scroll
+            const logEntryTemplate = document.createElement('template');
+            logEntryTemplate.innerHTML = '<div class="log-entry"><strong></strong><br><span></span></div>';
+            
+            function buildLogEntry(row) {
+                const entry = logEntryTemplate.content.firstElementChild.cloneNode(true);
+                entry.className = row.className;
+                entry.title = row.body;
+                entry.firstElementChild.textContent = row.title;
+                entry.lastElementChild.textContent = row.body;
+                return entry;
+            }
+            
+            function buildHeading(text) {
+                const heading = document.createElement('p');
+                heading.appendChild(createNode('strong', '', text));
+                return heading;
+            }
+            
+            // Virtualized alert log list: only rows near the viewport are in the DOM
+            const LOG_ROW_BUFFER = 10;
+            const logView = {
+                container: null,
+                spacer: null,
+                window: null,
+                rows: [],
+                rowHeight: 0,
+                first: -1
+            };
+            
+            function renderLogList(container, heading, alerts) {
+                const spacer = createNode('div');
+                spacer.style.position = 'relative';
+                const rowWindow = createNode('div', 'log-window');
+                spacer.appendChild(rowWindow);
+                container.replaceChildren(buildHeading(heading), spacer);
+                
+                logView.container = container;
+                logView.spacer = spacer;
+                logView.window = rowWindow;
+                logView.rows = alerts.map(toLogRow);
+                logView.first = -1;
+                
+                // Measure a single row once to size the scroll spacer
+                if (!logView.rowHeight && logView.rows.length > 0) {
+                    const probe = buildLogEntry(logView.rows[0]);
+                    rowWindow.appendChild(probe);
+                    const style = getComputedStyle(probe);
+                    logView.rowHeight = probe.offsetHeight
+                        + parseFloat(style.marginTop) + parseFloat(style.marginBottom);
+                    rowWindow.replaceChildren();
+                }
+                
+                spacer.style.height = (logView.rows.length * logView.rowHeight) + 'px';
+                container.scrollTop = 0;
+                container.onscroll = () => requestAnimationFrame(renderVisibleLogRows);
+                renderVisibleLogRows();
+            }
+            
+            function renderVisibleLogRows() {
+                const { container, spacer, window: rowWindow, rows, rowHeight } = logView;
+                if (!rowWindow || !rowWindow.isConnected) return;
+                
+                let first = 0;
+                let last = rows.length;
+                
+                if (rowHeight > 0) {
+                    const offset = Math.max(0, container.scrollTop - spacer.offsetTop);
+                    const visibleCount = Math.ceil(container.clientHeight / rowHeight) + 1;
+                    first = Math.max(0, Math.floor(offset / rowHeight) - LOG_ROW_BUFFER);
+                    last = Math.min(rows.length, first + visibleCount + 2 * LOG_ROW_BUFFER);
+                }
+                
+                if (first === logView.first) return;
+                logView.first = first;
+                
+                const frag = document.createDocumentFragment();
+                for (let i = first; i < last; i++) {
+                    frag.appendChild(buildLogEntry(rows[i]));
+                }
+                rowWindow.style.top = (first * rowHeight) + 'px';
+                rowWindow.replaceChildren(frag);
+            }
+            
+            // Main dashboard functions
+            function renderSummary(summaryData) {
+                if (!summaryData.success) return;
+                const s = summaryData.summary;
+                document.getElementById('summary').innerHTML = `
+                    <p>Animals Monitored: ${s.total_animals}</p>
+                    <p>Farms: ${s.farms_monitored}</p>
+                    <p>Anomalies Detected: ${s.anomaly_count}</p>
+                    <p>Active Alerts: ${summaryData.alerts.active_alerts}</p>
+                    <p class="${summaryData.alerts.critical_alerts > 0 ? 'critical' : ''}">
+                        Critical Alerts: ${summaryData.alerts.critical_alerts}
+                    </p>
+                `;
+            }
+            
+            function renderAlerts(alertsData) {
+                if (!alertsData.success) return;
+                const alertsHtml = alertsData.alerts.map(alert => `
+                    <div class="${alert.severity}">
+                        ${alert.severity.toUpperCase()}: ${alert.description}
+                        <br><small>${formatDateTime(alert.created_at)}</small>
+                    </div>
+                `).join('');
+                document.getElementById('alerts').innerHTML = alertsHtml || '<p>No active alerts</p>';
+            }
+            
+            function renderTimeline(timelineData) {
+                if (!timelineData.success) return;
+                const timelineHtml = timelineData.timeline.map(day => `
+                    <div>
+                        ${formatDate(day.day)}: 
+                        ${day.anomalies} anomalies (avg score: ${formatNumber(day.avg_score, 2)})
+                    </div>
+                `).join('');
+                document.getElementById('timeline').innerHTML = timelineHtml;
+            }
+            
+            function renderMetrics(metricsData) {
+                if (!metricsData.success) return;
+                renderChunked(document.getElementById('metricsBody'), metricsData.data, buildMetricRow);
+            }
+            
+            // Section name (as used by /api/dashboard and /api/stream) -> renderer
+            const SECTION_RENDERERS = {
+                summary: renderSummary,
+                alerts: renderAlerts,
+                timeline: renderTimeline,
+                metrics: renderMetrics
+            };
+            
+            function renderSection(name, data) {
+                SECTION_RENDERERS[name](data);
+                document.getElementById('lastUpdate').textContent = DATETIME_FORMAT.format(new Date());
+            }
+            
+            async function loadData(prefetched) {
+                try {
+                    // Load summary, alerts, timeline and metrics in one request
+                    const dashboardData = prefetched
+                        || await fetch('/api/dashboard').then(response => response.json());
                     
-                    // Load recent metrics
-                    const metricsRes = await fetch('/api/health_metrics');
-                    const metricsData = await metricsRes.json();
-                    
-                    if (metricsData.success) {
-                        const metricsHtml = metricsData.data.slice(0, 20).map(metric => `
-                            <tr class="${metric.is_anomaly ? 'warning' : ''}">
-                                <td>${metric.tag_id}</td>
-                                <td>${new Date(metric.date).toLocaleDateString()}</td>
-                                <td>${parseFloat(metric.temperature).toFixed(1)}°C</td>
-                                <td>${parseFloat(metric.heart_rate).toFixed(0)} BPM</td>
-                                <td>${parseFloat(metric.activity_level).toFixed(2)}</td>
-                                <td>${parseFloat(metric.anomaly_score).toFixed(2)}</td>
-                            </tr>
-                        `).join('');
-                        document.getElementById('metricsBody').innerHTML = metricsHtml;
+                    for (const name of Object.keys(SECTION_RENDERERS)) {
+                        renderSection(name, dashboardData[name]);
                     }
                     
-                    // Update timestamp
-                    document.getElementById('lastUpdate').textContent = new Date().toLocaleString();
-                    
                 } catch (error) {
                     console.error('Error loading data:', error);
                 }
             }
             
+            // Keep the dashboard current: the server pushes a section only when
+            // its data changes. Browsers without EventSource poll instead.
+            function subscribeToUpdates() {
+                if (typeof EventSource === 'undefined') {
+                    // Refresh every 5 minutes
+                    setInterval(loadData, 300000);
+                    return;
+                }
+                
+                const stream = new EventSource('/api/stream');
+                for (const name of Object.keys(SECTION_RENDERERS)) {
+                    stream.addEventListener(name, event => renderSection(name, JSON.parse(event.data)));
+                }
+                
+                // New alert log entries: the event carries fresh stats. Reload the
+                // log list too, unless the user is looking at search results.
+                stream.addEventListener('alert_logs', event => {
+                    logCache = null;
+                    const searching = document.getElementById('searchKeyword').value
+                        || document.getElementById('searchSeverity').value;
+                    if (searching) {
+                        loadLogStats(JSON.parse(event.data));
+                    } else {
+                        loadAlertLogs();
+                    }
+                });
+            }
+            
             // Export functions
+            const EXPORT_ENDPOINTS = {
+                anomalies: '/api/export/anomalies',
+                alerts: '/api/export/alerts',
+                health_metrics: '/api/export/health_metrics?days=30',
+                summary_txt: '/api/export/summary_report?format=txt',
+                summary_md: '/api/export/summary_report?format=md'
+            };
+            
             async function exportData(type) {
                 const exportStatus = document.getElementById('exportStatus');
                 const exportMessage = document.getElementById('exportMessage');
@@ -1114,36 +1978,9 @@ if __name__ == '__main__':
                 exportLinks.innerHTML = '';
                 
                 try {
-                    let url;
-                    let params = {};
-                    
-                    switch(type) {
-                        case 'anomalies':
-                            url = '/api/export/anomalies';
-                            break;
-                        case 'alerts':
-                            url = '/api/export/alerts';
-                            break;
-                        case 'health_metrics':
-                            url = '/api/export/health_metrics';
-                            params = { days: 30 };
-                            break;
-                        case 'summary_txt':
-                            url = '/api/export/summary_report';
-                            params = { format: 'txt' };
-                            break;
-                        case 'summary_md':
-                            url = '/api/export/summary_report';
-                            params = { format: 'md' };
-                            break;
-                        default:
-                            throw new Error('Invalid export type');
-                    }
-                    
-                    // Add query parameters
-                    if (Object.keys(params).length > 0) {
-                        const queryString = new URLSearchParams(params).toString();
-                        url += '?' + queryString;
+                    const url = EXPORT_ENDPOINTS[type];
+                    if (!url) {
+                        throw new Error('Invalid export type');
                     }
                     
                     const response = await fetch(url);
@@ -1154,15 +1991,16 @@ if __name__ == '__main__':
                         
                         // Show download links
                         if (data.files) {
-                            exportLinks.innerHTML = '<strong>Download:</strong><br>';
+                            const parts = ['<strong>Download:</strong><br>'];
                             for (const [format, filepath] of Object.entries(data.files)) {
                                 const filename = filepath.split('/').pop();
-                                exportLinks.innerHTML += `
+                                parts.push(`
                                     <a href="/api/exports/download/${filename}" class="file-link">
                                         ${format.toUpperCase()}
                                     </a>
-                                `;
+                                `);
                             }
+                            exportLinks.innerHTML = parts.join('');
                         } else if (data.file) {
                             const filename = data.file.split('/').pop();
                             exportLinks.innerHTML = `
@@ -1187,34 +2025,15 @@ if __name__ == '__main__':
                 }
             }
             
-            async function loadExports() {
+            async function loadExports(prefetched) {
                 const exportsList = document.getElementById('exportsList');
                 
                 try {
-                    const response = await fetch('/api/exports/list?days=7');
-                    const data = await response.json();
+                    const data = prefetched
+                        || await fetch('/api/exports/list?days=7').then(response => response.json());
                     
                     if (data.success && data.exports.length > 0) {
-                        let html = '';
-                        
-                        data.exports.forEach(exp => {
-                            const fileSize = exp.size_human || Math.round(exp.size / 1024) + ' KB';
-                            const modified = new Date(exp.modified).toLocaleString();
-                            
-                            html += `
-                                <div class="export-item">
-                                    <div>
-                                        <strong>${exp.filename}</strong><br>
-                                        <small>Size: ${fileSize} | Modified: ${modified}</small>
-                                    </div>
-                                    <a href="/api/exports/download/${exp.filename}" class="file-link">
-                                        Download
-                                    </a>
-                                </div>
-                            `;
-                        });
-                        
-                        exportsList.innerHTML = html;
+                        renderChunked(exportsList, data.exports, buildExportItem);
                     } else {
                         exportsList.innerHTML = '<p>No recent exports found.</p>';
                     }
@@ -1225,6 +2044,12 @@ if __name__ == '__main__':
             }
             
             // Data Quality functions
+            const QUALITY_POLL_MS = 500;
+            
+            function sleep(ms) {
+                return new Promise(resolve => setTimeout(resolve, ms));
+            }
+            
             async function analyzeDataQuality() {
                 const status = document.getElementById('qualityStatus');
                 const dashboard = document.getElementById('qualityDashboard');
@@ -1234,8 +2059,19 @@ if __name__ == '__main__':
                 status.style.backgroundColor = '#e7f3fe';
                 
                 try {
-                    const response = await fetch('/api/quality/analyze');
-                    const data = await response.json();
+                    // Queue the analysis, then poll until the worker finishes
+                    const submitRes = await fetch('/api/quality/analyze', {method: 'POST'});
+                    const task = await submitRes.json();
+                    let data = task;
+                    
+                    while (data.success && !data.done) {
+                        await sleep(QUALITY_POLL_MS);
+                        const statusRes = await fetch(`/api/quality/status/${task.task_id}`);
+                        data = await statusRes.json();
+                        if (data.success && !data.done) {
+                            status.innerHTML = `<p>Analyzing data quality... (${data.status}, ${data.elapsed}s)</p>`;
+                        }
+                    }
                     
                     if (data.success) {
                         status.innerHTML = '<p>✓ Analysis complete!</p>';
@@ -1309,20 +2145,20 @@ if __name__ == '__main__':
                         
                         // Display issues
                         if (data.issues.length > 0) {
-                            let html = '<h4>Quality Issues:</h4>';
+                            const parts = ['<h4>Quality Issues:</h4>'];
                             
-                            data.issues.forEach(issue => {
+                            for (const issue of data.issues) {
                                 const severity = issue.severity || 'medium';
-                                html += `
+                                parts.push(`
                                     <div class="issue-card issue-${severity}">
                                         <strong>${issue.type.replace('_', ' ').toUpperCase()}</strong>
                                         <p>${issue.message}</p>
                                         <small>Severity: ${severity.toUpperCase()}</small>
                                     </div>
-                                `;
-                            });
+                                `);
+                            }
                             
-                            details.innerHTML = html;
+                            details.innerHTML = parts.join('');
                         } else {
                             details.innerHTML = '<p>No quality issues found! 🎉</p>';
                         }
@@ -1336,8 +2172,47 @@ if __name__ == '__main__':
                 }
             }
             
+            // Quality dashboard nodes, kept between analyses so a refresh only
+            // updates text and progress bars instead of re-parsing the markup
+            const QUALITY_DIMENSIONS = ['completeness', 'validity', 'consistency', 'timeliness'];
+            let qualityNodes = null;
+            
+            function buildQualityDashboard(dimensions) {
+                const scoreValue = createNode('div');
+                scoreValue.style.cssText = 'font-size: 48px; font-weight: bold; margin: 10px 0;';
+                const qualityLabel = createNode('strong');
+                const labelLine = createNode('p');
+                labelLine.appendChild(qualityLabel);
+                
+                const scoreCard = createNode('div', 'quality-score');
+                scoreCard.append(createNode('h3', '', 'Overall Data Quality'), scoreValue, labelLine);
+                
+                const frag = document.createDocumentFragment();
+                frag.append(scoreCard, createNode('h4', '', 'Dimension Scores:'));
+                
+                const nodes = {dimensionKey: dimensions.join(','), scoreCard, scoreValue, qualityLabel, dimensions: {}};
+                for (const dim of dimensions) {
+                    const value = createNode('span');
+                    const header = createNode('div');
+                    header.style.cssText = 'display: flex; justify-content: space-between; align-items: center;';
+                    header.append(value, createNode('small', '', 'Score'));
+                    
+                    const bar = createNode('div', 'progress-bar');
+                    const barContainer = createNode('div', 'progress-container');
+                    barContainer.appendChild(bar);
+                    
+                    const card = createNode('div', 'dimension-card');
+                    card.append(createNode('strong', '', dim.charAt(0).toUpperCase() + dim.slice(1)), header, barContainer);
+                    frag.appendChild(card);
+                    
+                    nodes.dimensions[dim] = {value, bar};
+                }
+                
+                document.getElementById('qualityDashboard').replaceChildren(frag);
+                return nodes;
+            }
+            
             function displayQualityDashboard(analysis) {
-                const dashboard = document.getElementById('qualityDashboard');
                 const score = analysis.quality_score || 0;
                 
                 // Determine quality class
@@ -1358,110 +2233,105 @@ if __name__ == '__main__':
                     qualityText = 'Poor';
                 }
                 
-                let html = `
-                    <div class="quality-score ${qualityClass}">
-                        <h3>Overall Data Quality</h3>
-                        <div style="font-size: 48px; font-weight: bold; margin: 10px 0;">${score.toFixed(1)}%</div>
-                        <p><strong>${qualityText}</strong></p>
-                    </div>
-                    
-                    <h4>Dimension Scores:</h4>
-                `;
+                // Rebuild the skeleton only when the set of dimensions changes
+                const dimensions = QUALITY_DIMENSIONS.filter(dim => analysis[dim]);
+                if (!qualityNodes || qualityNodes.dimensionKey !== dimensions.join(',')
+                        || !qualityNodes.scoreCard.isConnected) {
+                    qualityNodes = buildQualityDashboard(dimensions);
+                }
                 
-                // Add dimension scores
-                const dimensions = ['completeness', 'validity', 'consistency', 'timeliness'];
-                dimensions.forEach(dim => {
-                    if (analysis[dim]) {
-                        const score = analysis[dim].overall || 0;
-                        html += `
-                            <div class="dimension-card">
-                                <strong>${dim.charAt(0).toUpperCase() + dim.slice(1)}</strong>
-                                <div style="display: flex; justify-content: space-between; align-items: center;">
-                                    <span>${score.toFixed(1)}%</span>
-                                    <small>Score</small>
-                                </div>
-                                <div class="progress-container">
-                                    <div class="progress-bar" style="width: ${score}%; background-color: ${getScoreColor(score)}"></div>
-                                </div>
-                            </div>
-                        `;
-                    }
-                });
+                qualityNodes.scoreCard.className = `quality-score ${qualityClass}`;
+                qualityNodes.scoreValue.textContent = `${score.toFixed(1)}%`;
+                qualityNodes.qualityLabel.textContent = qualityText;
                 
-                dashboard.innerHTML = html;
+                for (const dim of dimensions) {
+                    const dimScore = analysis[dim].overall || 0;
+                    const {value, bar} = qualityNodes.dimensions[dim];
+                    value.textContent = `${dimScore.toFixed(1)}%`;
+                    bar.style.width = `${dimScore}%`;
+                    bar.style.backgroundColor = getScoreColor(dimScore);
+                }
             }
             
             function displayQualityMetrics(analysis) {
                 const details = document.getElementById('qualityDetails');
                 
-                let html = '<h4>Detailed Metrics:</h4>';
+                const parts = ['<h4>Detailed Metrics:</h4>'];
                 
                 // Basic stats
                 const stats = analysis.basic_stats || {};
-                html += `
+                parts.push(`
                     <div class="dimension-card">
                         <strong>Basic Statistics</strong>
                         <p>Total Records: ${stats.total_records || 0}</p>
                         <p>Unique Animals: ${stats.unique_animals || 0}</p>
-                `;
+                `);
                 
                 if (stats.date_range && stats.date_range.start) {
-                    html += `<p>Date Range: ${stats.date_range.start} to ${stats.date_range.end}</p>`;
+                    parts.push(`<p>Date Range: ${stats.date_range.start} to ${stats.date_range.end}</p>`);
                 }
                 
-                html += '</div>';
+                parts.push('</div>');
                 
                 // Completeness details
                 const completeness = analysis.completeness || {};
                 if (completeness.by_column) {
-                    html += `
+                    parts.push(`
                         <div class="dimension-card">
                             <strong>Data Completeness</strong>
                             <p>Overall: ${completeness.overall?.toFixed(1) || 0}%</p>
                             <p>Missing values by column:</p>
-                    `;
+                    `);
                     
-                    Object.entries(completeness.by_column).forEach(([column, score]) => {
+                    for (const [column, score] of Object.entries(completeness.by_column)) {
                         const missingPercent = 100 - (score || 0);
                         if (missingPercent > 0) {
-                            html += `<p style="margin: 5px 0;">${column}: ${missingPercent.toFixed(1)}% missing</p>`;
+                            parts.push(`<p style="margin: 5px 0;">${column}: ${missingPercent.toFixed(1)}% missing</p>`);
                         }
-                    });
+                    }
                     
-                    html += '</div>';
+                    parts.push('</div>');
                 }
                 
                 // Issues
                 const issues = analysis.issues || [];
                 if (issues.length > 0) {
-                    html += '<div class="dimension-card"><strong>Issues Found:</strong>';
+                    parts.push('<div class="dimension-card"><strong>Issues Found:</strong>');
                     
-                    issues.forEach(issue => {
+                    for (const issue of issues) {
                         const severity = issue.severity || 'medium';
-                        html += `
+                        parts.push(`
                             <div class="issue-card issue-${severity}" style="margin: 10px 0;">
                                 <strong>${issue.type.replace('_', ' ').toUpperCase()}</strong>
                                 <p>${issue.message}</p>
                             </div>
-                        `;
-                    });
+                        `);
+                    }
                     
-                    html += '</div>';
+                    parts.push('</div>');
                 }
                 
-                details.innerHTML = html;
+                details.innerHTML = parts.join('');
             }
             
+            // Colour for every whole score 0-100, built once
+            const SCORE_COLORS = Array.from({length: 101}, (_, s) =>
+                s >= 90 ? '#28a745' :
+                s >= 70 ? '#ffc107' :
+                s >= 50 ? '#fd7e14' :
+                s >= 30 ? '#dc3545' : '#6c757d'
+            );
+            
             function getScoreColor(score) {
-                if (score >= 90) return '#28a745';
-                if (score >= 70) return '#ffc107';
-                if (score >= 50) return '#fd7e14';
-                if (score >= 30) return '#dc3545';
-                return '#6c757d';
+                return SCORE_COLORS[Math.max(0, Math.min(100, score | 0))];
             }
             
-            function showTextReport(reportText) {
-                // Create modal dialog for text report
+            // The report modal is built on first use and then shown/hidden
+            let reportModal = null;
+            
+            function getReportModal() {
+                if (reportModal) return reportModal;
+                
                 const modal = document.createElement('div');
                 modal.style.position = 'fixed';
                 modal.style.top = '0';
@@ -1470,7 +2340,7 @@ if __name__ == '__main__':
                 modal.style.height = '100%';
                 modal.style.backgroundColor = 'rgba(0,0,0,0.5)';
                 modal.style.zIndex = '1000';
-                modal.style.display = 'flex';
+                modal.style.display = 'none';
                 modal.style.justifyContent = 'center';
                 modal.style.alignItems = 'center';
                 
@@ -1481,160 +2351,245 @@ if __name__ == '__main__':
                 content.style.maxWidth = '80%';
                 content.style.maxHeight = '80%';
                 content.style.overflow = 'auto';
-                content.style.fontFamily = 'monospace';
-                content.style.whiteSpace = 'pre-wrap';
                 
-                content.textContent = reportText;
+                const body = document.createElement('pre');
+                body.className = 'report-body';
+                body.style.fontFamily = 'monospace';
+                body.style.whiteSpace = 'pre-wrap';
+                body.style.margin = '0';
                 
                 const closeBtn = document.createElement('button');
                 closeBtn.textContent = 'Close';
                 closeBtn.style.marginTop = '10px';
                 closeBtn.style.padding = '5px 10px';
                 closeBtn.onclick = function() {
-                    document.body.removeChild(modal);
+                    modal.style.display = 'none';
                 };
                 
-                content.appendChild(document.createElement('br'));
+                content.appendChild(body);
                 content.appendChild(closeBtn);
                 modal.appendChild(content);
                 document.body.appendChild(modal);
+                
+                reportModal = modal;
+                return modal;
+            }
+            
+            function showTextReport(reportText) {
+                const modal = getReportModal();
+                modal.querySelector('.report-body').textContent = reportText;
+                modal.style.display = 'flex';
             }
             
             // Alert Log functions
-            async function loadAlertLogs() {
+            function setStatus(statusDiv, state, ...content) {
+                statusDiv.className = `status status-${state}`;
+                statusDiv.replaceChildren(...content);
+            }
+            
+            function statusMessage(...content) {
+                const message = document.createElement('p');
+                message.append(...content);
+                return message;
+            }
+            
+            async function loadAlertLogs(prefetched) {
                 const logsDiv = document.getElementById('alertLogs');
                 const statusDiv = document.getElementById('logStatus');
                 
                 logsDiv.innerHTML = '<p>Loading alert logs...</p>';
-                statusDiv.style.display = 'none';
+                setStatus(statusDiv, 'hidden');
                 
-                try {
-                    const response = await fetch('/api/logs/alerts?days=7');
-                    const data = await response.json();
-                    
-                    if (data.success) {
-                        if (data.alerts.length > 0) {
-                            let html = `<p><strong>Recent Alerts (${data.alerts.length} total):</strong></p>`;
-                            
-                            data.alerts.slice(0, 20).forEach(alert => {
-                                const severity = alert.severity || 'info';
-                                const timestamp = alert.timestamp ? new Date(alert.timestamp).toLocaleString() : 'Unknown time';
-                                const farm = alert.farm_id || 'Unknown farm';
-                                const message = alert.message || 'No message';
-                                
-                                html += `
-                                    <div class="log-entry log-${severity}">
-                                        <strong>[${severity.toUpperCase()}] ${timestamp}</strong><br>
-                                        Farm: ${farm} | Message: ${message}
-                                    </div>
-                                `;
-                            });
-                            
-                            if (data.alerts.length > 20) {
-                                html += `<p><em>... and ${data.alerts.length - 20} more alerts</em></p>`;
-                            }
-                            
-                            logsDiv.innerHTML = html;
-                        } else {
-                            logsDiv.innerHTML = '<p>No alerts found in the last 7 days.</p>';
-                        }
-                        
-                        // Also load stats
-                        loadLogStats();
+                // A manual refresh also drops the cached search data
+                logCache = null;
+                
+                // Stats don't depend on the log list, so fetch both concurrently;
+                // allSettled keeps a failing stats request from blanking the logs
+                const [logsResult] = await Promise.allSettled([
+                    prefetched
+                        ? prefetched.alerts
+                        : fetch('/api/logs/alerts?days=7').then(response => response.json()),
+                    loadLogStatsWhenVisible()
+                ]);
+                
+                if (logsResult.status === 'rejected') {
+                    logsDiv.innerHTML = `<p>Error loading logs: ${logsResult.reason.message}</p>`;
+                    return;
+                }
+                
+                const data = logsResult.value;
+                
+                if (data.success) {
+                    if (data.alerts.length > 0) {
+                        renderLogList(logsDiv, `Recent Alerts (${data.alerts.length} total):`, data.alerts);
                     } else {
-                        logsDiv.innerHTML = `<p>Error: ${data.error}</p>`;
+                        logsDiv.innerHTML = '<p>No alerts found in the last 7 days.</p>';
                     }
+                } else {
+                    logsDiv.innerHTML = `<p>Error: ${data.error}</p>`;
+                }
+            }
+            
+            // Client-side cache of the last 30 days of alerts, searched locally
+            const LOG_CACHE_TTL_MS = 60000;
+            let logCache = null;
+            let logCacheTs = 0;
+            
+            async function getLogCache(signal) {
+                if (logCache && Date.now() - logCacheTs < LOG_CACHE_TTL_MS) {
+                    return logCache;
+                }
+                
+                const response = await fetch('/api/logs/alerts?days=30', { signal });
+                const data = await response.json();
+                
+                if (!data.success) {
+                    throw new Error(data.error);
+                }
+                
+                // Same fields the server matches keywords against, lowercased once
+                for (const alert of data.alerts) {
+                    alert._searchBlob = `${alert.message || ''}\\n${alert.description || ''}`.toLowerCase();
+                }
+                
+                logCache = data.alerts;
+                logCacheTs = Date.now();
+                return logCache;
+            }
+            
+            async function fetchSearchResults(keyword, severity, signal) {
+                let cached = null;
+                
+                try {
+                    cached = await getLogCache(signal);
                 } catch (error) {
-                    logsDiv.innerHTML = `<p>Error loading logs: ${error.message}</p>`;
+                    if (error.name === 'AbortError') throw error;
+                    console.log('Log cache unavailable, searching on server:', error.message);
+                }
+                
+                if (cached) {
+                    const kw = keyword.toLowerCase();
+                    const sev = severity.toLowerCase();
+                    
+                    return cached.filter(alert =>
+                        (!sev || (alert.severity || '').toLowerCase() === sev) &&
+                        (!kw || alert._searchBlob.includes(kw))
+                    );
+                }
+                
+                let url = `/api/logs/search?days=30`;
+                if (keyword) url += `&keyword=${encodeURIComponent(keyword)}`;
+                if (severity) url += `&severity=${severity}`;
+                
+                const response = await fetch(url, { signal });
+                const data = await response.json();
+                
+                if (!data.success) {
+                    throw new Error(data.error);
                 }
+                
+                return data.results;
+            }
+            
+            // Search-as-you-type is debounced, and a newer search aborts the one in flight
+            const SEARCH_DEBOUNCE_MS = 250;
+            let searchTimer = null;
+            let searchAbort = null;
+            
+            function scheduleSearch() {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(searchLogs, SEARCH_DEBOUNCE_MS);
             }
             
             async function searchLogs() {
+                clearTimeout(searchTimer);
+                if (searchAbort) searchAbort.abort();
+                searchAbort = new AbortController();
+                const signal = searchAbort.signal;
+                
                 const keyword = document.getElementById('searchKeyword').value;
                 const severity = document.getElementById('searchSeverity').value;
                 const logsDiv = document.getElementById('alertLogs');
                 const statusDiv = document.getElementById('logStatus');
                 
                 logsDiv.innerHTML = '<p>Searching...</p>';
-                statusDiv.style.display = 'none';
+                setStatus(statusDiv, 'hidden');
                 
                 try {
-                    let url = `/api/logs/search?days=30`;
-                    if (keyword) url += `&keyword=${encodeURIComponent(keyword)}`;
-                    if (severity) url += `&severity=${severity}`;
-                    
-                    const response = await fetch(url);
-                    const data = await response.json();
+                    const results = await fetchSearchResults(keyword, severity, signal);
+                    if (signal.aborted) return;
                     
-                    if (data.success) {
-                        if (data.results.length > 0) {
-                            let html = `<p><strong>Search Results (${data.results.length} found):</strong></p>`;
-                            
-                            data.results.forEach(alert => {
-                                const severity = alert.severity || 'info';
-                                const timestamp = alert.timestamp ? new Date(alert.timestamp).toLocaleString() : 'Unknown time';
-                                const farm = alert.farm_id || 'Unknown farm';
-                                const message = alert.message || 'No message';
-                                
-                                html += `
-                                    <div class="log-entry log-${severity}">
-                                        <strong>[${severity.toUpperCase()}] ${timestamp}</strong><br>
-                                        Farm: ${farm} | Message: ${message}
-                                    </div>
-                                `;
-                            });
-                            
-                            logsDiv.innerHTML = html;
-                            
-                            statusDiv.style.display = 'block';
-                            statusDiv.style.backgroundColor = '#d4edda';
-                            statusDiv.innerHTML = `<p>✓ Found ${data.results.length} matching alerts</p>`;
-                        } else {
-                            logsDiv.innerHTML = '<p>No alerts match your search criteria.</p>';
-                            
-                            statusDiv.style.display = 'block';
-                            statusDiv.style.backgroundColor = '#fff3cd';
-                            statusDiv.innerHTML = '<p>No matching alerts found.</p>';
-                        }
+                    if (results.length > 0) {
+                        renderLogList(logsDiv, `Search Results (${results.length} found):`, results);
+                        
+                        setStatus(statusDiv, 'ok', statusMessage(`✓ Found ${results.length} matching alerts`));
                     } else {
-                        logsDiv.innerHTML = `<p>Error: ${data.error}</p>`;
+                        logsDiv.innerHTML = '<p>No alerts match your search criteria.</p>';
+                        
+                        setStatus(statusDiv, 'warn', statusMessage('No matching alerts found.'));
                     }
                 } catch (error) {
+                    if (error.name === 'AbortError') return;
                     logsDiv.innerHTML = `<p>Error searching logs: ${error.message}</p>`;
                 }
             }
             
-            async function loadLogStats() {
+            function buildStatCard(value, label, fontSize) {
+                const valueNode = createNode('div', '', value);
+                valueNode.style.cssText = `font-size: ${fontSize}; font-weight: bold;`;
+                
+                const card = createNode('div', 'stat-card');
+                card.append(valueNode, createNode('div', '', label));
+                return card;
+            }
+            
+            // The stats panel sits below the fold, so its first load waits until
+            // the panel comes near the viewport. Later refreshes load directly.
+            let logStatsSeen = false;
+            let logStatsObserver = null;
+            
+            function loadLogStatsWhenVisible() {
+                if (logStatsSeen || typeof IntersectionObserver === 'undefined') {
+                    return loadLogStats();
+                }
+                
+                if (!logStatsObserver) {
+                    logStatsObserver = new IntersectionObserver((entries, observer) => {
+                        if (entries.some(entry => entry.isIntersecting)) {
+                            observer.disconnect();
+                            logStatsSeen = true;
+                            loadLogStats();
+                        }
+                    }, {rootMargin: '200px'});
+                    logStatsObserver.observe(document.getElementById('logStats'));
+                }
+            }
+            
+            async function loadLogStats(prefetched) {
                 const statsDiv = document.getElementById('logStats');
                 
                 try {
-                    const response = await fetch('/api/logs/stats?days=7');
-                    const data = await response.json();
+                    const data = prefetched
+                        || await fetch('/api/logs/stats?days=7').then(response => response.json());
                     
                     if (data.success) {
                         const stats = data.stats;
-                        let html = '<strong>Last 7 Days Statistics:</strong><br>';
+                        const frag = document.createDocumentFragment();
                         
-                        html += `
-                            <div class="stat-card">
-                                <div style="font-size: 24px; font-weight: bold;">${stats.total_alerts || 0}</div>
-                                <div>Total Alerts</div>
-                            </div>
-                        `;
+                        frag.appendChild(buildStatCard(stats.total_alerts || 0, 'Total Alerts', '24px'));
                         
                         // Severity breakdown
                         if (stats.by_severity) {
-                            Object.entries(stats.by_severity).forEach(([severity, count]) => {
-                                html += `
-                                    <div class="stat-card">
-                                        <div style="font-size: 20px; font-weight: bold;">${count}</div>
-                                        <div>${severity.toUpperCase()}</div>
-                                    </div>
-                                `;
-                            });
+                            for (const [severity, count] of Object.entries(stats.by_severity)) {
+                                frag.appendChild(buildStatCard(count, severity.toUpperCase(), '20px'));
+                            }
                         }
                         
-                        statsDiv.innerHTML = html;
+                        statsDiv.replaceChildren(
+                            createNode('strong', '', 'Last 7 Days Statistics:'),
+                            document.createElement('br'),
+                            frag
+                        );
                     }
                 } catch (error) {
                     statsDiv.innerHTML = `<p>Error loading stats: ${error.message}</p>`;
@@ -1644,60 +2599,170 @@ if __name__ == '__main__':
             async function exportLogs(format) {
                 const statusDiv = document.getElementById('logStatus');
                 
-                statusDiv.style.display = 'block';
-                statusDiv.innerHTML = `<p>Exporting logs as ${format.toUpperCase()}...</p>`;
-                statusDiv.style.backgroundColor = '#e7f3fe';
+                setStatus(statusDiv, 'pending', statusMessage(`Exporting logs as ${format.toUpperCase()}...`));
                 
                 try {
                     const response = await fetch(`/api/logs/export?days=30&format=${format}`);
                     const data = await response.json();
                     
                     if (data.success) {
-                        statusDiv.innerHTML = `<p>✓ Export complete! <a href="/api/exports/download/${data.filename}" target="_blank">Download ${data.filename}</a></p>`;
-                        statusDiv.style.backgroundColor = '#d4edda';
+                        const link = createNode('a', '', `Download ${data.filename}`);
+                        link.href = `/api/exports/download/${encodeURIComponent(data.filename)}`;
+                        link.target = '_blank';
+                        setStatus(statusDiv, 'ok', statusMessage('✓ Export complete! ', link));
                     } else {
-                        statusDiv.innerHTML = `<p>✗ Export failed: ${data.error}</p>`;
-                        statusDiv.style.backgroundColor = '#f8d7da';
+                        setStatus(statusDiv, 'err', statusMessage(`✗ Export failed: ${data.error}`));
                     }
                 } catch (error) {
-                    statusDiv.innerHTML = `<p>✗ Error: ${error.message}</p>`;
-                    statusDiv.style.backgroundColor = '#f8d7da';
+                    setStatus(statusDiv, 'err', statusMessage(`✗ Error: ${error.message}`));
                 }
             }
             
+            // Stale-while-revalidate cache in localStorage for slow-changing
+            // endpoints. A fresh entry is returned at once and revalidated in the
+            // background with If-None-Match; onUpdate gets any newer body.
+            function readCached(key) {
+                try {
+                    return JSON.parse(localStorage.getItem(key));
+                } catch (error) {
+                    return null;
+                }
+            }
+            
+            function writeCached(key, response, body) {
+                if (!body.success) return;
+                try {
+                    localStorage.setItem(key, JSON.stringify({
+                        t: Date.now(),
+                        etag: response.headers.get('ETag'),
+                        body
+                    }));
+                } catch (error) {
+                    // Storage full or disabled: just skip caching
+                }
+            }
+            
+            async function revalidateCached(url, key, hit, onUpdate) {
+                try {
+                    const headers = hit.etag ? {'If-None-Match': hit.etag} : {};
+                    const response = await fetch(url, {headers});
+                    if (response.status === 304) {
+                        writeCached(key, response, hit.body);
+                        return;
+                    }
+                    const body = await response.json();
+                    writeCached(key, response, body);
+                    if (onUpdate) onUpdate(body);
+                } catch (error) {
+                    console.log(`Could not revalidate ${url}:`, error.message);
+                }
+            }
+            
+            async function cachedFetch(url, ttlMs, onUpdate) {
+                const key = 'cf:' + url;
+                const hit = readCached(key);
+                
+                if (hit && Date.now() - hit.t < ttlMs) {
+                    revalidateCached(url, key, hit, onUpdate);
+                    return hit.body;
+                }
+                
+                const response = await fetch(url);
+                const body = await response.json();
+                writeCached(key, response, body);
+                return body;
+            }
+            
             // Load quality score on page load
+            const QUALITY_SCORE_TTL_MS = 300000;
+            
+            function showQualityScore(data) {
+                if (data.success) {
+                    // You could display the score in a small widget
+                    console.log(`Data quality score: ${data.score}% (${data.rating.text})`);
+                }
+            }
+            
             async function loadQualityScore() {
                 try {
-                    const response = await fetch('/api/quality/score');
-                    const data = await response.json();
-                    
-                    if (data.success) {
-                        // You could display the score in a small widget
-                        console.log(`Data quality score: ${data.score}% (${data.rating.text})`);
-                    }
+                    const data = await cachedFetch('/api/quality/score', QUALITY_SCORE_TTL_MS, showQualityScore);
+                    showQualityScore(data);
                 } catch (error) {
                     console.log('Could not load quality score:', error.message);
                 }
             }
             
+            // First paint: fetch the dashboard, exports and alert logs in one
+            // request. A loader whose data is missing fetches it itself.
+            async function loadInitialData() {
+                let boot = {};
+                try {
+                    const response = await fetch('/api/dashboard/bootstrap');
+                    boot = await response.json();
+                } catch (error) {
+                    console.error('Error loading dashboard:', error);
+                }
+                
+                await Promise.all([
+                    loadData(boot.data),
+                    loadExports(boot.exports),
+                    loadAlertLogs(boot.logs)
+                ]);
+            }
+            
             // Initialize everything on page load
-            document.addEventListener('DOMContentLoaded', function() {
-                loadData();
-                loadExports();
-                loadAlertLogs();
-                loadQualityScore();
-                
-                // Refresh every 5 minutes
-                setInterval(loadData, 300000);
+            document.addEventListener('DOMContentLoaded', async function() {
+                document.getElementById('searchKeyword').addEventListener('input', scheduleSearch);
+                document.getElementById('searchSeverity').addEventListener('change', scheduleSearch);
+                
+                // All first-load requests run concurrently. Live updates start once
+                // they have rendered, so an older first load can't overwrite a
+                // newer pushed section.
+                await Promise.allSettled([loadInitialData(), loadQualityScore()]);
+                subscribeToUpdates();
             });
         </script>
     </body>
     </html>
     """
     
-    with open('templates/index.html', 'w', encoding='utf-8') as f:
-        f.write(html_template)
+    # The debug reloader re-runs this block on every restart, so only touch
+    # the template when its content actually changed
+    current_template = None
+    if os.path.exists(INDEX_TEMPLATE_PATH):
+        with open(INDEX_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+            current_template = f.read()
+    
+    if current_template != html_template:
+        with open(INDEX_TEMPLATE_PATH, 'w', encoding='utf-8') as f:
+            f.write(html_template)
+    
+    if not all(_is_fresh_copy(os.path.join(INDEX_STATIC_DIR, filename))
+               for _, filename, _ in INDEX_PRECOMPRESSED):
+        precompress_index(html_template)
     
     print("Starting dashboard server on http://localhost:5000")
     print("Press Ctrl+C to stop")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    
+    if os.environ.get('FLASK_DEBUG') == '1':
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # A single gunicorn worker keeps the in-memory state (queued quality
+        # analyses, the event stream notifier, the exports cache) in one
+        # process; its threads serve requests concurrently, and each open
+        # event stream holds one of them for as long as the page is open,
+        # so the pool must stay well above the number of open dashboards
+        threads = os.environ.get('DASHBOARD_THREADS', str(DASHBOARD_THREADS))
+        try:
+            os.execvp('gunicorn', [
+                'gunicorn',
+                '-k', 'gthread',
+                '-w', '1',
+                '--threads', threads,
+                '--chdir', os.path.dirname(os.path.abspath(__file__)),
+                '-b', '0.0.0.0:5000',
+                'dashboard:app'
+            ])
+        except FileNotFoundError:
+            print("gunicorn not found, falling back to the Flask server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
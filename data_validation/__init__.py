@@ -1,23 +1,25 @@
 """
 Data validation module for schema enforcement and data quality checking
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package, or only ``data_validation.schema``, doesn't load the validator.
 """
 
-from .schema import (
-    DatasetSchema,
-    ColumnSchema,
-    DataType,
-    ValidationSeverity,
-    SchemaRegistry,
-    get_schema_registry,
-    reset_schema_registry
-)
-
-from .validator import (
-    DataValidator,
-    ValidationRule,
-    get_data_validator,
-    reset_data_validator
-)
+import importlib
+
+_LAZY_ATTRS = {
+    'DatasetSchema': '.schema',
+    'ColumnSchema': '.schema',
+    'DataType': '.schema',
+    'ValidationSeverity': '.schema',
+    'SchemaRegistry': '.schema',
+    'get_schema_registry': '.schema',
+    'reset_schema_registry': '.schema',
+    'DataValidator': '.validator',
+    'ValidationRule': '.validator',
+    'get_data_validator': '.validator',
+    'reset_data_validator': '.validator'
+}
 
 __all__ = [
     'DatasetSchema',
@@ -31,4 +33,18 @@ __all__ = [
     'get_data_validator',
     'reset_schema_registry',
     'reset_data_validator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
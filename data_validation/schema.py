@@ -3,11 +3,13 @@ Data schema definitions and validation for livestock outbreak detection
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Iterator
 from datetime import datetime
-import json
+import re
+import orjson
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache, reduce
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,7 +36,205 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+# Types whose values are converted to numbers before range checks
+NUMERIC_TYPES = (
+    DataType.INTEGER,
+    DataType.FLOAT,
+    DataType.PERCENTAGE,
+    DataType.TEMPERATURE,
+    DataType.WEIGHT
+)
+
+# Indented like json.dumps(indent=2); numpy values and non-string metadata
+# keys are serialized rather than rejected
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Ranges validate() enforces for numeric types, as (lower, upper)
+NUMERIC_TYPE_RANGES = {
+    DataType.PERCENTAGE: (0, 100),
+    DataType.TEMPERATURE: (-50, 50),
+    DataType.WEIGHT: (0, None)
+}
+
+# Accepted formats for datetime strings
+DATETIME_FORMATS = ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d/%m/%Y', '%m/%d/%Y')
+
+# ColumnSchema fields written by to_dict() and read back by from_dict()
+SERIALIZED_COLUMN_FIELDS = (
+    'name', 'data_type', 'required', 'nullable', 'min_value',
+    'max_value', 'allowed_values', 'pattern', 'description'
+)
+
+# validate() result for a null in a nullable column
+NULL_ALLOWED = (True, "Null value allowed", ValidationSeverity.INFO)
+
+
+def _flag_out_of_range(numbers: np.ndarray,
+                       lower: Optional[float],
+                       upper: Optional[float],
+                       integer: bool) -> np.ndarray:
+    """Mask of NaN, out-of-range and, for integers, fractional values"""
+    lower = -np.inf if lower is None else lower
+    upper = np.inf if upper is None else upper
+    
+    with np.errstate(invalid='ignore'):
+        # NaN fails both comparisons, so it is flagged too
+        flagged = ~((numbers >= lower) & (numbers <= upper))
+        if integer:
+            flagged |= numbers % 1 != 0
+    
+    return flagged
+
+
+def _string_values(series: pd.Series):
+    """The .str accessor of a series, or None if it holds no strings"""
+    try:
+        return series.str
+    except AttributeError:
+        return None
+
+
+def _is_null(value: Any) -> bool:
+    """pd.isna for a single value, with direct checks for the common types"""
+    if value is None:
+        return True
+    
+    value_type = type(value)
+    if value_type is str or value_type is int:
+        return False
+    if value_type is float:
+        return value != value
+    return pd.isna(value)
+
+
+def _is_iso_datetime(value: str) -> bool:
+    """
+    Fast check for strings in the two ISO formats of DATETIME_FORMATS
+    
+    Only 'YYYY-MM-DD' and 'YYYY-MM-DD HH:MM:SS' shaped strings are passed to
+    datetime.fromisoformat, so this never accepts anything the format list
+    would reject.
+    """
+    if len(value) not in (10, 19) or value[4] != '-' or value[7] != '-':
+        return False
+    if len(value) == 19 and (value[10] != ' ' or value[13] != ':' or value[16] != ':'):
+        return False
+    
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    
+    return True
+
+
+# Type handlers for ColumnSchema.validate. Each takes the value and column
+# name and returns (converted_value, failure); failure is None when the value
+# passes, otherwise the (is_valid, message, severity) result to report.
+# ValueError and TypeError are reported as conversion failures by the caller.
+
+def _validate_integer(value: Any, name: str):
+    if not isinstance(value, (int, np.integer)):
+        # Try to convert
+        int_value = int(float(value))
+        if float(value) != int_value:
+            return value, (False, f"Column '{name}' must be integer, got {value}", ValidationSeverity.ERROR)
+        value = int_value
+    return value, None
+
+
+def _validate_float(value: Any, name: str):
+    if not isinstance(value, (float, int, np.floating, np.integer)):
+        value = float(value)
+    return value, None
+
+
+def _validate_string(value: Any, name: str):
+    return str(value), None
+
+
+def _validate_boolean(value: Any, name: str):
+    if isinstance(value, str):
+        value_lower = value.lower()
+        if value_lower in ['true', '1', 'yes', 'y']:
+            return True, None
+        if value_lower in ['false', '0', 'no', 'n']:
+            return False, None
+        return value, (False, f"Column '{name}' must be boolean, got {value}", ValidationSeverity.ERROR)
+    if not isinstance(value, (bool, np.bool_)):
+        return value, (False, f"Column '{name}' must be boolean, got {value}", ValidationSeverity.ERROR)
+    return value, None
+
+
+def _validate_datetime(value: Any, name: str):
+    if isinstance(value, str):
+        # ISO dates skip the strptime loop
+        if not _is_iso_datetime(value):
+            try:
+                # Try common formats
+                for fmt in DATETIME_FORMATS:
+                    try:
+                        datetime.strptime(value, fmt)
+                        break
+                    except ValueError:
+                        continue
+                else:
+                    return value, (False, f"Column '{name}' datetime format not recognized: {value}", ValidationSeverity.ERROR)
+            except Exception:
+                return value, (False, f"Column '{name}' must be datetime, got {value}", ValidationSeverity.ERROR)
+    elif not isinstance(value, (datetime, pd.Timestamp)):
+        return value, (False, f"Column '{name}' must be datetime, got {value}", ValidationSeverity.ERROR)
+    return value, None
+
+
+def _validate_percentage(value: Any, name: str):
+    if not isinstance(value, (float, int, np.floating, np.integer)):
+        try:
+            value = float(value)
+        except:
+            return value, (False, f"Column '{name}' must be percentage, got {value}", ValidationSeverity.ERROR)
+    if not (0 <= value <= 100):
+        return value, (False, f"Column '{name}' must be between 0 and 100, got {value}", ValidationSeverity.ERROR)
+    return value, None
+
+
+def _validate_temperature(value: Any, name: str):
+    if not isinstance(value, (float, int, np.floating, np.integer)):
+        try:
+            value = float(value)
+        except:
+            return value, (False, f"Column '{name}' must be temperature, got {value}", ValidationSeverity.ERROR)
+    # Reasonable temperature range for livestock (in Celsius)
+    if not (-50 <= value <= 50):
+        return value, (False, f"Column '{name}' temperature unrealistic: {value}°C", ValidationSeverity.WARNING)
+    return value, None
+
+
+def _validate_weight(value: Any, name: str):
+    if not isinstance(value, (float, int, np.floating, np.integer)):
+        try:
+            value = float(value)
+        except:
+            return value, (False, f"Column '{name}' must be weight, got {value}", ValidationSeverity.ERROR)
+    if value < 0:
+        return value, (False, f"Column '{name}' weight cannot be negative: {value}", ValidationSeverity.ERROR)
+    return value, None
+
+
+# CATEGORICAL and COUNT values are checked as-is
+_TYPE_HANDLERS = {
+    DataType.INTEGER: _validate_integer,
+    DataType.FLOAT: _validate_float,
+    DataType.STRING: _validate_string,
+    DataType.BOOLEAN: _validate_boolean,
+    DataType.DATETIME: _validate_datetime,
+    DataType.PERCENTAGE: _validate_percentage,
+    DataType.TEMPERATURE: _validate_temperature,
+    DataType.WEIGHT: _validate_weight
+}
+
+
+@dataclass(slots=True)
 class ColumnSchema:
     """Schema definition for a single column"""
     name: str
@@ -48,6 +248,47 @@ class ColumnSchema:
     description: str = ""
     default_value: Optional[Any] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _compiled_pattern: Optional[re.Pattern] = field(init=False, default=None, repr=False, compare=False)
+    _allowed_set: Optional[frozenset] = field(init=False, default=None, repr=False, compare=False)
+    _passed: Optional[tuple] = field(init=False, default=None, repr=False, compare=False)
+    _null_error: Optional[tuple] = field(init=False, default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # validate() returns these shared results rather than building them per value
+        self._passed = (True, f"Column '{self.name}' validation passed", ValidationSeverity.INFO)
+        self._null_error = (False, f"Column '{self.name}' cannot be null", ValidationSeverity.ERROR)
+        
+        # Compile the pattern once instead of on every validated value
+        if self.pattern is not None:
+            self._compiled_pattern = re.compile(self.pattern)
+        
+        # Hashed lookup for allowed values; unhashable ones keep the list scan
+        if self.allowed_values is not None:
+            try:
+                self._allowed_set = frozenset(self.allowed_values)
+            except TypeError:
+                pass
+    
+    def to_dict(self) -> Dict:
+        """Convert column schema to dictionary, with the SERIALIZED_COLUMN_FIELDS keys"""
+        return {
+            'name': self.name,
+            'data_type': self.data_type.value,
+            'required': self.required,
+            'nullable': self.nullable,
+            'min_value': self.min_value,
+            'max_value': self.max_value,
+            'allowed_values': self.allowed_values,
+            'pattern': self.pattern,
+            'description': self.description
+        }
+    
+    @classmethod
+    def from_dict(cls, column_dict: Dict) -> 'ColumnSchema':
+        """Create column schema from dictionary; missing fields keep their defaults"""
+        kwargs = {name: column_dict[name] for name in SERIALIZED_COLUMN_FIELDS if name in column_dict}
+        kwargs['data_type'] = DataType(column_dict['data_type'])
+        return cls(**kwargs)
     
     def validate(self, value: Any) -> Tuple[bool, str, ValidationSeverity]:
         """
@@ -57,109 +298,178 @@ class ColumnSchema:
             Tuple of (is_valid, message, severity)
         """
         # Handle null values
-        if pd.isna(value) or value is None:
+        if _is_null(value):
             if not self.nullable:
-                return False, f"Column '{self.name}' cannot be null", ValidationSeverity.ERROR
-            return True, "Null value allowed", ValidationSeverity.INFO
+                return self._null_error
+            return NULL_ALLOWED
         
-        # Type validation
-        try:
-            if self.data_type == DataType.INTEGER:
-                if not isinstance(value, (int, np.integer)):
-                    # Try to convert
-                    int_value = int(float(value))
-                    if float(value) != int_value:
-                        return False, f"Column '{self.name}' must be integer, got {value}", ValidationSeverity.ERROR
-                    value = int_value
-                
-            elif self.data_type == DataType.FLOAT:
-                if not isinstance(value, (float, int, np.floating, np.integer)):
-                    value = float(value)
-                
-            elif self.data_type == DataType.STRING:
-                value = str(value)
-                
-            elif self.data_type == DataType.BOOLEAN:
-                if isinstance(value, str):
-                    value_lower = value.lower()
-                    if value_lower in ['true', '1', 'yes', 'y']:
-                        value = True
-                    elif value_lower in ['false', '0', 'no', 'n']:
-                        value = False
-                    else:
-                        return False, f"Column '{self.name}' must be boolean, got {value}", ValidationSeverity.ERROR
-                elif not isinstance(value, (bool, np.bool_)):
-                    return False, f"Column '{self.name}' must be boolean, got {value}", ValidationSeverity.ERROR
-            
-            elif self.data_type == DataType.DATETIME:
-                if isinstance(value, str):
-                    try:
-                        # Try common formats
-                        for fmt in ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d/%m/%Y', '%m/%d/%Y']:
-                            try:
-                                datetime.strptime(value, fmt)
-                                break
-                            except ValueError:
-                                continue
-                        else:
-                            return False, f"Column '{self.name}' datetime format not recognized: {value}", ValidationSeverity.ERROR
-                    except Exception:
-                        return False, f"Column '{self.name}' must be datetime, got {value}", ValidationSeverity.ERROR
-                elif not isinstance(value, (datetime, pd.Timestamp)):
-                    return False, f"Column '{self.name}' must be datetime, got {value}", ValidationSeverity.ERROR
+        # Type validation and conversion
+        handler = _TYPE_HANDLERS.get(self.data_type)
+        if handler is not None:
+            try:
+                value, failure = handler(value, self.name)
+            except (ValueError, TypeError) as e:
+                return False, f"Column '{self.name}' type conversion failed: {str(e)}", ValidationSeverity.ERROR
             
-            elif self.data_type == DataType.PERCENTAGE:
-                if not isinstance(value, (float, int, np.floating, np.integer)):
-                    try:
-                        value = float(value)
-                    except:
-                        return False, f"Column '{self.name}' must be percentage, got {value}", ValidationSeverity.ERROR
-                if not (0 <= value <= 100):
-                    return False, f"Column '{self.name}' must be between 0 and 100, got {value}", ValidationSeverity.ERROR
-            
-            elif self.data_type == DataType.TEMPERATURE:
-                if not isinstance(value, (float, int, np.floating, np.integer)):
-                    try:
-                        value = float(value)
-                    except:
-                        return False, f"Column '{self.name}' must be temperature, got {value}", ValidationSeverity.ERROR
-                # Reasonable temperature range for livestock (in Celsius)
-                if not (-50 <= value <= 50):
-                    return False, f"Column '{self.name}' temperature unrealistic: {value}°C", ValidationSeverity.WARNING
-            
-            elif self.data_type == DataType.WEIGHT:
-                if not isinstance(value, (float, int, np.floating, np.integer)):
-                    try:
-                        value = float(value)
-                    except:
-                        return False, f"Column '{self.name}' must be weight, got {value}", ValidationSeverity.ERROR
-                if value < 0:
-                    return False, f"Column '{self.name}' weight cannot be negative: {value}", ValidationSeverity.ERROR
-            
-        except (ValueError, TypeError) as e:
-            return False, f"Column '{self.name}' type conversion failed: {str(e)}", ValidationSeverity.ERROR
+            if failure is not None:
+                return failure
         
         # Range validation
-        if self.min_value is not None and value < self.min_value:
-            return False, f"Column '{self.name}' value {value} below minimum {self.min_value}", ValidationSeverity.ERROR
+        min_value = self.min_value
+        if min_value is not None and value < min_value:
+            return False, f"Column '{self.name}' value {value} below minimum {min_value}", ValidationSeverity.ERROR
         
-        if self.max_value is not None and value > self.max_value:
-            return False, f"Column '{self.name}' value {value} above maximum {self.max_value}", ValidationSeverity.ERROR
+        max_value = self.max_value
+        if max_value is not None and value > max_value:
+            return False, f"Column '{self.name}' value {value} above maximum {max_value}", ValidationSeverity.ERROR
         
         # Allowed values validation
-        if self.allowed_values is not None and value not in self.allowed_values:
+        if self.allowed_values is not None and not self._is_allowed(value):
             return False, f"Column '{self.name}' value {value} not in allowed values", ValidationSeverity.ERROR
         
         # Pattern validation (for strings)
-        if self.pattern is not None and isinstance(value, str):
-            import re
-            if not re.match(self.pattern, value):
+        compiled_pattern = self._compiled_pattern
+        if compiled_pattern is not None and isinstance(value, str):
+            if not compiled_pattern.match(value):
                 return False, f"Column '{self.name}' value doesn't match pattern", ValidationSeverity.ERROR
         
-        return True, f"Column '{self.name}' validation passed", ValidationSeverity.INFO
+        return self._passed
+    
+    def _is_allowed(self, value: Any) -> bool:
+        """Whether value is one of allowed_values"""
+        if self._allowed_set is not None:
+            try:
+                return value in self._allowed_set
+            except TypeError:
+                pass
+        return value in self.allowed_values
+    
+    def validate_series(self, series: pd.Series) -> pd.DataFrame:
+        """
+        Validate all values of a column at once
+        
+        The checks run as vectorized pandas operations. Only the values they
+        flag are passed to validate() for the exact message and severity, so
+        the results match validating each value on its own.
+        
+        Returns:
+            DataFrame indexed like the series with 'is_valid', 'message' and
+            'severity' columns
+        """
+        size = len(series)
+        nulls = series.isna().to_numpy(dtype=bool)
+        flagged = np.flatnonzero(self._flag_invalid(series) & ~nulls)
+        
+        is_valid = np.ones(size, dtype=bool)
+        messages = np.full(size, self._passed[1], dtype=object)
+        severities = np.full(size, ValidationSeverity.INFO, dtype=object)
+        
+        if nulls.any():
+            is_valid[nulls] = self.nullable
+            if self.nullable:
+                messages[nulls] = NULL_ALLOWED[1]
+            else:
+                messages[nulls] = self._null_error[1]
+                severities[nulls] = ValidationSeverity.ERROR
+        
+        # tolist() yields Python scalars, as validate() expects
+        for position, value in zip(flagged, series.iloc[flagged].tolist()):
+            is_valid[position], messages[position], severities[position] = self.validate(value)
+        
+        return pd.DataFrame({
+            'is_valid': is_valid,
+            'message': messages,
+            'severity': severities
+        }, index=series.index)
+    
+    def _flag_invalid(self, series: pd.Series) -> np.ndarray:
+        """
+        Vectorized screen for values that may fail validate()
+        
+        May flag valid values, but never misses an invalid one. Null values
+        are left to the caller. Anything the vectorized checks can't reason
+        about is flagged.
+        """
+        size = len(series)
+        data_type = self.data_type
+        
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Screen each category once and spread the result over the codes;
+            # code -1 marks a null
+            categories = series.cat.categories
+            codes = series.cat.codes.to_numpy()
+            category_flags = self._flag_invalid(pd.Series(categories, dtype=categories.dtype))
+            return np.append(category_flags, False)[codes]
+        
+        is_text = pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+        
+        if data_type in NUMERIC_TYPES:
+            if not (pd.api.types.is_numeric_dtype(series) or is_text):
+                return np.ones(size, dtype=bool)
+            
+            numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            # Combine the type's own range with the schema's bounds
+            lower, upper = NUMERIC_TYPE_RANGES.get(data_type, (None, None))
+            if self.min_value is not None:
+                lower = self.min_value if lower is None else max(lower, self.min_value)
+            if self.max_value is not None:
+                upper = self.max_value if upper is None else min(upper, self.max_value)
+            
+            # Integer dtypes can't hold fractional values
+            integer = data_type is DataType.INTEGER and not pd.api.types.is_integer_dtype(series)
+            flagged = _flag_out_of_range(numbers, lower, upper, integer)
+            values = pd.Series(numbers, index=series.index, copy=False)
+        else:
+            # Range checks on non-numeric values are left to validate()
+            if self.min_value is not None or self.max_value is not None:
+                return np.ones(size, dtype=bool)
+            
+            values = series
+            flagged = np.zeros(size, dtype=bool)
+            
+            if data_type is DataType.STRING:
+                values = series.astype(str)
+            elif data_type is DataType.BOOLEAN:
+                if not pd.api.types.is_bool_dtype(series):
+                    return np.ones(size, dtype=bool)
+            elif data_type is DataType.DATETIME:
+                strings = _string_values(series) if is_text else None
+                if strings is not None:
+                    # Only strings in one of the accepted formats pass; each
+                    # format is tried only on the strings earlier ones missed
+                    pending = strings.len().notna().to_numpy(dtype=bool, copy=True)
+                    recognized = np.zeros(size, dtype=bool)
+                    for fmt in DATETIME_FORMATS:
+                        positions = np.flatnonzero(pending)
+                        if not len(positions):
+                            break
+                        parsed = pd.to_datetime(
+                            series.iloc[positions], format=fmt, errors='coerce'
+                        ).notna().to_numpy(dtype=bool)
+                        recognized[positions[parsed]] = True
+                        pending[positions[parsed]] = False
+                    flagged |= ~recognized
+                elif not pd.api.types.is_datetime64_any_dtype(series):
+                    return np.ones(size, dtype=bool)
+        
+        if self.allowed_values is not None:
+            flagged |= ~values.isin(self._allowed_set or self.allowed_values).to_numpy(dtype=bool)
+        
+        # Patterns only apply to string values
+        if self._compiled_pattern is not None and data_type not in NUMERIC_TYPES:
+            strings = _string_values(values) if data_type is DataType.STRING or is_text else None
+            if strings is not None:
+                flagged |= ~strings.match(self._compiled_pattern, na=True).to_numpy(dtype=bool)
+        
+        return flagged
+
 
+def _missing_required_message(col_name: str) -> str:
+    return f"Required column '{col_name}' is missing or null"
 
-@dataclass
+
+@dataclass(slots=True)
 class DatasetSchema:
     """Schema for an entire dataset"""
     name: str
@@ -170,64 +480,177 @@ class DatasetSchema:
     primary_key: Optional[List[str]] = None
     row_count_range: Optional[Tuple[int, int]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    collect_info: bool = field(default=False, compare=False)  # Report passing values under 'infos'
+    _compiled_row_validator: Optional[Callable] = field(init=False, default=None, repr=False, compare=False)
+    _by_name: Dict[str, ColumnSchema] = field(init=False, default_factory=dict, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._by_name = {col.name: col for col in self.columns}
     
     def get_column(self, column_name: str) -> Optional[ColumnSchema]:
         """Get column schema by name"""
-        for col in self.columns:
-            if col.name == column_name:
-                return col
-        return None
+        return self._by_name.get(column_name)
     
     def validate_row(self, row: Dict[str, Any]) -> Dict[str, List[Dict]]:
         """
         Validate a single row against the schema
         
         Returns:
-            Dictionary with validation results by severity
+            Dictionary with validation results by severity; 'infos' lists
+            passing values only when collect_info is set
         """
-        results = {
-            'errors': [],
-            'warnings': [],
-            'infos': []
-        }
+        if self._compiled_row_validator is None:
+            self.compile()
         
-        # Check required columns
-        for col_name in self.required_columns:
-            if col_name not in row or pd.isna(row.get(col_name)):
-                results['errors'].append({
+        return self._compiled_row_validator(row)
+    
+    def compile(self, columns: Optional[List[str]] = None) -> Callable[[Any], Dict[str, List[Dict]]]:
+        """
+        Build a row validator for this schema
+        
+        Without columns the validator takes a dict keyed by column name and is
+        stored for validate_row; call this again after changing columns,
+        required_columns or collect_info, which also refreshes get_column. With columns it
+        takes positional rows laid out in that order, such as
+        df.itertuples(index=False, name=None) rows for df.columns, so rows
+        don't need converting to dicts.
+        
+        Column names, positions, required-column messages and the bound
+        validate methods are captured once, not looked up again for every row.
+        """
+        if columns is not None:
+            return self._compile_positional(list(columns))
+        
+        self._by_name = {col.name: col for col in self.columns}
+        required_columns = tuple(
+            (col_name, _missing_required_message(col_name)) for col_name in self.required_columns
+        )
+        column_checks = tuple((col.name, col.validate) for col in self.columns)
+        collect_info = self.collect_info
+        error = ValidationSeverity.ERROR
+        warning = ValidationSeverity.WARNING
+        info = ValidationSeverity.INFO
+        
+        def validate_row(row: Dict[str, Any]) -> Dict[str, List[Dict]]:
+            errors = []
+            warnings = []
+            infos = []
+            
+            # Check required columns
+            for col_name, message in required_columns:
+                # A missing column reads as None
+                if _is_null(row.get(col_name)):
+                    errors.append({
+                        'column': col_name,
+                        'message': message,
+                        'value': None
+                    })
+            
+            # Validate each column that exists in the row
+            for col_name, validate in column_checks:
+                if col_name in row:
+                    value = row[col_name]
+                    is_valid, message, severity = validate(value)
+                    if is_valid and not collect_info:
+                        continue
+                    
+                    result_item = {
+                        'column': col_name,
+                        'message': message,
+                        'value': value
+                    }
+                    
+                    if not is_valid:
+                        if severity is error:
+                            errors.append(result_item)
+                        elif severity is warning:
+                            warnings.append(result_item)
+                        else:
+                            infos.append(result_item)
+                    elif severity is info:
+                        infos.append(result_item)
+            
+            return {
+                'errors': errors,
+                'warnings': warnings,
+                'infos': infos
+            }
+        
+        self._compiled_row_validator = validate_row
+        return validate_row
+    
+    def _compile_positional(self, columns: List[str]) -> Callable[[tuple], Dict[str, List[Dict]]]:
+        """Row validator for positional rows laid out like columns"""
+        # Later duplicates win, as with row.to_dict()
+        positions = {col_name: position for position, col_name in enumerate(columns)}
+        required_columns = tuple(
+            (col_name, positions.get(col_name), _missing_required_message(col_name))
+            for col_name in self.required_columns
+        )
+        column_checks = tuple(
+            (col.name, positions[col.name], col.validate)
+            for col in self.columns
+            if col.name in positions
+        )
+        collect_info = self.collect_info
+        error = ValidationSeverity.ERROR
+        warning = ValidationSeverity.WARNING
+        info = ValidationSeverity.INFO
+        
+        def validate_values(values: tuple) -> Dict[str, List[Dict]]:
+            errors = [
+                {
                     'column': col_name,
-                    'message': f"Required column '{col_name}' is missing or null",
+                    'message': message,
                     'value': None
-                })
-        
-        # Validate each column that exists in the row
-        for col_schema in self.columns:
-            if col_schema.name in row:
-                value = row[col_schema.name]
-                is_valid, message, severity = col_schema.validate(value)
+                }
+                for col_name, position, message in required_columns
+                if position is None or _is_null(values[position])
+            ]
+            warnings = []
+            infos = []
+            
+            for col_name, position, validate in column_checks:
+                value = values[position]
+                is_valid, message, severity = validate(value)
+                if is_valid and not collect_info:
+                    continue
                 
                 result_item = {
-                    'column': col_schema.name,
+                    'column': col_name,
                     'message': message,
                     'value': value
                 }
                 
                 if not is_valid:
-                    if severity == ValidationSeverity.ERROR:
-                        results['errors'].append(result_item)
-                    elif severity == ValidationSeverity.WARNING:
-                        results['warnings'].append(result_item)
+                    if severity is error:
+                        errors.append(result_item)
+                    elif severity is warning:
+                        warnings.append(result_item)
                     else:
-                        results['infos'].append(result_item)
-                elif severity == ValidationSeverity.INFO:
-                    results['infos'].append(result_item)
+                        infos.append(result_item)
+                elif severity is info:
+                    infos.append(result_item)
+            
+            return {
+                'errors': errors,
+                'warnings': warnings,
+                'infos': infos
+            }
         
-        return results
+        return validate_values
     
-    def validate_dataframe(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def validate_dataframe(self, df: pd.DataFrame,
+                           max_recorded_issues: Optional[int] = 1000) -> Dict[str, Any]:
         """
         Validate an entire DataFrame against the schema
         
+        Args:
+            df: Data to validate
+            max_recorded_issues: Most rows to list in 'row_validation' (None
+                for all). The summary always counts every row; use
+                iter_validate to stream all of them.
+        
         Returns:
             Comprehensive validation report
         """
@@ -266,7 +689,7 @@ class DatasetSchema:
         
         # Check for missing columns
         df_columns = set(df.columns)
-        schema_columns = {col.name for col in self.columns}
+        schema_columns = self._by_name.keys()
         
         missing_columns = schema_columns - df_columns
         extra_columns = df_columns - schema_columns
@@ -285,31 +708,36 @@ class DatasetSchema:
             validation_results['extra_columns'] = list(extra_columns)
             logger.warning(f"Found extra columns not in schema: {extra_columns}")
         
-        # Validate each row
-        for idx, row in df.iterrows():
-            row_dict = row.to_dict()
-            row_results = self.validate_row(row_dict)
-            
-            # Count issues
-            validation_results['summary']['errors'] += len(row_results['errors'])
-            validation_results['summary']['warnings'] += len(row_results['warnings'])
-            validation_results['summary']['infos'] += len(row_results['infos'])
-            
-            # Store row validation if there are issues
-            if row_results['errors'] or row_results['warnings']:
-                validation_results['row_validation'].append({
-                    'row_index': idx,
-                    'errors': row_results['errors'],
-                    'warnings': row_results['warnings']
-                })
-            
-            # Update column stats
-            for col_schema in self.columns:
-                col_name = col_schema.name
-                if col_name in df.columns:
-                    value = row_dict.get(col_name)
-                    if pd.isna(value):
-                        validation_results['column_stats'][col_name]['null_count'] += 1
+        # Validate column by column, then collect the issues for each row
+        summary = validation_results['summary']
+        required_nulls, column_issues = self._validate_columns(df)
+        
+        for null_mask in required_nulls.values():
+            summary['errors'] += int(null_mask.sum())
+        
+        column_stats = validation_results['column_stats']
+        for col_name, (column, is_valid, _, error_mask, warning_mask) in column_issues.items():
+            stats = column_stats[col_name]
+            stats['null_count'] = int(column.isna().sum())
+            stats['error_count'] = int(error_mask.sum())
+            stats['warning_count'] = int(warning_mask.sum())
+            summary['infos'] += int(is_valid.sum())
+        
+        summary['errors'] += sum(stats['error_count'] for stats in column_stats.values())
+        summary['warnings'] += sum(stats['warning_count'] for stats in column_stats.values())
+        
+        has_error, has_issue = self._row_issue_masks(len(df), required_nulls, column_issues)
+        issue_rows = np.flatnonzero(has_issue)
+        summary['rows_with_errors'] = int(has_error.sum())
+        summary['rows_with_issues'] = len(issue_rows)
+        
+        if max_recorded_issues is not None and len(issue_rows) > max_recorded_issues:
+            issue_rows = issue_rows[:max_recorded_issues]
+            validation_results['row_validation_truncated'] = True
+        
+        validation_results['row_validation'] = list(
+            self._iter_row_issues(df, required_nulls, column_issues, issue_rows)
+        )
         
         # Check row count range
         if self.row_count_range:
@@ -330,26 +758,131 @@ class DatasetSchema:
         
         return validation_results
     
+    def iter_validate(self, df: pd.DataFrame, chunk_size: int = 10000) -> Iterator[Dict]:
+        """
+        Yield a row_validation entry for every row with issues
+        
+        Rows are validated chunk_size at a time, so memory stays bounded no
+        matter how many rows have issues. Entries match validate_dataframe's.
+        """
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            required_nulls, column_issues = self._validate_columns(chunk)
+            _, has_issue = self._row_issue_masks(len(chunk), required_nulls, column_issues)
+            
+            yield from self._iter_row_issues(chunk, required_nulls, column_issues,
+                                             np.flatnonzero(has_issue))
+    
+    def _validate_columns(self, df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], Dict[str, tuple]]:
+        """
+        Run the vectorized checks for each schema column present in df
+        
+        Returns:
+            Tuple of (null mask per required column, and per validated column
+            a tuple of (column, is_valid, messages, error_mask, warning_mask))
+        """
+        df_columns = set(df.columns)
+        
+        required_nulls = {}
+        for col_name in self.required_columns:
+            if col_name in df_columns:
+                required_nulls[col_name] = df[col_name].isna().to_numpy(dtype=bool)
+            else:
+                required_nulls[col_name] = np.ones(len(df), dtype=bool)
+        
+        column_issues = {}
+        for col_name, col_schema in self._by_name.items():
+            if col_name not in df_columns:
+                continue
+            
+            column = df[col_name]
+            if not len(column):
+                # Nothing to check; empty results keep the column in the report
+                no_rows = np.zeros(0, dtype=bool)
+                column_issues[col_name] = (column, no_rows, np.empty(0, dtype=object), no_rows, no_rows)
+                continue
+            
+            results = col_schema.validate_series(column)
+            is_valid = results['is_valid'].to_numpy(dtype=bool)
+            severities = results['severity'].to_numpy()
+            
+            column_issues[col_name] = (
+                column,
+                is_valid,
+                results['message'].to_numpy(),
+                ~is_valid & (severities == ValidationSeverity.ERROR),
+                ~is_valid & (severities == ValidationSeverity.WARNING)
+            )
+        
+        return required_nulls, column_issues
+    
+    @staticmethod
+    def _row_issue_masks(row_count: int,
+                         required_nulls: Dict[str, np.ndarray],
+                         column_issues: Dict[str, tuple]) -> Tuple[np.ndarray, np.ndarray]:
+        """Masks of rows with any error, and of rows with any error or warning"""
+        error_masks = list(required_nulls.values())
+        warning_masks = []
+        for _, _, _, error_mask, warning_mask in column_issues.values():
+            error_masks.append(error_mask)
+            warning_masks.append(warning_mask)
+        
+        has_error = reduce(np.logical_or, error_masks, np.zeros(row_count, dtype=bool))
+        has_issue = reduce(np.logical_or, warning_masks, has_error)
+        
+        return has_error, has_issue
+    
+    @staticmethod
+    def _iter_row_issues(df: pd.DataFrame,
+                         required_nulls: Dict[str, np.ndarray],
+                         column_issues: Dict[str, tuple],
+                         issue_rows: np.ndarray) -> Iterator[Dict]:
+        """Build the row_validation entries for the rows at positions issue_rows"""
+        # Look up offending cell values for those rows only
+        issue_values = {
+            col_name: dict(zip(issue_rows, column.iloc[issue_rows].tolist()))
+            for col_name, (column, _, _, _, _) in column_issues.items()
+        }
+        required_checks = [
+            (col_name, _missing_required_message(col_name), null_mask)
+            for col_name, null_mask in required_nulls.items()
+        ]
+        row_labels = df.index[issue_rows]
+        
+        for position, idx in zip(issue_rows, row_labels):
+            errors = [
+                {
+                    'column': col_name,
+                    'message': message,
+                    'value': None
+                }
+                for col_name, message, null_mask in required_checks
+                if null_mask[position]
+            ]
+            warnings = []
+            
+            for col_name, (_, _, messages, error_mask, warning_mask) in column_issues.items():
+                if error_mask[position] or warning_mask[position]:
+                    issues = errors if error_mask[position] else warnings
+                    issues.append({
+                        'column': col_name,
+                        'message': messages[position],
+                        'value': issue_values[col_name][position]
+                    })
+            
+            yield {
+                'row_index': idx,
+                'errors': errors,
+                'warnings': warnings
+            }
+    
     def to_dict(self) -> Dict:
         """Convert schema to dictionary"""
         return {
             'name': self.name,
             'version': self.version,
             'description': self.description,
-            'columns': [
-                {
-                    'name': col.name,
-                    'data_type': col.data_type.value,
-                    'required': col.required,
-                    'nullable': col.nullable,
-                    'min_value': col.min_value,
-                    'max_value': col.max_value,
-                    'allowed_values': col.allowed_values,
-                    'pattern': col.pattern,
-                    'description': col.description
-                }
-                for col in self.columns
-            ],
+            'columns': [col.to_dict() for col in self.columns],
             'required_columns': self.required_columns,
             'primary_key': self.primary_key,
             'row_count_range': self.row_count_range,
@@ -359,32 +892,19 @@ class DatasetSchema:
     def to_json(self, filepath: Optional[str] = None) -> str:
         """Convert schema to JSON"""
         schema_dict = self.to_dict()
-        json_str = json.dumps(schema_dict, indent=2, default=str)
+        json_bytes = orjson.dumps(schema_dict, default=str, option=JSON_OPTIONS)
         
         if filepath:
-            with open(filepath, 'w') as f:
-                f.write(json_str)
+            with open(filepath, 'wb') as f:
+                f.write(json_bytes)
             logger.info(f"Schema saved to {filepath}")
         
-        return json_str
+        return json_bytes.decode('utf-8')
     
     @classmethod
     def from_dict(cls, schema_dict: Dict) -> 'DatasetSchema':
         """Create schema from dictionary"""
-        columns = []
-        for col_dict in schema_dict.get('columns', []):
-            column = ColumnSchema(
-                name=col_dict['name'],
-                data_type=DataType(col_dict['data_type']),
-                required=col_dict.get('required', True),
-                nullable=col_dict.get('nullable', False),
-                min_value=col_dict.get('min_value'),
-                max_value=col_dict.get('max_value'),
-                allowed_values=col_dict.get('allowed_values'),
-                pattern=col_dict.get('pattern'),
-                description=col_dict.get('description', '')
-            )
-            columns.append(column)
+        columns = [ColumnSchema.from_dict(col_dict) for col_dict in schema_dict.get('columns', [])]
         
         return cls(
             name=schema_dict['name'],
@@ -400,238 +920,249 @@ class DatasetSchema:
     @classmethod
     def from_json(cls, filepath: str) -> 'DatasetSchema':
         """Load schema from JSON file"""
-        with open(filepath, 'r') as f:
-            schema_dict = json.load(f)
+        with open(filepath, 'rb') as f:
+            schema_dict = orjson.loads(f.read())
         return cls.from_dict(schema_dict)
 
 
+def _daily_health_schema() -> DatasetSchema:
+    """Schema for daily livestock health metrics"""
+    return DatasetSchema(
+        name="daily_health_metrics",
+        version="1.0",
+        description="Daily health metrics for livestock",
+        columns=[
+            ColumnSchema(
+                name="farm_id",
+                data_type=DataType.STRING,
+                pattern=r'^FARM-\d{4}$',
+                description="Farm identifier"
+            ),
+            ColumnSchema(
+                name="date",
+                data_type=DataType.DATETIME,
+                description="Date of measurement"
+            ),
+            ColumnSchema(
+                name="animal_type",
+                data_type=DataType.CATEGORICAL,
+                allowed_values=["cattle", "swine", "poultry", "sheep", "goat"],
+                description="Type of animal"
+            ),
+            ColumnSchema(
+                name="total_animals",
+                data_type=DataType.INTEGER,
+                min_value=0,
+                max_value=10000,
+                description="Total number of animals"
+            ),
+            ColumnSchema(
+                name="sick_animals",
+                data_type=DataType.INTEGER,
+                min_value=0,
+                description="Number of sick animals"
+            ),
+            ColumnSchema(
+                name="deceased_animals",
+                data_type=DataType.INTEGER,
+                min_value=0,
+                description="Number of deceased animals"
+            ),
+            ColumnSchema(
+                name="avg_temperature",
+                data_type=DataType.TEMPERATURE,
+                min_value=35,
+                max_value=45,
+                description="Average body temperature (°C)"
+            ),
+            ColumnSchema(
+                name="feed_intake_percent",
+                data_type=DataType.PERCENTAGE,
+                description="Percentage of normal feed intake"
+            ),
+            ColumnSchema(
+                name="water_intake_percent",
+                data_type=DataType.PERCENTAGE,
+                description="Percentage of normal water intake"
+            ),
+            ColumnSchema(
+                name="activity_level",
+                data_type=DataType.FLOAT,
+                min_value=0,
+                max_value=10,
+                description="Activity level score (0-10)"
+            ),
+            ColumnSchema(
+                name="location_lat",
+                data_type=DataType.FLOAT,
+                min_value=-90,
+                max_value=90,
+                description="Latitude"
+            ),
+            ColumnSchema(
+                name="location_lon",
+                data_type=DataType.FLOAT,
+                min_value=-180,
+                max_value=180,
+                description="Longitude"
+            )
+        ],
+        required_columns=["farm_id", "date", "animal_type", "total_animals"],
+        primary_key=["farm_id", "date", "animal_type"],
+        row_count_range=(1, 1000)
+    )
+
+
+def _outbreak_alerts_schema() -> DatasetSchema:
+    """Schema for outbreak alerts"""
+    return DatasetSchema(
+        name="outbreak_alerts",
+        version="1.0",
+        description="Outbreak alert records",
+        columns=[
+            ColumnSchema(
+                name="alert_id",
+                data_type=DataType.STRING,
+                pattern=r'^ALERT-\d{8}-\d{6}$',
+                description="Unique alert identifier"
+            ),
+            ColumnSchema(
+                name="timestamp",
+                data_type=DataType.DATETIME,
+                description="Alert timestamp"
+            ),
+            ColumnSchema(
+                name="farm_id",
+                data_type=DataType.STRING,
+                description="Farm identifier"
+            ),
+            ColumnSchema(
+                name="severity",
+                data_type=DataType.CATEGORICAL,
+                allowed_values=["low", "medium", "high", "critical"],
+                description="Alert severity"
+            ),
+            ColumnSchema(
+                name="anomaly_score",
+                data_type=DataType.FLOAT,
+                min_value=0,
+                max_value=1,
+                description="Anomaly detection score"
+            ),
+            ColumnSchema(
+                name="sick_count",
+                data_type=DataType.INTEGER,
+                min_value=0,
+                description="Number of sick animals"
+            ),
+            ColumnSchema(
+                name="description",
+                data_type=DataType.STRING,
+                nullable=True,
+                description="Alert description"
+            ),
+            ColumnSchema(
+                name="status",
+                data_type=DataType.CATEGORICAL,
+                allowed_values=["new", "investigating", "confirmed", "false_positive", "resolved"],
+                description="Alert status"
+            )
+        ],
+        required_columns=["alert_id", "timestamp", "farm_id", "severity"],
+        primary_key=["alert_id"]
+    )
+
+
+def _environmental_schema() -> DatasetSchema:
+    """Schema for environmental data"""
+    return DatasetSchema(
+        name="environmental_data",
+        version="1.0",
+        description="Environmental conditions data",
+        columns=[
+            ColumnSchema(
+                name="location_id",
+                data_type=DataType.STRING,
+                description="Location identifier"
+            ),
+            ColumnSchema(
+                name="timestamp",
+                data_type=DataType.DATETIME,
+                description="Measurement timestamp"
+            ),
+            ColumnSchema(
+                name="temperature",
+                data_type=DataType.TEMPERATURE,
+                min_value=-30,
+                max_value=50,
+                description="Ambient temperature (°C)"
+            ),
+            ColumnSchema(
+                name="humidity",
+                data_type=DataType.PERCENTAGE,
+                description="Relative humidity (%)"
+            ),
+            ColumnSchema(
+                name="air_quality_index",
+                data_type=DataType.FLOAT,
+                min_value=0,
+                max_value=500,
+                description="Air quality index"
+            ),
+            ColumnSchema(
+                name="precipitation_mm",
+                data_type=DataType.FLOAT,
+                min_value=0,
+                description="Precipitation in mm"
+            ),
+            ColumnSchema(
+                name="wind_speed",
+                data_type=DataType.FLOAT,
+                min_value=0,
+                max_value=200,
+                description="Wind speed (km/h)"
+            )
+        ],
+        required_columns=["location_id", "timestamp", "temperature"],
+        primary_key=["location_id", "timestamp"]
+    )
+
+
+# Default schemas by name, built the first time a registry asks for them
+_DEFAULT_SCHEMAS: Dict[str, Callable[[], DatasetSchema]] = {
+    'daily_health_metrics': _daily_health_schema,
+    'outbreak_alerts': _outbreak_alerts_schema,
+    'environmental_data': _environmental_schema
+}
+
+
 class SchemaRegistry:
     """Registry for managing multiple schemas"""
     
     def __init__(self):
         self.schemas: Dict[str, DatasetSchema] = {}
-        self._initialize_default_schemas()
-    
-    def _initialize_default_schemas(self) -> None:
-        """Initialize default schemas for livestock outbreak detection"""
-        
-        # Schema for daily livestock health metrics
-        daily_health_schema = DatasetSchema(
-            name="daily_health_metrics",
-            version="1.0",
-            description="Daily health metrics for livestock",
-            columns=[
-                ColumnSchema(
-                    name="farm_id",
-                    data_type=DataType.STRING,
-                    pattern=r'^FARM-\d{4}$',
-                    description="Farm identifier"
-                ),
-                ColumnSchema(
-                    name="date",
-                    data_type=DataType.DATETIME,
-                    description="Date of measurement"
-                ),
-                ColumnSchema(
-                    name="animal_type",
-                    data_type=DataType.CATEGORICAL,
-                    allowed_values=["cattle", "swine", "poultry", "sheep", "goat"],
-                    description="Type of animal"
-                ),
-                ColumnSchema(
-                    name="total_animals",
-                    data_type=DataType.INTEGER,
-                    min_value=0,
-                    max_value=10000,
-                    description="Total number of animals"
-                ),
-                ColumnSchema(
-                    name="sick_animals",
-                    data_type=DataType.INTEGER,
-                    min_value=0,
-                    description="Number of sick animals"
-                ),
-                ColumnSchema(
-                    name="deceased_animals",
-                    data_type=DataType.INTEGER,
-                    min_value=0,
-                    description="Number of deceased animals"
-                ),
-                ColumnSchema(
-                    name="avg_temperature",
-                    data_type=DataType.TEMPERATURE,
-                    min_value=35,
-                    max_value=45,
-                    description="Average body temperature (°C)"
-                ),
-                ColumnSchema(
-                    name="feed_intake_percent",
-                    data_type=DataType.PERCENTAGE,
-                    description="Percentage of normal feed intake"
-                ),
-                ColumnSchema(
-                    name="water_intake_percent",
-                    data_type=DataType.PERCENTAGE,
-                    description="Percentage of normal water intake"
-                ),
-                ColumnSchema(
-                    name="activity_level",
-                    data_type=DataType.FLOAT,
-                    min_value=0,
-                    max_value=10,
-                    description="Activity level score (0-10)"
-                ),
-                ColumnSchema(
-                    name="location_lat",
-                    data_type=DataType.FLOAT,
-                    min_value=-90,
-                    max_value=90,
-                    description="Latitude"
-                ),
-                ColumnSchema(
-                    name="location_lon",
-                    data_type=DataType.FLOAT,
-                    min_value=-180,
-                    max_value=180,
-                    description="Longitude"
-                )
-            ],
-            required_columns=["farm_id", "date", "animal_type", "total_animals"],
-            primary_key=["farm_id", "date", "animal_type"],
-            row_count_range=(1, 1000)
-        )
-        
-        self.register_schema(daily_health_schema)
-        
-        # Schema for outbreak alerts
-        alert_schema = DatasetSchema(
-            name="outbreak_alerts",
-            version="1.0",
-            description="Outbreak alert records",
-            columns=[
-                ColumnSchema(
-                    name="alert_id",
-                    data_type=DataType.STRING,
-                    pattern=r'^ALERT-\d{8}-\d{6}$',
-                    description="Unique alert identifier"
-                ),
-                ColumnSchema(
-                    name="timestamp",
-                    data_type=DataType.DATETIME,
-                    description="Alert timestamp"
-                ),
-                ColumnSchema(
-                    name="farm_id",
-                    data_type=DataType.STRING,
-                    description="Farm identifier"
-                ),
-                ColumnSchema(
-                    name="severity",
-                    data_type=DataType.CATEGORICAL,
-                    allowed_values=["low", "medium", "high", "critical"],
-                    description="Alert severity"
-                ),
-                ColumnSchema(
-                    name="anomaly_score",
-                    data_type=DataType.FLOAT,
-                    min_value=0,
-                    max_value=1,
-                    description="Anomaly detection score"
-                ),
-                ColumnSchema(
-                    name="sick_count",
-                    data_type=DataType.INTEGER,
-                    min_value=0,
-                    description="Number of sick animals"
-                ),
-                ColumnSchema(
-                    name="description",
-                    data_type=DataType.STRING,
-                    nullable=True,
-                    description="Alert description"
-                ),
-                ColumnSchema(
-                    name="status",
-                    data_type=DataType.CATEGORICAL,
-                    allowed_values=["new", "investigating", "confirmed", "false_positive", "resolved"],
-                    description="Alert status"
-                )
-            ],
-            required_columns=["alert_id", "timestamp", "farm_id", "severity"],
-            primary_key=["alert_id"]
-        )
-        
-        self.register_schema(alert_schema)
-        
-        # Schema for environmental data
-        environmental_schema = DatasetSchema(
-            name="environmental_data",
-            version="1.0",
-            description="Environmental conditions data",
-            columns=[
-                ColumnSchema(
-                    name="location_id",
-                    data_type=DataType.STRING,
-                    description="Location identifier"
-                ),
-                ColumnSchema(
-                    name="timestamp",
-                    data_type=DataType.DATETIME,
-                    description="Measurement timestamp"
-                ),
-                ColumnSchema(
-                    name="temperature",
-                    data_type=DataType.TEMPERATURE,
-                    min_value=-30,
-                    max_value=50,
-                    description="Ambient temperature (°C)"
-                ),
-                ColumnSchema(
-                    name="humidity",
-                    data_type=DataType.PERCENTAGE,
-                    description="Relative humidity (%)"
-                ),
-                ColumnSchema(
-                    name="air_quality_index",
-                    data_type=DataType.FLOAT,
-                    min_value=0,
-                    max_value=500,
-                    description="Air quality index"
-                ),
-                ColumnSchema(
-                    name="precipitation_mm",
-                    data_type=DataType.FLOAT,
-                    min_value=0,
-                    description="Precipitation in mm"
-                ),
-                ColumnSchema(
-                    name="wind_speed",
-                    data_type=DataType.FLOAT,
-                    min_value=0,
-                    max_value=200,
-                    description="Wind speed (km/h)"
-                )
-            ],
-            required_columns=["location_id", "timestamp", "temperature"],
-            primary_key=["location_id", "timestamp"]
-        )
-        
-        self.register_schema(environmental_schema)
-        
-        logger.info(f"Initialized schema registry with {len(self.schemas)} schemas")
+        # Defaults not built yet; get_schema builds them on demand
+        self._default_builders: Dict[str, Callable[[], DatasetSchema]] = dict(_DEFAULT_SCHEMAS)
     
     def register_schema(self, schema: DatasetSchema) -> None:
         """Register a new schema"""
         self.schemas[schema.name] = schema
+        # A registered schema replaces the default of the same name
+        self._default_builders.pop(schema.name, None)
         logger.info(f"Registered schema: {schema.name} v{schema.version}")
     
     def get_schema(self, schema_name: str) -> Optional[DatasetSchema]:
         """Get schema by name"""
-        return self.schemas.get(schema_name)
+        schema = self.schemas.get(schema_name)
+        if schema is None and schema_name in self._default_builders:
+            schema = self._default_builders[schema_name]()
+            self.register_schema(schema)
+        return schema
     
     def list_schemas(self) -> List[str]:
         """List all registered schema names"""
-        return list(self.schemas.keys())
+        # Defaults first, whether or not they have been built yet
+        return list(dict.fromkeys([*_DEFAULT_SCHEMAS, *self.schemas]))
     
     def validate_data(self, schema_name: str, data: Union[pd.DataFrame, Dict, List]) -> Dict[str, Any]:
         """
@@ -671,21 +1202,13 @@ class SchemaRegistry:
             return False
 
 
-# Global schema registry instance
-_schema_registry: Optional[SchemaRegistry] = None
-
-
+# Global schema registry instance, created on first use
+@cache
 def get_schema_registry() -> SchemaRegistry:
     """Get or create the global schema registry"""
-    global _schema_registry
-    
-    if _schema_registry is None:
-        _schema_registry = SchemaRegistry()
-    
-    return _schema_registry
+    return SchemaRegistry()
 
 
 def reset_schema_registry() -> None:
     """Reset the global schema registry (for testing)"""
-    global _schema_registry
-    _schema_registry = None
\ No newline at end of file
+    get_schema_registry.cache_clear()
@@ -3,19 +3,71 @@ Data validator with advanced validation capabilities
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Union, Callable
+from typing import Dict, List, Optional, Any, Union, Callable, Tuple
 from datetime import datetime, timedelta
 import logging
+import os
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from dataclasses import dataclass, field
-import json
+import orjson
 
 from .schema import (
     DatasetSchema, ColumnSchema, DataType, ValidationSeverity,
-    get_schema_registry
+    get_schema_registry, JSON_OPTIONS
 )
 
 logger = logging.getLogger(__name__)
 
+# Custom rules run on threads once a frame has this many rows; NumPy releases
+# the GIL while scanning columns, and smaller frames aren't worth the handoff
+PARALLEL_RULE_MIN_ROWS = 10_000
+
+# Lowest quality score for each grade above F
+QUALITY_GRADE_THRESHOLDS = (0.6, 0.7, 0.8, 0.9)
+QUALITY_GRADES = "FDCBA"
+
+
+def _numeric_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Column as a float array with nulls as NaN, which fail every comparison"""
+    return df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _count_exceeding(df: pd.DataFrame, column: str, limit_column: str) -> int:
+    """Number of rows where column is greater than limit_column"""
+    return int(np.count_nonzero(_numeric_values(df, column) > _numeric_values(df, limit_column)))
+
+
+def _run_rule(rule: 'ValidationRule', df: pd.DataFrame) -> Tuple[bool, str, Optional[Exception]]:
+    """Apply a rule, returning what it raised instead of raising"""
+    try:
+        passed, message = rule.check_fn(df)
+        return passed, message, None
+    except Exception as e:
+        return False, "", e
+
+
+def _count_duplicate_keys(df: pd.DataFrame, key_columns: List[str]) -> int:
+    """Number of rows sharing their key with another row, as duplicated(keep=False) counts"""
+    if len(key_columns) == 1:
+        # One column can be hashed directly, without factorizing first
+        return int(df[key_columns[0]].duplicated(keep=False).sum())
+    
+    # Fold each column's factorized codes into one exact integer key per row
+    keys = np.zeros(len(df), dtype=np.int64)
+    key_space = 1
+    for col_name in key_columns:
+        codes, uniques = pd.factorize(df[col_name], use_na_sentinel=False)
+        key_space *= max(len(uniques), 1)
+        if key_space > np.iinfo(np.int64).max:
+            # Too many combinations for one int64; pandas compresses the codes
+            return int(df.duplicated(subset=key_columns, keep=False).sum())
+        keys = keys * len(uniques) + codes
+    
+    return int(pd.Series(keys, copy=False).duplicated(keep=False).sum())
+
 
 @dataclass
 class ValidationRule:
@@ -37,6 +89,8 @@ class DataValidator:
         self.config = config or {}
         self.schema_registry = get_schema_registry()
         self.custom_rules: Dict[str, ValidationRule] = {}
+        # Rules paired with the columns each lacks, per column set; see _plan_rules
+        self._rule_plans: Dict[frozenset, List[Tuple[str, ValidationRule, List[str]]]] = {}
         self._initialize_default_rules()
         
         logger.info("Data validator initialized")
@@ -47,9 +101,9 @@ class DataValidator:
         # Rule: Sick animals cannot exceed total animals
         def sick_vs_total_rule(df: pd.DataFrame) -> Tuple[bool, str]:
             if 'sick_animals' in df.columns and 'total_animals' in df.columns:
-                invalid_rows = df[df['sick_animals'] > df['total_animals']]
-                if len(invalid_rows) > 0:
-                    return False, f"Sick animals exceed total animals in {len(invalid_rows)} rows"
+                invalid_rows = _count_exceeding(df, 'sick_animals', 'total_animals')
+                if invalid_rows > 0:
+                    return False, f"Sick animals exceed total animals in {invalid_rows} rows"
             return True, "Sick animals validation passed"
         
         self.register_rule(ValidationRule(
@@ -63,9 +117,9 @@ class DataValidator:
         # Rule: Deceased animals cannot exceed sick animals
         def deceased_vs_sick_rule(df: pd.DataFrame) -> Tuple[bool, str]:
             if 'deceased_animals' in df.columns and 'sick_animals' in df.columns:
-                invalid_rows = df[df['deceased_animals'] > df['sick_animals']]
-                if len(invalid_rows) > 0:
-                    return False, f"Deceased animals exceed sick animals in {len(invalid_rows)} rows"
+                invalid_rows = _count_exceeding(df, 'deceased_animals', 'sick_animals')
+                if invalid_rows > 0:
+                    return False, f"Deceased animals exceed sick animals in {invalid_rows} rows"
             return True, "Deceased animals validation passed"
         
         self.register_rule(ValidationRule(
@@ -79,17 +133,17 @@ class DataValidator:
         # Rule: Activity level should correlate with sickness
         def activity_sickness_rule(df: pd.DataFrame) -> Tuple[bool, str]:
             if 'activity_level' in df.columns and 'sick_animals' in df.columns and 'total_animals' in df.columns:
-                # Calculate sickness percentage
-                df = df.copy()
-                df['sickness_pct'] = df['sick_animals'] / df['total_animals'] * 100
+                # Calculate sickness percentage on plain arrays; no frame copy needed
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    sickness_pct = _numeric_values(df, 'sick_animals') / _numeric_values(df, 'total_animals') * 100
                 
                 # Find rows where high sickness but normal activity (possible data issue)
-                high_sickness = df['sickness_pct'] > 20
-                normal_activity = df['activity_level'] > 7
-                suspicious = df[high_sickness & normal_activity]
+                high_sickness = sickness_pct > 20
+                normal_activity = _numeric_values(df, 'activity_level') > 7
+                suspicious = int(np.count_nonzero(high_sickness & normal_activity))
                 
-                if len(suspicious) > 0:
-                    return False, f"High sickness with normal activity in {len(suspicious)} rows"
+                if suspicious > 0:
+                    return False, f"High sickness with normal activity in {suspicious} rows"
             return True, "Activity-sickness correlation passed"
         
         self.register_rule(ValidationRule(
@@ -104,9 +158,8 @@ class DataValidator:
         def duplicate_primary_key_rule(df: pd.DataFrame, schema: DatasetSchema) -> Callable[[pd.DataFrame], Tuple[bool, str]]:
             def check(df_inner: pd.DataFrame) -> Tuple[bool, str]:
                 if schema.primary_key:
-                    duplicates = df_inner.duplicated(subset=schema.primary_key, keep=False)
-                    if duplicates.any():
-                        duplicate_count = duplicates.sum()
+                    duplicate_count = _count_duplicate_keys(df_inner, schema.primary_key)
+                    if duplicate_count > 0:
                         return False, f"Found {duplicate_count} duplicate rows based on primary key"
                 return True, "No duplicate primary keys found"
             return check
@@ -119,8 +172,26 @@ class DataValidator:
     def register_rule(self, rule: ValidationRule) -> None:
         """Register a custom validation rule"""
         self.custom_rules[rule.name] = rule
+        self._rule_plans.clear()
         logger.info(f"Registered validation rule: {rule.name}")
     
+    def _plan_rules(self, columns: pd.Index) -> List[Tuple[str, ValidationRule, List[str]]]:
+        """
+        Pair each custom rule with the columns it needs that are missing
+        
+        The result only depends on the set of columns, so it is cached per set
+        until register_rule changes the rules.
+        """
+        key = frozenset(columns)
+        plan = self._rule_plans.get(key)
+        if plan is None:
+            plan = [
+                (rule_name, rule, [col for col in rule.columns if col not in key])
+                for rule_name, rule in self.custom_rules.items()
+            ]
+            self._rule_plans[key] = plan
+        return plan
+    
     def validate_with_schema(self, schema_name: str, data: pd.DataFrame, 
                            apply_custom_rules: bool = True) -> Dict[str, Any]:
         """
@@ -139,11 +210,11 @@ class DataValidator:
         # Run schema validation
         schema_report = schema.validate_dataframe(data)
         
-        # Initialize validation report
+        # Initialize validation report, stamped with the schema check's time
         validation_report = {
             'schema_name': schema_name,
-            'schema_version': schema.version,
-            'timestamp': datetime.now().isoformat(),
+            'schema_version': schema_report['schema_version'],
+            'timestamp': schema_report['timestamp'],
             'schema_validation': schema_report,
             'custom_rules': {},
             'summary': {
@@ -160,46 +231,55 @@ class DataValidator:
         if apply_custom_rules:
             rule_results = {}
             
-            # Apply general rules
-            for rule_name, rule in self.custom_rules.items():
-                # Check if rule applies to this data (has required columns)
-                if rule.columns:
-                    missing_columns = [col for col in rule.columns if col not in data.columns]
-                    if missing_columns:
-                        rule_results[rule_name] = {
-                            'passed': True,
-                            'message': f"Skipped - missing columns: {missing_columns}",
-                            'severity': 'info'
-                        }
-                        continue
-                
-                # Apply the rule
-                try:
-                    passed, message = rule.check_fn(data)
+            # Skip rules whose columns aren't all in the data
+            applicable_rules = []
+            for rule_name, rule, missing_columns in self._plan_rules(data.columns):
+                if missing_columns:
                     rule_results[rule_name] = {
-                        'passed': passed,
-                        'message': message,
-                        'severity': rule.severity.value
+                        'passed': True,
+                        'message': f"Skipped - missing columns: {missing_columns}",
+                        'severity': 'info'
                     }
-                    
-                    if not passed:
-                        if rule.severity == ValidationSeverity.ERROR:
-                            validation_report['summary']['custom_rule_errors'] += 1
-                            validation_report['summary']['overall_is_valid'] = False
-                        elif rule.severity == ValidationSeverity.WARNING:
-                            validation_report['summary']['custom_rule_warnings'] += 1
-                
-                except Exception as e:
+                else:
+                    # Placeholder keeps the results in rule order
+                    rule_results[rule_name] = None
+                    applicable_rules.append((rule_name, rule))
+            
+            # Apply general rules
+            outcomes = self._run_rules([rule for _, rule in applicable_rules], data)
+            for (rule_name, rule), (passed, message, error) in zip(applicable_rules, outcomes):
+                if error is not None:
                     rule_results[rule_name] = {
                         'passed': False,
-                        'message': f"Rule execution failed: {str(e)}",
+                        'message': f"Rule execution failed: {str(error)}",
                         'severity': 'error'
                     }
                     validation_report['summary']['custom_rule_errors'] += 1
                     validation_report['summary']['overall_is_valid'] = False
+                    continue
+                
+                rule_results[rule_name] = {
+                    'passed': passed,
+                    'message': message,
+                    'severity': rule.severity.value
+                }
+                
+                if not passed:
+                    if rule.severity is ValidationSeverity.ERROR:
+                        validation_report['summary']['custom_rule_errors'] += 1
+                        validation_report['summary']['overall_is_valid'] = False
+                    elif rule.severity is ValidationSeverity.WARNING:
+                        validation_report['summary']['custom_rule_warnings'] += 1
             
             # Apply schema-specific duplicate rule
-            if schema.primary_key:
+            missing_key_columns = [col for col in schema.primary_key or [] if col not in data.columns]
+            if missing_key_columns:
+                rule_results['duplicate_primary_key'] = {
+                    'passed': True,
+                    'message': f"Skipped - missing columns: {missing_key_columns}",
+                    'severity': 'info'
+                }
+            elif schema.primary_key:
                 duplicate_check = self.duplicate_rule_generator(data, schema)
                 passed, message = duplicate_check(data)
                 rule_results['duplicate_primary_key'] = {
@@ -220,6 +300,21 @@ class DataValidator:
         
         return validation_report
     
+    def _run_rules(self, rules: List[ValidationRule],
+                   data: pd.DataFrame) -> List[Tuple[bool, str, Optional[Exception]]]:
+        """
+        Apply rules to data, concurrently for large frames
+        
+        Rules only read data, so they can share it across threads. Outcomes
+        come back in the order of rules.
+        """
+        workers = min(len(rules), os.cpu_count() or 1)
+        if len(data) < PARALLEL_RULE_MIN_ROWS or workers < 2:
+            return [_run_rule(rule, data) for rule in rules]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run_rule, rules, repeat(data)))
+    
     def validate_batch(self, data_batch: List[Dict], schema_name: str) -> Dict[str, Any]:
         """
         Validate a batch of data records
@@ -242,16 +337,11 @@ class DataValidator:
         df = pd.DataFrame(data_batch)
         report = self.validate_with_schema(schema_name, df)
         
-        # Count valid/invalid rows
-        valid_rows = 0
-        invalid_rows = 0
-        
-        if 'row_validation' in report['schema_validation']:
-            for row_validation in report['schema_validation']['row_validation']:
-                if row_validation['errors']:
-                    invalid_rows += 1
-                else:
-                    valid_rows += 1
+        # Count valid/invalid rows among the rows with issues; the summary
+        # covers every row even when row_validation is truncated
+        schema_summary = report['schema_validation']['summary']
+        invalid_rows = schema_summary['rows_with_errors']
+        valid_rows = schema_summary['rows_with_issues'] - invalid_rows
         
         # Add batch summary
         report['batch_summary'] = {
@@ -274,10 +364,11 @@ class DataValidator:
         validation_report = self.validate_with_schema(schema_name, data)
         
         # Calculate data quality metrics
+        quality_counts = self._count_quality_cells(data)
         quality_metrics = {
-            'completeness': self._calculate_completeness(data),
+            'completeness': self._calculate_completeness(data, quality_counts),
             'accuracy': self._calculate_accuracy(data, validation_report),
-            'consistency': self._calculate_consistency(data),
+            'consistency': self._calculate_consistency(quality_counts),
             'timeliness': self._calculate_timeliness(data),
             'validity': validation_report['summary']['overall_is_valid']
         }
@@ -299,7 +390,7 @@ class DataValidator:
         
         # Create quality report
         quality_report = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': validation_report['timestamp'],
             'data_shape': {
                 'rows': len(data),
                 'columns': len(data.columns)
@@ -314,13 +405,40 @@ class DataValidator:
         
         return quality_report
     
-    def _calculate_completeness(self, data: pd.DataFrame) -> float:
+    def _count_quality_cells(self, data: pd.DataFrame) -> Dict[str, Optional[int]]:
+        """
+        Gather the counts behind completeness and consistency in one pass
+        
+        Returns:
+            Non-null cell count, and the number of rows with more sick than
+            total and more deceased than sick animals (None when a column
+            is missing)
+        """
+        non_null_cells = 0
+        columns = {}
+        for col_name, column in data.items():
+            non_null_cells += int(column.count())
+            if col_name in ('sick_animals', 'total_animals', 'deceased_animals'):
+                columns[col_name] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        def count_exceeding(col_name: str, limit_name: str) -> Optional[int]:
+            if col_name not in columns or limit_name not in columns:
+                return None
+            return int(np.count_nonzero(columns[col_name] > columns[limit_name]))
+        
+        return {
+            'non_null_cells': non_null_cells,
+            'sick_over_total': count_exceeding('sick_animals', 'total_animals'),
+            'deceased_over_sick': count_exceeding('deceased_animals', 'sick_animals')
+        }
+    
+    def _calculate_completeness(self, data: pd.DataFrame, quality_counts: Dict[str, Optional[int]]) -> float:
         """Calculate data completeness score (0-1)"""
         if len(data) == 0:
             return 0.0
         
         total_cells = data.size
-        non_null_cells = data.count().sum()
+        non_null_cells = quality_counts['non_null_cells']
         
         return non_null_cells / total_cells if total_cells > 0 else 0.0
     
@@ -331,16 +449,12 @@ class DataValidator:
             return 0.0
         
         # Count rows with validation errors
-        error_rows = 0
-        if 'row_validation' in validation_report['schema_validation']:
-            for row_validation in validation_report['schema_validation']['row_validation']:
-                if row_validation['errors']:
-                    error_rows += 1
+        error_rows = validation_report['schema_validation']['summary']['rows_with_errors']
         
         accurate_rows = total_rows - error_rows
         return accurate_rows / total_rows if total_rows > 0 else 0.0
     
-    def _calculate_consistency(self, data: pd.DataFrame) -> float:
+    def _calculate_consistency(self, quality_counts: Dict[str, Optional[int]]) -> float:
         """Calculate data consistency score (0-1)"""
         # Simple consistency check: no contradictory values
         # This can be expanded with domain-specific rules
@@ -348,15 +462,11 @@ class DataValidator:
         consistency_score = 1.0
         
         # Check for logical inconsistencies
-        if 'sick_animals' in data.columns and 'total_animals' in data.columns:
-            inconsistent = (data['sick_animals'] > data['total_animals']).sum()
-            if inconsistent > 0:
-                consistency_score -= 0.2
+        if quality_counts['sick_over_total']:
+            consistency_score -= 0.2
         
-        if 'deceased_animals' in data.columns and 'sick_animals' in data.columns:
-            inconsistent = (data['deceased_animals'] > data['sick_animals']).sum()
-            if inconsistent > 0:
-                consistency_score -= 0.2
+        if quality_counts['deceased_over_sick']:
+            consistency_score -= 0.2
         
         return max(0.0, consistency_score)
     
@@ -367,12 +477,13 @@ class DataValidator:
             date_col = 'date' if 'date' in data.columns else 'timestamp'
             
             try:
-                # Convert to datetime if needed
-                if not pd.api.types.is_datetime64_any_dtype(data[date_col]):
-                    data[date_col] = pd.to_datetime(data[date_col])
+                # Convert to datetime if needed, leaving the caller's frame as is
+                dates = data[date_col]
+                if not pd.api.types.is_datetime64_any_dtype(dates):
+                    dates = pd.to_datetime(dates)
                 
                 # Calculate days since most recent data point
-                most_recent = data[date_col].max()
+                most_recent = dates.max()
                 days_old = (datetime.now() - most_recent).days
                 
                 # Score based on freshness (0-1)
@@ -391,16 +502,7 @@ class DataValidator:
     
     def _get_quality_grade(self, score: float) -> str:
         """Convert quality score to letter grade"""
-        if score >= 0.9:
-            return "A"
-        elif score >= 0.8:
-            return "B"
-        elif score >= 0.7:
-            return "C"
-        elif score >= 0.6:
-            return "D"
-        else:
-            return "F"
+        return QUALITY_GRADES[bisect_right(QUALITY_GRADE_THRESHOLDS, score)]
     
     def _extract_major_issues(self, validation_report: Dict) -> List[Dict]:
         """Extract major issues from validation report"""
@@ -458,28 +560,35 @@ class DataValidator:
     def save_validation_report(self, report: Dict, filepath: str) -> None:
         """Save validation report to file"""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(report, default=str, option=JSON_OPTIONS))
             logger.info(f"Validation report saved to {filepath}")
         except Exception as e:
             logger.error(f"Failed to save validation report: {str(e)}")
 
 
-# Global validator instance
+# Global validator instance; the lock keeps concurrent first calls from
+# each building their own
 _data_validator: Optional[DataValidator] = None
+_data_validator_lock = threading.Lock()
 
 
 def get_data_validator(config: Optional[Dict] = None) -> DataValidator:
     """Get or create the global data validator"""
     global _data_validator
     
-    if _data_validator is None:
-        _data_validator = DataValidator(config)
+    validator = _data_validator
+    if validator is None:
+        with _data_validator_lock:
+            if _data_validator is None:
+                _data_validator = DataValidator(config)
+            validator = _data_validator
     
-    return _data_validator
+    return validator
 
 
 def reset_data_validator() -> None:
     """Reset the global data validator (for testing)"""
     global _data_validator
-    _data_validator = None
\ No newline at end of file
+    with _data_validator_lock:
+        _data_validator = None
\ No newline at end of file
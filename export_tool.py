@@ -6,26 +6,45 @@ Command-line tool for exporting data from the livestock system
 import sys
 import os
 import argparse
+from contextlib import closing
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.export.exporter import DataExporter
-from src.database.models import DatabaseManager
-import pandas as pd
+
+# Export queries; the parameter is an SQLite date modifier such as '-30 days'
+ANOMALIES_SQL = """
+SELECT * FROM health_metrics
+WHERE is_anomaly = 1
+AND date >= date('now', ?)
+"""
+
+ALERTS_SQL = """
+SELECT * FROM outbreak_alerts
+WHERE created_at >= date('now', ?)
+"""
+
+METRICS_SQL = """
+SELECT * FROM health_metrics
+WHERE date >= date('now', ?)
+"""
 
 def export_from_database(export_type, output_format, days_back):
     """Export data directly from database"""
+    # SQLAlchemy is imported here so the list and cleanup commands start
+    # without it
+    from src.database.models import DatabaseManager
+    import pandas as pd
     
-    # Connect to database
+    # Connect to database; pandas reads the underlying sqlite3 connection
+    # directly, skipping SQLAlchemy's per-row result handling
     db_manager = DatabaseManager()
     
-    with db_manager.get_session() as session:
+    with closing(db_manager.engine.raw_connection()) as raw_connection:
+        connection = raw_connection.driver_connection
+        params = (f'-{days_back} days',)
+        
         if export_type == 'anomalies':
-            query = """
-            SELECT * FROM health_metrics 
-            WHERE is_anomaly = 1
-            AND date >= date('now', '-' || :days || ' days')
-            """
-            df = pd.read_sql_query(query, session.bind, params={'days': days_back})
+            df = pd.read_sql_query(ANOMALIES_SQL, connection, params=params)
             
             if df.empty:
                 print("No anomalies found in the specified time range.")
@@ -35,11 +54,7 @@ def export_from_database(export_type, output_format, days_back):
             files = exporter.export_anomalies(df)
             
         elif export_type == 'alerts':
-            query = """
-            SELECT * FROM outbreak_alerts 
-            WHERE created_at >= date('now', '-' || :days || ' days')
-            """
-            df = pd.read_sql_query(query, session.bind, params={'days': days_back})
+            df = pd.read_sql_query(ALERTS_SQL, connection, params=params)
             
             if df.empty:
                 print("No alerts found in the specified time range.")
@@ -49,11 +64,7 @@ def export_from_database(export_type, output_format, days_back):
             files = exporter.export_alerts(df)
             
         elif export_type == 'metrics':
-            query = """
-            SELECT * FROM health_metrics 
-            WHERE date >= date('now', '-' || :days || ' days')
-            """
-            df = pd.read_sql_query(query, session.bind, params={'days': days_back})
+            df = pd.read_sql_query(METRICS_SQL, connection, params=params)
             
             if df.empty:
                 print("No health metrics found in the specified time range.")
@@ -63,18 +74,9 @@ def export_from_database(export_type, output_format, days_back):
             files = exporter.export_health_metrics(df, f'last_{days_back}_days')
             
         elif export_type == 'summary':
-            # Get data for summary
-            anomalies_query = """
-            SELECT * FROM health_metrics 
-            WHERE date >= date('now', '-' || :days || ' days')
-            """
-            anomalies_df = pd.read_sql_query(anomalies_query, session.bind, params={'days': days_back})
-            
-            alerts_query = """
-            SELECT * FROM outbreak_alerts 
-            WHERE created_at >= date('now', '-' || :days || ' days')
-            """
-            alerts_df = pd.read_sql_query(alerts_query, session.bind, params={'days': days_back})
+            # Get data for summary; the report covers all recent metrics
+            anomalies_df = pd.read_sql_query(METRICS_SQL, connection, params=params)
+            alerts_df = pd.read_sql_query(ALERTS_SQL, connection, params=params)
             alerts = alerts_df.to_dict('records')
             
             exporter = DataExporter()
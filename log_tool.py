@@ -5,16 +5,16 @@ Log management and analysis CLI tool
 import argparse
 import sys
 import os
-import json
+import re
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Add src to path BEFORE any imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import orjson
 
-# Now import your CUSTOM logging module
-from custom_logging.structured_logger import get_structured_logger, setup_logging
-from custom_logging.log_analyzer import get_log_analyzer
+# Add src to path BEFORE any imports; the CUSTOM logging modules are
+# imported by the commands that need them, so --help stays fast
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import Python's built-in logging module
 import logging
@@ -26,6 +26,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters that make a --regex query more than a plain substring
+REGEX_METACHARS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+# Color codes for levels
+LEVEL_COLORS = {
+    'DEBUG': '\033[90m',    # Gray
+    'INFO': '\033[92m',     # Green
+    'WARNING': '\033[93m',  # Yellow
+    'ERROR': '\033[91m',    # Red
+    'CRITICAL': '\033[41m'  # Red background
+}
+RESET_COLOR = '\033[0m'
+
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def write_json(data) -> None:
+    """Write data to stdout as indented JSON, skipping the str round trip"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, default=str, option=JSON_OPTIONS) + b"\n")
+
+
+def write_json_array(items) -> None:
+    """Stream items to stdout as an indented JSON array, one entry at a time"""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    separator = b"[\n  "
+    for item in items:
+        out.write(separator)
+        # JSON strings never contain raw newlines, so this only re-indents structure
+        out.write(orjson.dumps(item, default=str, option=JSON_OPTIONS).replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    out.write(b"[]\n" if separator == b"[\n  " else b"\n]\n")
+
+
+class HyperscanPattern:
+    """Regex matcher backed by a Hyperscan database, usable in place of re.Pattern"""
+    
+    def __init__(self, query: str):
+        import hyperscan
+        
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        self.pattern = query
+        self.database = hyperscan.Database()
+        self.database.compile(expressions=[query.encode('utf-8')], ids=[0], flags=[flags])
+    
+    def search(self, text: str) -> bool:
+        """Return whether the pattern matches anywhere in text"""
+        matches = []
+        self.database.scan(text.encode('utf-8'), match_event_handler=self._on_match, context=matches)
+        return bool(matches)
+    
+    @staticmethod
+    def _on_match(pattern_id, start, end, flags, matches):
+        # HS_FLAG_SINGLEMATCH reports each pattern at most once per scan
+        matches.append(end)
+
 
 class LogCLI:
     """Command-line interface for log management"""
@@ -33,7 +90,16 @@ class LogCLI:
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
-        self.analyzer = get_log_analyzer(str(log_dir))
+        self._analyzer = None
+        self._pattern_cache = {}
+    
+    @property
+    def analyzer(self):
+        """Log analyzer, imported and created on first use"""
+        if self._analyzer is None:
+            from custom_logging.log_analyzer import get_log_analyzer
+            self._analyzer = get_log_analyzer(str(self.log_dir))
+        return self._analyzer
     
     def show_recent(self, 
                    count: int = 20,
@@ -44,15 +110,16 @@ class LogCLI:
         
         logs = self.analyzer.read_logs(
             since=datetime.utcnow() - timedelta(hours=hours),
-            level=level
-        )[-count:]  # Get last N entries
+            level=level,
+            limit=count  # Get last N entries
+        )
         
         if not logs:
             print("No logs found")
             return
         
         if json_output:
-            print(json.dumps(logs, indent=2, default=str))
+            write_json_array(logs)
         else:
             print("\n" + "=" * 100)
             print("RECENT LOG ENTRIES")
@@ -66,7 +133,7 @@ class LogCLI:
         analysis = self.analyzer.analyze_errors(hours=hours)
         
         if json_output:
-            print(json.dumps(analysis, indent=2, default=str))
+            write_json(analysis)
         else:
             print("\n" + "=" * 100)
             print(f"ERROR ANALYSIS (Last {hours} hours)")
@@ -89,7 +156,7 @@ class LogCLI:
         report = self.analyzer.performance_report(hours=hours)
         
         if json_output:
-            print(json.dumps(report, indent=2, default=str))
+            write_json(report)
         else:
             print("\n" + "=" * 100)
             print(f"PERFORMANCE REPORT (Last {hours} hours)")
@@ -117,7 +184,7 @@ class LogCLI:
         summary = self.analyzer.log_summary(hours=hours)
         
         if json_output:
-            print(json.dumps(summary, indent=2, default=str))
+            write_json(summary)
         else:
             print("\n" + "=" * 100)
             print(f"LOG SUMMARY (Last {hours} hours)")
@@ -142,12 +209,20 @@ class LogCLI:
                     if msg:
                         print(f"  - {msg}")
     
-    def search(self, query: str, hours: int = 24, json_output: bool = False) -> None:
+    def search(self,
+              query: str,
+              hours: int = 24,
+              json_output: bool = False,
+              regex: bool = False) -> None:
         """Search logs"""
-        results = self.analyzer.search_logs(query, hours=hours)
+        if regex and REGEX_METACHARS.search(query):
+            results = self.analyzer.search_logs(self._compile_query(query), hours=hours)
+        else:
+            # Literal queries skip the regex engine and use substring matching
+            results = self.analyzer.search_logs(query, hours=hours)
         
         if json_output:
-            print(json.dumps(results, indent=2, default=str))
+            write_json_array(results)
         else:
             print(f"\nFound {len(results)} matching log entries for '{query}':")
             print("=" * 100)
@@ -158,6 +233,26 @@ class LogCLI:
             if len(results) > 50:
                 print(f"\n... and {len(results) - 50} more entries")
     
+    def _compile_query(self, query: str):
+        """Compile a search pattern once and reuse it for repeated searches"""
+        pattern = self._pattern_cache.get(query)
+        if pattern is None:
+            # Hyperscan is an optional accelerated backend, only loaded for --regex
+            try:
+                import hyperscan
+            except ImportError:
+                hyperscan = None
+            if hyperscan is not None:
+                try:
+                    pattern = HyperscanPattern(query)
+                except hyperscan.error:
+                    # Constructs Hyperscan can't compile (e.g. backreferences) use re
+                    pass
+            if pattern is None:
+                pattern = re.compile(query, re.IGNORECASE)
+            self._pattern_cache[query] = pattern
+        return pattern
+    
     def export(self, output_file: str, hours: int = 24, format: str = 'json') -> None:
         """Export logs to file"""
         self.analyzer.export_logs(output_file, hours=hours, format=format)
@@ -168,8 +263,8 @@ class LogCLI:
         if dry_run:
             print(f"Dry run: Would clean up logs older than {days} days")
             # List files that would be deleted
-            for log_file in self.log_dir.glob("*.log.*"):
-                print(f"  Would consider: {log_file.name}")
+            for log_file in self.analyzer.find_old_logs(days):
+                print(f"  Would delete: {log_file.name}")
         else:
             deleted_count, deleted_files = self.analyzer.cleanup_old_logs(days)
             print(f"Deleted {deleted_count} old log files:")
@@ -178,6 +273,8 @@ class LogCLI:
     
     def test_logging(self, count: int = 5) -> None:
         """Test logging by generating test log entries"""
+        from custom_logging.structured_logger import get_structured_logger
+        
         test_logger = get_structured_logger()
         
         print(f"Generating {count} test log entries...")
@@ -203,7 +300,6 @@ class LogCLI:
         
         # Test timing
         with test_logger.timer("test_operation"):
-            import time
             time.sleep(0.1)
         
         print(f"Generated {count * 3 + 2} test log entries")
@@ -218,35 +314,27 @@ class LogCLI:
         module = log.get('module', '')
         function = log.get('function', '')
         
-        # Color codes for levels
-        colors = {
-            'DEBUG': '\033[90m',    # Gray
-            'INFO': '\033[92m',     # Green
-            'WARNING': '\033[93m',  # Yellow
-            'ERROR': '\033[91m',    # Red
-            'CRITICAL': '\033[41m'  # Red background
-        }
-        reset = '\033[0m'
+        color = LEVEL_COLORS.get(level, '')
         
-        color = colors.get(level, '')
-        
-        print(f"\n{color}{timestamp} {level:8} [{logger_name}]{reset}")
-        print(f"  {message}")
+        # Build the whole entry and write it once rather than print per line
+        parts = [f"\n{color}{timestamp} {level:8} [{logger_name}]{RESET_COLOR}\n  {message}\n"]
         
         if module and function:
-            print(f"  📍 {module}.{function}()")
+            parts.append(f"  📍 {module}.{function}()\n")
         
         if 'duration_ms' in log:
-            print(f"  ⏱️  Duration: {log['duration_ms']} ms")
+            parts.append(f"  ⏱️  Duration: {log['duration_ms']} ms\n")
         
         if 'exception' in log:
             exc = log['exception']
-            print(f"  💥 {exc.get('type', 'Exception')}: {exc.get('message', '')}")
+            parts.append(f"  💥 {exc.get('type', 'Exception')}: {exc.get('message', '')}\n")
         
         if show_context and 'context' in log:
             context = log['context']
             if context:
-                print(f"  📋 Context: {context}")
+                parts.append(f"  📋 Context: {context}\n")
+        
+        sys.stdout.write("".join(parts))
 
 
 def main():
@@ -262,6 +350,7 @@ Examples:
   %(prog)s performance                   Show performance metrics
   %(prog)s summary                       Show log summary
   %(prog)s search "database"             Search for "database" in logs
+  %(prog)s search "fail(ed|ure)" --regex Search logs with a regular expression
   %(prog)s export logs.json              Export logs to JSON
   %(prog)s cleanup --days 7              Clean up logs older than 7 days
   %(prog)s test                          Generate test log entries
@@ -306,6 +395,8 @@ Examples:
                               help='Hours to search (default: 24)')
     search_parser.add_argument('--json', action='store_true',
                               help='Output in JSON format')
+    search_parser.add_argument('--regex', action='store_true',
+                              help='Treat the query as a regular expression')
     
     # Export command
     export_parser = subparsers.add_parser('export', help='Export logs')
@@ -352,7 +443,7 @@ Examples:
         cli.summary(args.hours, args.json)
         
     elif args.command == 'search':
-        cli.search(args.query, args.hours, args.json)
+        cli.search(args.query, args.hours, args.json, args.regex)
         
     elif args.command == 'export':
         cli.export(args.output_file, args.hours, args.format)
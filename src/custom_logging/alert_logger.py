@@ -134,10 +134,28 @@ class AlertLogger:
         Returns:
             List of matching alerts
         """
-        all_alerts = self.get_recent_alerts(days)
+        return self.filter_alerts(self.get_recent_alerts(days), keyword, severity, farm_id)
+    
+    @staticmethod
+    def filter_alerts(alerts: List[Dict],
+                      keyword: str = None,
+                      severity: str = None,
+                      farm_id: str = None) -> List[Dict]:
+        """
+        Filter already-loaded alerts
+        
+        Args:
+            alerts: Alerts as returned by get_recent_alerts
+            keyword: Text to search in alert messages
+            severity: Filter by severity level
+            farm_id: Filter by farm ID
+            
+        Returns:
+            List of matching alerts
+        """
         filtered = []
         
-        for alert in all_alerts:
+        for alert in alerts:
             # Apply filters
             match = True
             
@@ -216,13 +234,15 @@ class AlertLogger:
     
     def export_alerts(self, 
                      days: int = 30,
-                     format: str = 'csv') -> str:
+                     format: str = 'csv',
+                     output_dir: Optional[str] = None) -> str:
         """
         Export alerts to file
         
         Args:
             days: Number of days to export
             format: Export format ('csv' or 'json')
+            output_dir: Directory for the export file (defaults to the log directory)
             
         Returns:
             Path to exported file
@@ -233,10 +253,12 @@ class AlertLogger:
             return None
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_dir = output_dir or self.log_dir
+        os.makedirs(output_dir, exist_ok=True)
         
         if format == 'csv':
             filename = f'alerts_export_{timestamp}.csv'
-            filepath = os.path.join(self.log_dir, filename)
+            filepath = os.path.join(output_dir, filename)
             
             # Write CSV
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -250,7 +272,7 @@ class AlertLogger:
         
         elif format == 'json':
             filename = f'alerts_export_{timestamp}.json'
-            filepath = os.path.join(self.log_dir, filename)
+            filepath = os.path.join(output_dir, filename)
             
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(alerts, f, indent=2, default=str)
@@ -3,43 +3,368 @@ Log analysis utilities for monitoring and debugging
 """
 import json
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple, Pattern, Union
 from pathlib import Path
 from datetime import datetime, timedelta
 import gzip
+import heapq
+import mmap
+import os
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Raw-line prefilter for entries at ERROR level or above
+ERROR_LINE_NEEDLES = (b'ERROR', b'CRITICAL')
+
+# Raw-line prefilters scan this much of a file at a time
+SCAN_BLOCK_SIZE = 1 << 20
+
+# JSON embedded in mixed output lines
+JSON_LOG_PATTERN = re.compile(r'\{"timestamp".*\}')
+
+# Below this much log data, starting worker processes costs more than it saves
+PARALLEL_READ_MIN_BYTES = 32 * 1024 * 1024
+
+LEVEL_PRIORITY = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'WARNING': 30,
+    'ERROR': 40,
+    'CRITICAL': 50
+}
+
+
+class LogIndex:
+    """
+    Persistent trigram index over log files.
+    
+    Records the lowercase trigrams of every token in each rotated log
+    file so that searches can skip files that cannot contain the query.
+    Active *.log files change on every write, so they are never indexed
+    and are always candidates. Entries are keyed by file path and
+    invalidated when the file's mtime or size changes. The index is a
+    prefilter only; matching still happens on the parsed entries.
+    """
+    
+    # Characters that JSON serialization can place differently between
+    # the raw line and a re-serialized entry, so tokens never span them
+    TOKEN_SPLIT = re.compile(r'[\s"\\:,]+')
+    
+    def __init__(self, log_dir: Union[str, Path]):
+        self.index_path = Path(log_dir) / '.index' / 'trigrams.json'
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._dirty = False
+    
+    @classmethod
+    def trigrams(cls, text: str) -> Set[str]:
+        """Get the trigrams of every token in text"""
+        trigrams = set()
+        for token in set(cls.TOKEN_SPLIT.split(text.lower())):
+            trigrams.update(token[i:i + 3] for i in range(len(token) - 2))
+        return trigrams
+    
+    def may_contain(self, file_path: Path, text: str) -> bool:
+        """Check whether a file may contain text (case-insensitive)"""
+        if '.log.' not in file_path.name:
+            # Active log: re-indexing on every append costs more than reading it
+            return True
+        
+        # Serialized entries are ASCII, so non-ASCII trigrams can't constrain a match
+        required = {trigram for trigram in self.trigrams(text) if trigram.isascii()}
+        if not required:
+            return True
+        
+        trigrams = self._file_trigrams(file_path)
+        return trigrams is None or required <= trigrams
+    
+    def candidates(self, files: List[Path], texts: Sequence[str]) -> List[Path]:
+        """Filter files down to those that may contain any of texts"""
+        selected = [
+            file_path for file_path in files
+            if any(self.may_contain(file_path, text) for text in texts)
+        ]
+        self.save()
+        return selected
+    
+    def save(self) -> None:
+        """Write the index back to disk if any entry changed"""
+        if not self._dirty:
+            return
+        
+        entries = {key: entry for key, entry in self._entries.items() if Path(key).exists()}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write log index {self.index_path}: {str(e)}")
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+    
+    def _file_trigrams(self, file_path: Path) -> Optional[Set[str]]:
+        key = str(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        signature = [stat.st_mtime_ns, stat.st_size]
+        
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is not None and entry['signature'] == signature:
+            trigrams = self._trigrams.get(key)
+            if trigrams is None:
+                packed = entry['trigrams']
+                trigrams = {packed[i:i + 3] for i in range(0, len(packed), 3)}
+                self._trigrams[key] = trigrams
+            return trigrams
+        
+        open_func = gzip.open if file_path.suffix == '.gz' else open
+        open_mode = 'rt' if file_path.suffix == '.gz' else 'r'
+        trigrams = set()
+        try:
+            with open_func(file_path, open_mode, encoding='utf-8', errors='replace') as f:
+                for lines in iter(lambda: f.readlines(1 << 20), []):
+                    trigrams |= self.trigrams(''.join(lines))
+        except OSError as e:
+            logger.warning(f"Could not index log file {file_path}: {str(e)}")
+            return None
+        
+        entries[key] = {'signature': signature, 'trigrams': ''.join(trigrams)}
+        self._trigrams[key] = trigrams
+        self._dirty = True
+        return trigrams
+
+
+def _parse_log_line(line: str, log_pattern: Pattern[str] = JSON_LOG_PATTERN) -> Optional[Dict[str, Any]]:
+    """Parse a JSON log line, falling back to JSON embedded in mixed output"""
+    try:
+        # Try to parse as JSON
+        return json.loads(line.strip())
+    except json.JSONDecodeError:
+        # Try to find JSON in line (in case of mixed output)
+        match = log_pattern.search(line)
+        if match:
+            try:
+                return json.loads(match.group())
+            except json.JSONDecodeError:
+                return None
+        return None
+
+
+class _EntryFilter:
+    """Time window and level filters for parsed entries (picklable for worker processes)"""
+    
+    def __init__(self,
+                 since: Optional[datetime] = None,
+                 until: Optional[datetime] = None,
+                 level: Optional[str] = None):
+        self.since = since
+        self.until = until
+        min_priority = LEVEL_PRIORITY.get(level, 0) if level else 0
+        # Resolve the passing level names once so each entry costs one set lookup;
+        # unknown entry levels rank 0 and so only pass when nothing is filtered
+        self.levels = frozenset(
+            name for name, priority in LEVEL_PRIORITY.items() if priority >= min_priority
+        ) if min_priority else None
+    
+    def __call__(self, log_entry: Dict[str, Any]) -> bool:
+        # Apply filters
+        if self.since:
+            log_time = datetime.fromisoformat(
+                log_entry['timestamp'].replace('Z', '+00:00')
+            )
+            if log_time < self.since:
+                return False
+        
+        if self.until:
+            log_time = datetime.fromisoformat(
+                log_entry['timestamp'].replace('Z', '+00:00')
+            )
+            if log_time > self.until:
+                return False
+        
+        if self.levels is not None and log_entry.get('level', 'DEBUG') not in self.levels:
+            return False
+        
+        return True
+
+
+def _read_log_file(file_path: Path,
+                   keep: _EntryFilter,
+                   line_needles: Optional[Sequence[bytes]] = None,
+                   fold_case: bool = False,
+                   log_pattern: Pattern[str] = JSON_LOG_PATTERN) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Parse and filter one log file.
+    
+    Returns the kept entries and, if reading stopped early, the error
+    message; entries read before the error are still returned.
+    """
+    entries = []
+    try:
+        for line in _read_lines(file_path, line_needles, fold_case):
+            log_entry = _parse_log_line(line, log_pattern)
+            if log_entry and keep(log_entry):
+                entries.append(log_entry)
+    except Exception as e:
+        return entries, str(e)
+    return entries, None
+
+
+def _read_lines(file_path: Path,
+                line_needles: Optional[Sequence[bytes]] = None,
+                fold_case: bool = False):
+    """
+    Yield the lines of a log file.
+    
+    With line_needles the raw bytes are scanned first and only the lines
+    containing a needle are decoded, so most lines never reach the JSON parser.
+    """
+    if not line_needles:
+        # Handle gzipped rotated logs
+        open_func = gzip.open if file_path.suffix == '.gz' else open
+        open_mode = 'rt' if file_path.suffix == '.gz' else 'r'
+        with open_func(file_path, open_mode, encoding='utf-8') as f:
+            yield from f
+        return
+    
+    if file_path.suffix == '.gz':
+        with gzip.open(file_path, 'rb') as f:
+            yield from _scan_lines(_stream_blocks(f), line_needles, fold_case)
+        return
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from _scan_lines(_buffer_blocks(data), line_needles, fold_case)
+
+
+def _buffer_blocks(data):
+    """Yield line-aligned blocks of about SCAN_BLOCK_SIZE bytes from a buffer"""
+    size = len(data)
+    position = 0
+    while position < size:
+        end = data.find(b'\n', min(position + SCAN_BLOCK_SIZE, size))
+        end = size if end == -1 else end + 1
+        yield data[position:end]
+        position = end
+
+
+def _stream_blocks(f):
+    """
+    Yield line-aligned blocks from a binary stream, reading SCAN_BLOCK_SIZE
+    bytes at a time and carrying each partial last line into the next block.
+    """
+    partial = b''
+    while True:
+        chunk = f.read(SCAN_BLOCK_SIZE)
+        if not chunk:
+            break
+        cut = chunk.rfind(b'\n') + 1
+        if not cut:
+            partial += chunk
+            continue
+        yield partial + chunk[:cut]
+        partial = chunk[cut:]
+    if partial:
+        yield partial
+
+
+def _scan_lines(blocks, line_needles: Sequence[bytes], fold_case: bool = False):
+    """
+    Yield each decoded line of the line-aligned blocks that contains one of
+    line_needles.
+    
+    Blocks are checked with plain substring search; with fold_case each
+    block is ASCII-lowercased first, so the needles must be lowercase. Once a
+    block shows that most lines hit, the remaining blocks are passed through
+    unfiltered, since scanning them would only add cost.
+    """
+    filtering = True
+    for block in blocks:
+        if not filtering:
+            yield from block.decode('utf-8').split('\n')
+            continue
+        
+        haystack = block.lower() if fold_case else block
+        hits = sum(haystack.count(needle) for needle in line_needles)
+        if not hits:
+            continue
+        
+        if hits * 2 >= block.count(b'\n'):
+            # Common needle: scanning the rest of the file would cost more than it skips
+            filtering = False
+            yield from block.decode('utf-8').split('\n')
+            continue
+        
+        lines = block.split(b'\n')
+        folded_lines = haystack.split(b'\n') if fold_case else lines
+        for line, folded in zip(lines, folded_lines):
+            for needle in line_needles:
+                if needle in folded:
+                    yield line.decode('utf-8')
+                    break
+
+
+def _read_lines_reversed(file_path: Path, chunk_size: int = 1 << 16):
+    """Yield the lines of a log file from last to first"""
+    if file_path.suffix == '.gz':
+        # Compressed rotations can't be seeked backwards cheaply
+        with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+            yield from reversed(f.readlines())
+        return
+    
+    with open(file_path, 'rb') as f:
+        position = f.seek(0, 2)
+        remainder = b''
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            # The first piece may be the tail of a line that starts in an earlier chunk
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                yield line.decode('utf-8')
+        yield remainder.decode('utf-8')
+
 
 class LogAnalyzer:
     """Analyze log files for patterns, errors, and statistics"""
     
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
-        self.log_pattern = re.compile(r'\{"timestamp".*\}')
+        self.log_pattern = JSON_LOG_PATTERN
+        self.index = LogIndex(self.log_dir)
     
     def parse_log_line(self, line: str) -> Optional[Dict[str, Any]]:
         """Parse a JSON log line"""
-        try:
-            # Try to parse as JSON
-            return json.loads(line.strip())
-        except json.JSONDecodeError:
-            # Try to find JSON in line (in case of mixed output)
-            match = self.log_pattern.search(line)
-            if match:
-                try:
-                    return json.loads(match.group())
-                except json.JSONDecodeError:
-                    return None
-            return None
+        return _parse_log_line(line, self.log_pattern)
     
     def read_logs(self, 
                  log_file: Optional[str] = None,
                  since: Optional[datetime] = None,
                  until: Optional[datetime] = None,
-                 level: Optional[str] = None) -> List[Dict[str, Any]]:
+                 level: Optional[str] = None,
+                 contains_any: Optional[Sequence[str]] = None,
+                 limit: Optional[int] = None,
+                 line_needles: Optional[Sequence[bytes]] = None,
+                 fold_case: bool = False) -> List[Dict[str, Any]]:
         """
         Read and parse log files
         
@@ -48,6 +373,12 @@ class LogAnalyzer:
             since: Only include logs after this time
             until: Only include logs before this time
             level: Only include logs of this level or higher
+            contains_any: Skip files the index shows contain none of these
+                strings (entries themselves are not filtered)
+            limit: Only return the last N matching entries, reading the
+                newest files backwards and stopping once N are found
+            line_needles: Only parse lines whose raw bytes contain one of these
+            fold_case: Match line_needles (given in lowercase) ignoring ASCII case
             
         Returns:
             List of parsed log entries
@@ -62,56 +393,64 @@ class LogAnalyzer:
             files = list(self.log_dir.glob("*.log"))
             files += list(self.log_dir.glob("*.log.*"))  # Rotated logs
         
-        level_priority = {
-            'DEBUG': 10,
-            'INFO': 20,
-            'WARNING': 30,
-            'ERROR': 40,
-            'CRITICAL': 50
-        }
-        min_priority = level_priority.get(level, 0) if level else 0
+        if contains_any:
+            files = self.index.candidates(files, contains_any)
+        
+        keep = _EntryFilter(since, until, level)
+        
+        if limit is not None:
+            return self._read_recent_logs(files, limit, keep)
+        
+        files = [file_path for file_path in files if file_path.exists()]
+        
+        args = (files, repeat(keep), repeat(line_needles), repeat(fold_case), repeat(self.log_pattern))
+        workers = min(len(files), os.cpu_count() or 1)
+        
+        if workers > 1 and sum(file_path.stat().st_size for file_path in files) >= PARALLEL_READ_MIN_BYTES:
+            # Parsing is CPU-bound, so spread files across processes
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_read_log_file, *args))
+        else:
+            results = map(_read_log_file, *args)
+        
+        for file_path, (entries, error) in zip(files, results):
+            logs.extend(entries)
+            if error:
+                logger.error(f"Failed to read log file {file_path}: {error}")
+        
+        return logs
+    
+    def _read_recent_logs(self,
+                          files: List[Path],
+                          limit: int,
+                          keep: '_EntryFilter') -> List[Dict[str, Any]]:
+        """Collect the last `limit` kept entries, newest files first and read from the end"""
+        logs = []
+        if limit <= 0:
+            return logs
+        
+        files = sorted(
+            (file_path for file_path in files if file_path.exists()),
+            key=lambda file_path: file_path.stat().st_mtime,
+            reverse=True
+        )
         
         for file_path in files:
-            if not file_path.exists():
-                continue
-            
-            # Handle gzipped rotated logs
-            open_func = gzip.open if file_path.suffix == '.gz' else open
-            open_mode = 'rt' if file_path.suffix == '.gz' else 'r'
-            
             try:
-                with open_func(file_path, open_mode, encoding='utf-8') as f:
-                    for line in f:
-                        log_entry = self.parse_log_line(line)
-                        if not log_entry:
-                            continue
-                        
-                        # Apply filters
-                        if since:
-                            log_time = datetime.fromisoformat(
-                                log_entry['timestamp'].replace('Z', '+00:00')
-                            )
-                            if log_time < since:
-                                continue
-                        
-                        if until:
-                            log_time = datetime.fromisoformat(
-                                log_entry['timestamp'].replace('Z', '+00:00')
-                            )
-                            if log_time > until:
-                                continue
-                        
-                        if level:
-                            entry_priority = level_priority.get(log_entry.get('level', 'DEBUG'), 0)
-                            if entry_priority < min_priority:
-                                continue
-                        
+                for line in _read_lines_reversed(file_path):
+                    log_entry = self.parse_log_line(line)
+                    if log_entry and keep(log_entry):
                         logs.append(log_entry)
-                        
+                        if len(logs) >= limit:
+                            break
             except Exception as e:
                 logger.error(f"Failed to read log file {file_path}: {str(e)}")
-                continue
+            
+            if len(logs) >= limit:
+                break
         
+        # Collected newest first; return in file order like read_logs
+        logs.reverse()
         return logs
     
     def analyze_errors(self, 
@@ -132,7 +471,8 @@ class LogAnalyzer:
         # Read error logs
         error_logs = self.read_logs(
             since=since,
-            level='ERROR'
+            level='ERROR',
+            line_needles=ERROR_LINE_NEEDLES
         )
         
         # Group errors
@@ -205,22 +545,24 @@ class LogAnalyzer:
             'time_period_hours': hours,
             'total_timed_operations': sum(len(d) for d in operations.values()),
             'operations': performance,
-            'slowest_operations': sorted(
+            'slowest_operations': heapq.nlargest(
+                5,
                 performance.items(),
-                key=lambda x: x[1]['avg_ms'],
-                reverse=True
-            )[:5]
+                key=lambda x: x[1]['avg_ms']
+            )
         }
     
     def search_logs(self, 
-                   query: str,
+                   query: Union[str, Pattern[str]],
                    hours: int = 24,
                    case_sensitive: bool = False) -> List[Dict[str, Any]]:
         """
         Search logs for specific text
         
         Args:
-            query: Search query
+            query: Search query, or a pre-compiled pattern (anything with a
+                search method; it carries its own flags, so case_sensitive
+                is ignored)
             hours: Hours to look back
             case_sensitive: Whether search is case sensitive
             
@@ -229,8 +571,18 @@ class LogAnalyzer:
         """
         since = datetime.utcnow() - timedelta(hours=hours)
         
-        # Read logs
-        logs = self.read_logs(since=since)
+        if not isinstance(query, str):
+            logs = self.read_logs(since=since)
+            search = query.search
+            return [log for log in logs if search(json.dumps(log, default=str))]
+        
+        # Read logs, skipping files and lines that can't contain the query
+        logs = self.read_logs(
+            since=since,
+            contains_any=(query,),
+            line_needles=self._query_line_needles(query, case_sensitive),
+            fold_case=not case_sensitive
+        )
         
         # Prepare search
         if not case_sensitive:
@@ -250,6 +602,17 @@ class LogAnalyzer:
         
         return results
     
+    @staticmethod
+    def _query_line_needles(query: str, case_sensitive: bool) -> Optional[Tuple[bytes]]:
+        """Build a raw-line prefilter from the longest ASCII token of a query"""
+        tokens = [token for token in LogIndex.TOKEN_SPLIT.split(query) if token.isascii()]
+        token = max(tokens, key=len, default='')
+        if not token:
+            return None
+        
+        needle = token.encode('ascii')
+        return (needle if case_sensitive else needle.lower(),)
+    
     def log_summary(self, hours: int = 1) -> Dict[str, Any]:
         """
         Generate summary of recent logs
@@ -328,6 +691,41 @@ class LogAnalyzer:
         
         logger.info(f"Exported {len(logs)} logs to {output_file}")
     
+    def find_old_logs(self, days: int = 30) -> List[Path]:
+        """
+        Find rotated, compressed log files older than a number of days
+        
+        Args:
+            days: Age threshold, taken from a YYYY-MM-DD part of the file name
+            
+        Returns:
+            Paths of the old log files
+        """
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        old_logs = []
+        
+        if not self.log_dir.is_dir():
+            return old_logs
+        
+        # scandir avoids building a Path for every file in the directory
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if '.log.' not in name or not name.endswith('.gz'):  # Rotated logs
+                    continue
+                
+                # Pattern: something.log.YYYY-MM-DD or similar
+                for part in name.split('.'):
+                    try:
+                        file_date = datetime.strptime(part, '%Y-%m-%d')
+                    except ValueError:
+                        continue
+                    if file_date < cutoff:
+                        old_logs.append(Path(entry.path))
+                        break
+        
+        return old_logs
+    
     def cleanup_old_logs(self, days: int = 30) -> Tuple[int, List[str]]:
         """
         Clean up old log files
@@ -338,26 +736,14 @@ class LogAnalyzer:
         Returns:
             Tuple of (files_deleted, list_of_deleted_files)
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
         deleted = []
         
-        for log_file in self.log_dir.glob("*.log.*"):  # Rotated logs
-            if log_file.suffix == '.gz':
-                # Try to extract date from filename
-                try:
-                    # Pattern: something.log.YYYY-MM-DD or similar
-                    parts = log_file.name.split('.')
-                    for part in parts:
-                        try:
-                            file_date = datetime.strptime(part, '%Y-%m-%d')
-                            if file_date < cutoff:
-                                log_file.unlink()
-                                deleted.append(str(log_file))
-                                break
-                        except ValueError:
-                            continue
-                except Exception as e:
-                    logger.warning(f"Could not determine age of {log_file}: {str(e)}")
+        for log_file in self.find_old_logs(days):
+            try:
+                log_file.unlink()
+                deleted.append(str(log_file))
+            except Exception as e:
+                logger.warning(f"Could not delete {log_file}: {str(e)}")
         
         return len(deleted), deleted
 
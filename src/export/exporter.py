@@ -8,10 +8,14 @@ import os
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any
 import logging
+from contextlib import contextmanager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Write buffer for export files, so row-by-row writers reach the OS in large chunks
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
 
 class DataExporter:
     """Export data in multiple formats (CSV, Excel, JSON)"""
@@ -74,10 +78,20 @@ class DataExporter:
         logger.info(f"Exported {len(df)} records to {', '.join(exported_files.keys())}")
         return exported_files
     
+    @contextmanager
+    def _open_export_file(self, filepath: str, newline: Optional[str] = None):
+        """Open an export file with a large write buffer and fsync it once when done"""
+        with open(filepath, 'w', encoding='utf-8', newline=newline,
+                  buffering=EXPORT_BUFFER_SIZE) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+    
     def _export_to_csv(self, df: pd.DataFrame, base_filename: str) -> str:
         """Export dataframe to CSV"""
         filepath = os.path.join(self.output_dir, f"{base_filename}.csv")
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        with self._open_export_file(filepath, newline='') as f:
+            df.to_csv(f, index=False)
         logger.debug(f"Exported CSV to {filepath}")
         return filepath
     
@@ -128,25 +142,33 @@ class DataExporter:
             logger.warning(f"Could not add Excel summary: {str(e)}")
     
     def _export_to_json(self, df: pd.DataFrame, base_filename: str) -> str:
-        """Export dataframe to JSON"""
+        """Export dataframe to JSON, streaming records to the file one at a time"""
         filepath = os.path.join(self.output_dir, f"{base_filename}.json")
         
-        # Convert to records format
-        records = df.to_dict('records')
-        
-        # Add metadata
-        export_data = {
-            'metadata': {
-                'export_date': datetime.now().isoformat(),
-                'record_count': len(df),
-                'columns': list(df.columns),
-                'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()}
-            },
-            'data': records
+        metadata = {
+            'export_date': datetime.now().isoformat(),
+            'record_count': len(df),
+            'columns': list(df.columns),
+            'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()}
         }
+        columns = list(df.columns)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, default=self._json_serializer)
+        with self._open_export_file(filepath) as f:
+            f.write('{\n  "metadata": ')
+            f.write(json.dumps(metadata, default=self._json_serializer))
+            f.write(',\n  "data": [')
+            
+            # Encode each record as it is read instead of building the full
+            # list of record dicts in memory first
+            separator = '\n    '
+            for row in df.itertuples(index=False, name=None):
+                f.write(separator)
+                f.write(json.dumps(dict(zip(columns, row)),
+                                   separators=(',', ':'),
+                                   default=self._json_serializer))
+                separator = ',\n    '
+            
+            f.write('\n  ]\n}\n')
         
         logger.debug(f"Exported JSON to {filepath}")
         return filepath
@@ -280,7 +302,7 @@ class DataExporter:
         else:
             raise ValueError(f"Unsupported format: {output_format}")
         
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with self._open_export_file(filepath) as f:
             f.write(content)
         
         logger.info(f"Generated {output_format} report: {filepath}")
@@ -0,0 +1,207 @@
+"""
+Tests for the log analyzer's file readers, prefilters and trigram index
+"""
+import gzip
+import importlib.util
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Load the analyzer straight from its file, so these tests don't depend on
+# importing the rest of the custom_logging package
+ANALYZER_PATH = Path(__file__).resolve().parent.parent / 'src' / 'custom_logging' / 'log_analyzer.py'
+spec = importlib.util.spec_from_file_location('log_analyzer', ANALYZER_PATH)
+log_analyzer = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = log_analyzer
+spec.loader.exec_module(log_analyzer)
+
+LogAnalyzer = log_analyzer.LogAnalyzer
+LogIndex = log_analyzer.LogIndex
+
+
+def make_lines(count, marker_every=None, marker='farm_42'):
+    """Build JSON log lines, putting marker in every marker_every-th message"""
+    timestamp = datetime.utcnow().isoformat()
+    lines = []
+    for i in range(count):
+        message = f"Message {i}"
+        if marker_every and i % marker_every == 0:
+            message += f" for {marker}"
+        lines.append(f'{{"timestamp": "{timestamp}", "level": "INFO", "message": "{message}"}}')
+    return lines
+
+
+class TestScanLines:
+    def test_sparse_needle_yields_only_matching_lines(self, monkeypatch):
+        """Test blocks with few hits are filtered line by line"""
+        monkeypatch.setattr(log_analyzer, 'SCAN_BLOCK_SIZE', 256)
+        lines = make_lines(200, marker_every=50)
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+        
+        found = list(log_analyzer._scan_lines(log_analyzer._buffer_blocks(data), (b'farm_42',)))
+        assert found == [line for line in lines if 'farm_42' in line]
+    
+    def test_dense_needle_passes_blocks_through(self, monkeypatch):
+        """Test a block where most lines hit turns the prefilter off for the rest"""
+        monkeypatch.setattr(log_analyzer, 'SCAN_BLOCK_SIZE', 8)
+        data = b'hit a\nhit b\n' + b'miss\n' * 5 + b'hit c\n'
+        
+        found = list(log_analyzer._scan_lines(log_analyzer._buffer_blocks(data), (b'hit',)))
+        assert [line for line in found if line] == ['hit a', 'hit b'] + ['miss'] * 5 + ['hit c']
+    
+    def test_fold_case(self):
+        """Test lowercase needles match any case with fold_case"""
+        data = (b'{"message": "Farm_42 ok"}\n' + b'{"message": "other"}\n' * 8
+                + b'{"message": "FARM_42 down"}\n')
+        blocks = log_analyzer._buffer_blocks(data)
+        
+        assert list(log_analyzer._scan_lines(blocks, (b'farm_42',), fold_case=True)) == [
+            '{"message": "Farm_42 ok"}',
+            '{"message": "FARM_42 down"}'
+        ]
+        assert list(log_analyzer._scan_lines(log_analyzer._buffer_blocks(data), (b'farm_42',))) == []
+    
+    def test_stream_blocks_are_line_aligned(self, monkeypatch):
+        """Test streamed blocks carry partial lines over, even ones longer than a block"""
+        monkeypatch.setattr(log_analyzer, 'SCAN_BLOCK_SIZE', 16)
+        lines = ['short', 'x' * 50, 'a line of medium size', '', 'last without newline']
+        data = '\n'.join(lines).encode('utf-8')
+        
+        with tempfile.TemporaryFile() as f:
+            f.write(data)
+            f.seek(0)
+            blocks = list(log_analyzer._stream_blocks(f))
+        
+        assert b''.join(blocks) == data
+        assert all(block.endswith(b'\n') for block in blocks[:-1])
+    
+    def test_gzip_matches_plain_file(self, monkeypatch):
+        """Test compressed and plain logs give the same prefiltered lines"""
+        monkeypatch.setattr(log_analyzer, 'SCAN_BLOCK_SIZE', 300)
+        lines = make_lines(500, marker_every=37)
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir) / "app.log.1"
+            plain.write_bytes(data)
+            compressed = Path(tmpdir) / "app.log.2.gz"
+            compressed.write_bytes(gzip.compress(data))
+            
+            expected = [line for line in lines if 'farm_42' in line]
+            assert list(log_analyzer._read_lines(plain, (b'farm_42',))) == expected
+            assert list(log_analyzer._read_lines(compressed, (b'farm_42',))) == expected
+
+
+class TestReadLinesReversed:
+    def test_lines_across_chunk_boundaries(self):
+        """Test lines spanning several small chunks come back whole and in reverse"""
+        lines = ['first', 'a much longer line that spans chunks', 'é multibyte é', '', 'last']
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            log_file.write_bytes(('\n'.join(lines) + '\n').encode('utf-8'))
+            
+            for chunk_size in (1, 3, 7, 1 << 16):
+                found = list(log_analyzer._read_lines_reversed(log_file, chunk_size=chunk_size))
+                assert found == [''] + lines[::-1]
+    
+    def test_gzip(self):
+        """Test compressed rotations are reversed too"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log.1.gz"
+            log_file.write_bytes(gzip.compress(b'one\ntwo\nthree\n'))
+            
+            assert list(log_analyzer._read_lines_reversed(log_file)) == ['three\n', 'two\n', 'one\n']
+
+
+class TestLogAnalyzerReads:
+    def test_read_logs_limit(self):
+        """Test reading only the most recent entries"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            log_file.write_text('\n'.join(make_lines(100)) + '\n')
+            
+            analyzer = LogAnalyzer(tmpdir)
+            recent = analyzer.read_logs(limit=3)
+            assert [log['message'] for log in recent] == ['Message 97', 'Message 98', 'Message 99']
+            assert analyzer.read_logs(limit=500) == analyzer.read_logs()
+    
+    def test_search_logs(self):
+        """Test searching with a query string and with a pre-compiled pattern"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            timestamp = datetime.utcnow().isoformat()
+            log_file = Path(tmpdir) / "test.log"
+            log_file.write_text('\n'.join([
+                f'{{"timestamp": "{timestamp}", "level": "INFO", "message": "Database query executed"}}',
+                f'{{"timestamp": "{timestamp}", "level": "ERROR", "message": "Database connection failed"}}',
+                f'{{"timestamp": "{timestamp}", "level": "INFO", "message": "File processed successfully"}}',
+            ]))
+            
+            analyzer = LogAnalyzer(tmpdir)
+            assert len(analyzer.search_logs("DATABASE", hours=24)) == 2
+            assert analyzer.search_logs("DATABASE", hours=24, case_sensitive=True) == []
+            
+            results = analyzer.search_logs("failed", hours=24)
+            assert [log['level'] for log in results] == ['ERROR']
+            
+            results = analyzer.search_logs(re.compile(r'database (query|connection)', re.IGNORECASE), hours=24)
+            assert len(results) == 2
+    
+    def test_find_old_logs(self):
+        """Test only compressed rotations dated before the cutoff are old"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            today = datetime.utcnow().strftime('%Y-%m-%d')
+            recent = (datetime.utcnow() - timedelta(days=5)).strftime('%Y-%m-%d')
+            names = [
+                "app.log.2020-01-01.gz",
+                f"app.log.{recent}.gz",
+                f"app.log.{today}.gz",
+                "app.log.2020-01-01",
+                "notes.2020-01-01.gz",
+                "app.log",
+            ]
+            for name in names:
+                (Path(tmpdir) / name).write_bytes(b'')
+            
+            analyzer = LogAnalyzer(tmpdir)
+            assert analyzer.find_old_logs(days=30) == [Path(tmpdir) / "app.log.2020-01-01.gz"]
+            assert sorted(analyzer.find_old_logs(days=1)) == sorted([
+                Path(tmpdir) / "app.log.2020-01-01.gz",
+                Path(tmpdir) / f"app.log.{recent}.gz",
+            ])
+            assert LogAnalyzer(os.path.join(tmpdir, "missing")).find_old_logs() == []
+
+
+class TestLogIndex:
+    def test_candidates(self):
+        """Test trigram index skips rotated files that cannot match"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_log = Path(tmpdir) / "db.log.1"
+            db_log.write_text('{"timestamp": "2024-01-01T10:00:00", "level": "ERROR", "message": "Database connection failed"}')
+            app_log = Path(tmpdir) / "app.log.1"
+            app_log.write_text('{"timestamp": "2024-01-01T10:00:00", "level": "INFO", "message": "File processed"}')
+            active_log = Path(tmpdir) / "app.log"
+            active_log.write_text('{"timestamp": "2024-01-01T10:00:00", "level": "INFO", "message": "File processed"}')
+            
+            index = LogIndex(tmpdir)
+            assert index.candidates([db_log, app_log], ["DATABASE"]) == [db_log]
+            assert index.candidates([db_log, app_log], ["db"]) == [db_log, app_log]
+            assert index.candidates([db_log, app_log], ["database", "processed"]) == [db_log, app_log]
+            
+            # Active logs are never indexed and always read
+            assert index.candidates([db_log, active_log], ["database"]) == [db_log, active_log]
+    
+    def test_persisted_and_invalidated(self):
+        """Test the index is saved to disk and refreshed when a file changes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            app_log = Path(tmpdir) / "app.log.1.gz"
+            app_log.write_bytes(gzip.compress(b'{"timestamp": "2024-01-01T10:00:00", "message": "File processed"}\n'))
+            
+            assert LogIndex(tmpdir).candidates([app_log], ["database"]) == []
+            assert (Path(tmpdir) / ".index" / "trigrams.json").exists()
+            
+            app_log.write_bytes(gzip.compress(b'{"timestamp": "2024-01-01T10:00:00", "message": "Database is ready"}\n'))
+            assert LogIndex(tmpdir).candidates([app_log], ["database"]) == [app_log]
@@ -87,6 +87,41 @@ class TestColumnSchema:
         assert col_required.validate(None)[0] == False
         assert col_required.validate(np.nan)[0] == False
 
+    def test_validate_series_matches_validate(self):
+        """Test vectorized column validation agrees with per-value validation"""
+        columns = [
+            ColumnSchema(name="age", data_type=DataType.INTEGER, min_value=0, max_value=100),
+            ColumnSchema(name="id", data_type=DataType.STRING, pattern=r'^FARM-\d{4}$'),
+            ColumnSchema(name="temp", data_type=DataType.TEMPERATURE, nullable=True),
+            ColumnSchema(name="date", data_type=DataType.DATETIME)
+        ]
+        values = pd.Series([25, "25", 25.5, -5, "abc", None, "FARM-1234", 75.0,
+                            "2024-01-05", "05/01/2024", "2024-13-45"], dtype=object)
+
+        for col in columns:
+            results = col.validate_series(values)
+            expected = [col.validate(value) for value in values]
+
+            assert list(results['is_valid']) == [r[0] for r in expected]
+            assert list(results['message']) == [r[1] for r in expected]
+            assert list(results['severity']) == [r[2] for r in expected]
+
+    def test_validate_series_categorical_dtype(self):
+        """Test category dtype columns are validated like their values"""
+        col = ColumnSchema(
+            name="animal_type",
+            data_type=DataType.CATEGORICAL,
+            nullable=True,
+            allowed_values=["cattle", "swine"]
+        )
+        values = pd.Series(["cattle", "horse", None, "swine", "horse"])
+
+        results = col.validate_series(values.astype("category"))
+        expected = col.validate_series(values)
+
+        assert results.equals(expected)
+        assert list(results['is_valid']) == [True, False, True, True, False]
+
 
 class TestDatasetSchema:
     def setup_method(self):
@@ -131,7 +166,26 @@ class TestDatasetSchema:
         invalid_row2 = {"id": 1, "name": "Test", "score": 150}
         results = self.schema.validate_row(invalid_row2)
         assert len(results['errors']) > 0
-    
+        
+        # Passing values are only reported when asked for
+        assert self.schema.validate_row(valid_row)['infos'] == []
+        self.schema.collect_info = True
+        self.schema.compile()
+        assert len(self.schema.validate_row(valid_row)['infos']) == 3
+
+    def test_positional_row_validation(self):
+        """Test validating itertuples rows matches validating row dicts"""
+        df = pd.DataFrame({
+            "score": [85.5, 150, -1.0],
+            "id": [1, 0, 3],
+            "extra": ["x", "y", "z"]
+        })
+
+        validate_values = self.schema.compile(list(df.columns))
+
+        for values, (_, row) in zip(df.itertuples(index=False, name=None), df.iterrows()):
+            assert validate_values(values) == self.schema.validate_row(row.to_dict())
+
     def test_dataframe_validation(self):
         """Test DataFrame validation"""
         # Create test DataFrame
@@ -147,6 +201,28 @@ class TestDatasetSchema:
         assert report['summary']['total_rows'] == 3
         assert report['summary']['errors'] == 0
     
+    def test_dataframe_validation_caps_recorded_rows(self):
+        """Test row_validation is capped while the summary counts every row"""
+        df = pd.DataFrame({
+            "id": [0, 1, 0, 2, 0],
+            "name": ["A", "B", None, "D", "E"],
+            "score": [50.0, 150.0, 50.0, 50.0, 50.0]
+        })
+        
+        report = self.schema.validate_dataframe(df, max_recorded_issues=2)
+        
+        assert len(report['row_validation']) == 2
+        assert report['row_validation_truncated'] == True
+        assert report['summary']['rows_with_errors'] == 4
+        assert report['summary']['rows_with_issues'] == 4
+        assert report['column_stats']['id']['error_count'] == 3
+        assert report['column_stats']['score']['error_count'] == 1
+        
+        # Streaming yields every row with issues
+        streamed = list(self.schema.iter_validate(df, chunk_size=2))
+        assert [entry['row_index'] for entry in streamed] == [0, 1, 2, 4]
+        assert streamed[:2] == report['row_validation']
+    
     def test_to_from_dict(self):
         """Test schema serialization/deserialization"""
         schema_dict = self.schema.to_dict()
@@ -309,6 +385,17 @@ class TestDataValidator:
         assert rule_result['passed'] == False
         assert 'exceed' in rule_result['message'].lower()
     
+    def test_validate_empty_data(self):
+        """Test empty data skips rules whose columns are missing"""
+        validator = DataValidator()
+        
+        report = validator.validate_with_schema('daily_health_metrics', pd.DataFrame())
+        
+        # Required columns are still missing, but no rule fails on them
+        assert report['is_valid'] == False
+        assert report['summary']['custom_rule_errors'] == 0
+        assert report['custom_rules']['duplicate_primary_key']['message'].startswith("Skipped")
+    
     def test_create_data_quality_report(self):
         """Test data quality report generation"""
         validator = DataValidator()
@@ -351,6 +438,9 @@ class TestDataValidator:
         
         # Grade should be one of A-F
         assert quality_report['quality_grade'] in ['A', 'B', 'C', 'D', 'F']
+        
+        # The caller's data is left unchanged
+        assert test_data['date'].tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
     
     def test_register_custom_rule(self):
         """Test registering custom validation rule"""